@@ -7,7 +7,7 @@ setup(
     name="tkcomponents",
     packages=[
         "tkcomponents", "tkcomponents.extensions", "tkcomponents.basiccomponents",
-        "tkcomponents.basiccomponents.classes"
+        "tkcomponents.basiccomponents.classes", "tkcomponents.extensions.classes", "tkcomponents.diagnostics"
     ],
     version="4.0.2",
     license="MIT",
@@ -28,6 +28,12 @@ def nested_button_cls():
 
             button.pack()
 
+        def _get_style_targets(self):
+            return {
+                **super()._get_style_targets(),
+                "button": [self.children["button"]]
+            }
+
     class Parent(Component):
         def __init__(self, container, get_data=None, on_change=lambda: None,
                      update_interval_ms=None, styles=None):
@@ -45,4 +51,10 @@ def nested_button_cls():
 
             button_wrapper.render().pack()
 
+        def _get_style_targets(self):
+            return {
+                **super()._get_style_targets(),
+                "button_wrapper": [self.children["button_wrapper"]]
+            }
+
     return Parent
@@ -0,0 +1,57 @@
+from tkcomponents.basiccomponents import AlertManager
+from tkcomponents.basiccomponents.classes.animationclock import AnimationClock
+
+
+class TestAlertManager:
+    def test_queueing(self, window):
+        manager = AlertManager(window, 1000, max_visible=2, max_queued=1)
+        manager.render().pack()
+
+        for message in ("a", "b", "c", "d"):
+            manager.push(message)
+        manager.push("a")
+        window.update()
+
+        assert manager._visible == ["a", "b"]
+        assert list(manager._queued) == ["d"]  # "c" is the oldest queued message, so it is discarded
+        assert manager._get_alert_text(manager._alerts["a"]) == "a (x2)"
+
+        manager._alerts["a"].expire()
+        window.update()
+
+        assert manager._visible == ["b", "d"]
+        assert not manager._queued
+
+    def test_no_queue(self, window):
+        manager = AlertManager(window, 1000, max_visible=1, max_queued=0)
+        manager.render().pack()
+
+        for message in ("a", "b", "c"):
+            manager.push(message)
+        window.update()
+
+        assert manager._visible == ["a"]
+        assert not manager._queued
+
+    def test_pooled_alerts(self, window):
+        clock = AnimationClock.for_widget(window)
+
+        manager = AlertManager(window, 1000)
+        manager.render().pack()
+
+        manager.push("a")
+        window.update()
+
+        alert = manager._alerts["a"]
+        progress_bar = alert.children["progress_bar"]
+        assert progress_bar._handle_clock_frame in clock._subscribers
+
+        alert.expire()
+        assert alert in manager._alert_pool
+        assert progress_bar._handle_clock_frame not in clock._subscribers
+
+        manager.push("b")
+        window.update()
+
+        assert manager._alerts["b"] is alert
+        assert progress_bar._handle_clock_frame in clock._subscribers
@@ -0,0 +1,66 @@
+from time import perf_counter
+from tkinter import Tcl
+
+from tkcomponents import Scheduler
+from tkcomponents.basiccomponents.classes.animationclock import AnimationClock
+
+
+def run_event_loop(interpreter, duration_ms):
+    end_time = perf_counter() + (duration_ms / 1000)
+
+    while perf_counter() < end_time:
+        interpreter.update()
+
+
+class TestAnimationClock:
+    def test_shared_frames(self):
+        interpreter = Tcl()
+        clock = AnimationClock.for_widget(interpreter)
+        assert AnimationClock.for_widget(interpreter) is clock
+
+        first_frames = []
+        second_frames = []
+        clock.subscribe(first_frames.append)
+        clock.subscribe(second_frames.append)
+        assert clock.is_running
+
+        run_event_loop(interpreter, 100)
+
+        assert first_frames
+        assert first_frames == second_frames
+
+    def test_pauses_without_subscribers(self):
+        interpreter = Tcl()
+        clock = AnimationClock.for_widget(interpreter)
+
+        frames = []
+
+        def handle_frame(now):
+            frames.append(now)
+            return len(frames) < 2
+
+        clock.subscribe(handle_frame)
+        run_event_loop(interpreter, 150)
+
+        assert len(frames) == 2
+        assert not clock.is_running
+
+    def test_subscribe_during_frame(self):
+        interpreter = Tcl()
+        clock = AnimationClock.for_widget(interpreter)
+        scheduler = Scheduler.for_widget(interpreter)
+
+        frames = []
+
+        def handle_frame(now):
+            frames.append(now)
+
+            # As done by a progress bar which re-renders during a frame
+            clock.unsubscribe(handle_frame)
+            clock.subscribe(handle_frame)
+
+        clock.subscribe(handle_frame)
+        run_event_loop(interpreter, 100)
+
+        assert frames
+        assert len([task for due_time, order, task in scheduler._queue if not task.is_cancelled]) == 1
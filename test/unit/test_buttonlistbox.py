@@ -0,0 +1,53 @@
+from time import perf_counter
+
+from tkcomponents.basiccomponents import ButtonListBox
+
+
+def run_event_loop(window, duration_ms):
+    end_time = perf_counter() + (duration_ms / 1000)
+
+    while perf_counter() < end_time:
+        window.update()
+
+
+class TestButtonListBox:
+    def test_progressive_render(self, window):
+        class SlowButtonListBox(ButtonListBox):
+            RENDER_SLICE_MS = 0  # Each slice renders a single button
+
+            def _render(self):
+                return super()._render()
+
+        completed = []
+        data = [{"value": value, "text": str(value)} for value in range(5)]
+
+        list_box = SlowButtonListBox(window, 0, lambda: 100, lambda list_box: data, is_rendered_progressively=True)
+        list_box.render(on_complete=completed.append).pack()
+        assert len(list_box.children["buttons"]) == 1
+
+        run_event_loop(window, 50)
+        assert completed == [list_box]
+        assert len(list_box.children["buttons"]) == 5
+        assert list_box.children["buttons"][0].cget("state") == "disabled"
+
+    def test_render(self, window):
+        data = [{"value": value, "text": str(value)} for value in range(5)]
+
+        list_box = ButtonListBox(window, 0, lambda: 100, lambda list_box: data)
+        list_box.render().pack()
+
+        assert len(list_box.children["buttons"]) == 5
+        assert list_box.children["buttons"][0].cget("state") == "disabled"
+
+    def test_restyle(self, window):
+        data = [{"value": 0, "text": "0"}, {"value": 1, "text": "1", "style": {"fg": "#ff0000"}}]
+
+        list_box = ButtonListBox(window, 0, lambda: 100, lambda list_box: data)
+        list_box.render().pack()
+        run_event_loop(window, 50)
+        buttons = dict(list_box.children["buttons"])
+
+        list_box.restyle({"button": {"fg": "#0000ff", "bg": "#ffffff"}, "button_selected": {"bg": "#00ff00"}})
+        assert list_box.children["buttons"] == buttons
+        assert buttons[0].cget("bg") == "#00ff00"
+        assert (buttons[1].cget("fg"), buttons[1].cget("bg")) == ("#ff0000", "#ffffff")
@@ -0,0 +1,48 @@
+from time import perf_counter
+from tkinter import Tcl
+
+from tkcomponents import Scheduler
+from tkcomponents.basiccomponents.classes.changebuffer import ChangeBuffer
+
+
+def run_event_loop(interpreter, duration_ms):
+    end_time = perf_counter() + (duration_ms / 1000)
+
+    while perf_counter() < end_time:
+        interpreter.update()
+
+
+class TestChangeBuffer:
+    def test_quiet_period(self):
+        interpreter = Tcl()
+        flushes = []
+
+        buffer = ChangeBuffer(interpreter, flushes.append, quiet_period_ms=20)
+        buffer.add("a", 1)
+        buffer.add("a", 2)
+        buffer.add("b", -1)
+
+        assert buffer.is_pending("a")
+        assert not buffer.is_empty
+        assert flushes == []
+
+        run_event_loop(interpreter, 50)
+
+        assert flushes == [{"a": 3, "b": -1}]
+        assert buffer.is_empty
+        assert Scheduler.for_widget(interpreter).stats["interaction"]["runs"] == 1
+
+    def test_flush(self):
+        interpreter = Tcl()
+        flushes = []
+
+        buffer = ChangeBuffer(interpreter, flushes.append, quiet_period_ms=1000)
+        buffer.add(None, 1)
+        buffer.flush()
+
+        assert flushes == [{None: 1}]
+
+        buffer.flush()
+        run_event_loop(interpreter, 20)
+
+        assert flushes == [{None: 1}]
@@ -0,0 +1,38 @@
+from datetime import datetime
+from time import perf_counter
+from tkinter import Tcl
+
+from tkcomponents.basiccomponents.classes.clockevents import ClockEvents
+
+
+def run_event_loop(interpreter, duration_ms):
+    end_time = perf_counter() + (duration_ms / 1000)
+
+    while perf_counter() < end_time:
+        interpreter.update()
+
+
+class TestClockEvents:
+    def test_next_boundary(self):
+        now = datetime(2024, 3, 9, 23, 59, 58, 500000).astimezone()
+
+        assert ClockEvents._get_next_boundary("second", now).time().isoformat() == "23:59:59"
+        assert ClockEvents._get_next_boundary("minute", now).time().isoformat() == "00:00:00"
+
+        next_midnight = ClockEvents._get_next_boundary("midnight", now)
+        assert (next_midnight.date().isoformat(), next_midnight.time().isoformat()) == ("2024-03-10", "00:00:00")
+
+    def test_subscribe(self):
+        interpreter = Tcl()
+        clock_events = ClockEvents.for_widget(interpreter)
+        assert ClockEvents.for_widget(interpreter) is clock_events
+
+        seconds = []
+        clock_events.subscribe("second", seconds.append)
+        run_event_loop(interpreter, 1100)
+
+        assert seconds
+        assert all(second.microsecond < 500000 for second in seconds)
+
+        clock_events.unsubscribe("second", seconds.append)
+        assert clock_events._wakeup__after_id is None
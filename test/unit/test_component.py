@@ -1,5 +1,6 @@
 import pytest
-from tkinter import Tk, Frame
+from time import perf_counter
+from tkinter import Tk, Frame, Label
 
 from tkcomponents import Component
 
@@ -199,3 +200,183 @@ class TestComponent:
         child = parent.children["button_wrapper"]
 
         assert child.width_clearance == width_clearance_pixels
+
+    def test_styles_identity(self, window, nested_button_cls):
+        parent = nested_button_cls(window, styles={"button_wrapper": {"button": {"bg": "red"}}})
+        styles = parent.styles
+        button_wrapper_styles = parent.styles["button_wrapper"]
+
+        parent.render().pack()
+        button_wrapper_styles["button"]["text"] = "Edited"
+        parent.render()
+
+        assert parent.styles is styles
+        assert parent.styles["button_wrapper"] is button_wrapper_styles
+        assert parent.children["button_wrapper"].children["button"].cget("text") == "Edited"
+
+    def test_restyle(self, window, nested_button_cls):
+        parent = nested_button_cls(window, styles={"button_wrapper": {"button": {"text": "Before"}}})
+        parent.render().pack()
+
+        child = parent.children["button_wrapper"]
+        button = child.children["button"]
+
+        parent.restyle({"button_wrapper": {"button": {"text": "After"}}})
+
+        assert child.exists
+        assert child.children["button"] is button
+        assert button.cget("text") == "After"
+
+        # Removed options cannot be reverted in place, so the child component is re-rendered
+        parent.restyle({"button_wrapper": {"button": {}}})
+
+        assert child.children["button"] is not button
+        assert child.children["button"].cget("text") == ""
+
+    def test_progressive_render(self, window):
+        class LabelList(Component):
+            RENDER_SLICE_MS = 0  # Each slice renders a single label
+
+            def _render(self):
+                self.children["labels"] = []
+
+                for label_index in range(5):
+                    self.children["labels"].append(Label(self._frame, text=str(label_index)))
+                    yield
+
+        completed = []
+
+        label_list = LabelList(window)
+        label_list.render(on_complete=completed.append)
+
+        assert len(label_list.children["labels"]) == 1
+        assert not completed
+
+        while not completed:
+            window.update()
+
+        assert len(label_list.children["labels"]) == 5
+        assert completed == [label_list]
+
+        # Rendering again part way through cancels the previous render
+        cancelled = []
+        label_list.render(on_complete=cancelled.append)
+        label_list.render(on_complete=completed.append)
+
+        while len(completed) < 2:
+            window.update()
+
+        assert not cancelled
+
+    def test_render_swap(self, window, nested_button_cls):
+        parent = nested_button_cls(window)
+        parent.render().pack()
+
+        old_frame = parent._frame
+        parent.render()
+
+        assert not old_frame.winfo_exists()
+        assert parent._frame.winfo_manager() == "grid"
+        assert parent._outer_frame.grid_propagate()
+
+        parent.is_outer_frame_propagating = False
+        parent.render()
+
+        assert not parent._outer_frame.grid_propagate()
+
+    def test_failed_render(self, window):
+        class FailingLabel(Component):
+            is_failing = False
+
+            def _render(self):
+                self.children["label"] = None
+
+                label = Label(self._frame, text="Label")
+                self.children["label"] = label
+                label.grid(row=0, column=0)
+
+                if self.is_failing:
+                    raise ValueError
+
+        component = FailingLabel(window)
+        component.render().pack()
+        old_frame = component._frame
+        old_label = component.children["label"]
+
+        component.is_failing = True
+        with pytest.raises(ValueError):
+            component.render()
+
+        assert component._frame is old_frame
+        assert component.children["label"] is old_label
+        assert list(component._outer_frame.children.values()) == [old_frame]
+        assert old_frame.winfo_manager() == "grid"
+        assert component._outer_frame.grid_propagate()
+
+    def test_layout_passes(self, window, nested_button_cls):
+        class Tracer:
+            def begin(self, component, name):
+                return None
+
+            def end(self, component, name, token):
+                pass
+
+        parent = nested_button_cls(window)
+        parent.render().pack()
+        window.update()
+
+        # Only counted while a tracer is added
+        assert parent.layout_passes == 0
+
+        tracer = Tracer()
+        Component.add_tracer(tracer)
+        try:
+            parent.render()
+            parent._outer_frame.configure(width=200)
+            window.update()
+
+            assert parent.layout_passes > 0
+        finally:
+            Component.remove_tracer(tracer)
+
+    def test_update_priority(self, window, nested_button_cls):
+        parent = nested_button_cls(window, update_interval_ms=20)
+        parent.render().pack()
+
+        # The first update is scheduled before the outer frame is mapped
+        assert parent._update_loop__task.priority == "visible"
+
+        window.update()
+        parent._outer_frame.pack_forget()
+        window.update()
+
+        # The pending update keeps its priority, and the loop is rescheduled with the new one when it runs
+        pending_task = parent._update_loop__task
+        end_time = perf_counter() + 0.5
+        while (parent._update_loop__task is pending_task) and (perf_counter() < end_time):
+            window.update()
+
+        assert parent._update_loop__task is not pending_task
+        assert parent._update_loop__task.priority == "background"
+
+    def test_get_data_assignment(self, window, nested_button_cls):
+        class Tracer:
+            def __init__(self):
+                self.names = []
+
+            def begin(self, component, name):
+                self.names.append(name)
+
+            def end(self, component, name, token):
+                pass
+
+        parent = nested_button_cls(window)
+        parent._get_data = lambda component: "data"
+
+        tracer = Tracer()
+        Component.add_tracer(tracer)
+        try:
+            assert parent._get_data(parent) == "data"
+            assert tracer.names == ["get_data"]
+        finally:
+            Component.remove_tracer(tracer)
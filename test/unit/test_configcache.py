@@ -0,0 +1,44 @@
+from tkinter import Label, StringVar
+
+from tkcomponents import Component
+from tkcomponents.extensions import ConfigCache
+
+
+class CachedComponent(Component.with_extensions(ConfigCache)):
+    def _render(self):
+        self.children["label"] = None
+
+        label = Label(self._frame, text="Label")
+        self.children["label"] = label
+        label.grid(row=0, column=0)
+
+
+class TestConfigCache:
+    def test_cached_configure(self, window):
+        component = CachedComponent(window)
+        component.render().pack()
+
+        label = Label(window)
+        component._cached_configure(label, text="Label", fg="#ff0000")
+        component._cached_configure(label, text="Label", fg="#ff0000")
+        component._cached_configure(label, text="Label", fg="#0000ff")
+
+        cache = component.extension_data["config_cache"]
+        assert (cache["calls_made"], cache["calls_skipped"]) == (2, 1)
+        assert label.cget("fg") == "#0000ff"
+
+        # Widgets are rebuilt on each render, so the cached options are discarded
+        component.render()
+        component._cached_configure(label, text="Label")
+        assert component.extension_data["config_cache"]["calls_made"] == 3
+
+    def test_cached_set(self, window):
+        component = CachedComponent(window)
+        variable = StringVar(window)
+
+        component._cached_set(variable, "Value")
+        component._cached_set(variable, "Value")
+
+        cache = component.extension_data["config_cache"]
+        assert (cache["calls_made"], cache["calls_skipped"]) == (1, 1)
+        assert variable.get() == "Value"
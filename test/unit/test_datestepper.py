@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+from tkcomponents.basiccomponents import DateStepper
+from tkcomponents.basiccomponents.classes.clockevents import ClockEvents
+
+
+class TestDateStepper:
+    def test_update_before_render(self, window):
+        stepper = DateStepper(window)
+        stepper.update()
+
+        stepper.render().pack()
+        assert stepper.children["forward_button"].cget("state") == "disabled"
+
+    def test_midnight_subscription(self, window):
+        clock_events = ClockEvents.for_widget(window)
+
+        stepper = DateStepper(window)
+        stepper.render().pack()
+        assert stepper._handle_midnight in clock_events._subscribers["midnight"]
+
+        stepper._outer_frame.destroy()
+        assert stepper._handle_midnight not in clock_events._subscribers["midnight"]
+
+    def test_suspend(self, window):
+        clock_events = ClockEvents.for_widget(window)
+
+        stepper = DateStepper(window)
+        stepper.render().pack()
+        stepper.offset = -2
+
+        stepper.suspend()
+        assert stepper._handle_midnight not in clock_events._subscribers["midnight"]
+
+        stepper._suspended__date -= timedelta(days=1)  # As if a midnight had passed while suspended
+        stepper.resume()
+        assert stepper._handle_midnight in clock_events._subscribers["midnight"]
+        assert stepper.offset == -1
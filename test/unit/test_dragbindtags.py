@@ -0,0 +1,42 @@
+from tkinter import Frame, Label
+
+from tkcomponents import Component
+from tkcomponents.extensions.classes.dragbindtags import DragBindtags
+
+
+class TestDragBindtags:
+    def test_get_tag(self, window):
+        bindtags = DragBindtags.for_widget(window)
+        component = Component(window)
+        presses = []
+
+        tag = bindtags.get_tag(component, lambda pressed_component, event: presses.append(pressed_component))
+        assert bindtags.get_tag(component, lambda pressed_component, event: None) == tag
+        assert bindtags.get_tag(Component(window), lambda pressed_component, event: None) != tag
+
+        label = Label(window, text="Label")
+        label.pack()
+        bindtags.add(label, tag)
+        assert label.bindtags()[0] == tag
+
+        window.update()
+        label.event_generate("<Button-1>")
+        assert presses == [component]
+
+    def test_recursive(self, window):
+        bindtags = DragBindtags.for_widget(window)
+        tag = bindtags.get_tag(Component(window), lambda pressed_component, event: None)
+
+        frame = Frame(window)
+        existing_label = Label(frame)
+        existing_label.pack()
+        frame.pack()
+
+        bindtags.add(frame, tag, is_recursive=True)
+        assert tag in existing_label.bindtags()
+
+        # Widgets created afterwards are tagged once mapped
+        new_label = Label(frame)
+        new_label.pack()
+        window.update()
+        assert tag in new_label.bindtags()
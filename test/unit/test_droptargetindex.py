@@ -0,0 +1,69 @@
+from tkinter import Toplevel, Frame
+
+from tkcomponents.extensions.classes.droptargetindex import DropTargetIndex
+
+
+class StubFrame:
+    def __init__(self, x, y, width, height, is_viewable=True):
+        self.rect = (x, y, width, height)
+        self.is_viewable = is_viewable
+
+    def winfo_exists(self):
+        return True
+
+    def winfo_viewable(self):
+        return self.is_viewable
+
+    def winfo_rootx(self):
+        return self.rect[0]
+
+    def winfo_rooty(self):
+        return self.rect[1]
+
+    def winfo_width(self):
+        return self.rect[2]
+
+    def winfo_height(self):
+        return self.rect[3]
+
+
+class StubTarget:
+    def __init__(self, frame):
+        self._frame = frame
+
+
+class TestDropTargetIndex:
+    def test_find_targets(self):
+        outer_target = StubTarget(StubFrame(0, 0, 100, 100))
+        inner_target = StubTarget(StubFrame(10, 10, 20, 20))
+        hidden_target = StubTarget(StubFrame(0, 0, 100, 100, is_viewable=False))
+
+        index = DropTargetIndex(None)
+        for target in (outer_target, inner_target, hidden_target):
+            index._targets.add(target)
+
+        assert index.find_targets(15, 15) == [inner_target, outer_target]
+        assert index.find_targets(50, 50) == [outer_target]
+        assert index.find_targets(100, 50) == []
+
+        # Rectangles are only re-measured once invalidated
+        inner_target._frame.rect = (40, 40, 20, 20)
+        assert index.find_targets(50, 50) == [outer_target]
+
+        index.invalidate()
+        assert index.find_targets(50, 50) == [inner_target, outer_target]
+
+    def test_destroyed_toplevel(self, window):
+        index = DropTargetIndex.for_widget(window)
+
+        toplevel = Toplevel(window, name="toplevel")
+        target = StubTarget(Frame(toplevel))
+        index.register(target)
+        assert ".toplevel" in index._bound_toplevels
+
+        toplevel.destroy()
+        assert ".toplevel" not in index._bound_toplevels
+
+        target = StubTarget(Frame(Toplevel(window, name="toplevel")))
+        index.register(target)
+        assert ".toplevel" in index._bound_toplevels
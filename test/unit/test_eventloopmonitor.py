@@ -0,0 +1,49 @@
+import json
+from time import sleep, perf_counter
+from tkinter import Tcl
+
+from tkcomponents.diagnostics import EventLoopMonitor
+
+
+def run_event_loop(interpreter, duration_ms):
+    end_time = perf_counter() + (duration_ms / 1000)
+
+    while perf_counter() < end_time:
+        interpreter.update()
+
+
+class TestEventLoopMonitor:
+    def test_lag(self, tmp_path):
+        interpreter = Tcl()
+        log_path = tmp_path / "monitor.jsonl"
+
+        monitor = EventLoopMonitor(interpreter, heartbeat_ms=10, slow_callback_ms=50, log_path=str(log_path))
+        monitor.start()
+
+        sleep(0.1)  # Blocks the event loop
+        run_event_loop(interpreter, 50)
+
+        monitor.stop()
+
+        lag_events = [event for event in monitor.events if event["type"] == "lag"]
+        assert lag_events
+        assert monitor.max_lag_ms >= 50
+
+        logged_events = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+        assert logged_events == list(monitor.events)
+
+    def test_blocked_sample(self):
+        interpreter = Tcl()
+
+        monitor = EventLoopMonitor(interpreter, heartbeat_ms=10, slow_callback_ms=20, sample_interval_ms=5)
+        monitor.start()
+
+        run_event_loop(interpreter, 20)
+        sleep(0.1)  # Blocks the event loop
+        run_event_loop(interpreter, 20)
+
+        monitor.stop()
+
+        samples = [event for event in monitor.events if event["type"] == "blocked_sample"]
+        assert samples
+        assert any("test_blocked_sample" in line for line in samples[0]["stack"])
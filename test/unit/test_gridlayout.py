@@ -0,0 +1,31 @@
+from tkcomponents.extensions import GridLayout
+
+
+class TestGridLayout:
+    def test_line(self):
+        horizontal = GridLayout.line(3, is_horizontal=True, stretch=(1,))
+        vertical = GridLayout.line(3, is_horizontal=False, stretch=(1,))
+
+        assert horizontal.cells == ((0, 0), (0, 1), (0, 2))
+        assert (horizontal.row_weights, horizontal.column_weights) == ({0: 1}, {1: 1})
+
+        assert vertical.cells == ((0, 0), (1, 0), (2, 0))
+        assert (vertical.row_weights, vertical.column_weights) == ({1: 1}, {0: 1})
+
+        assert GridLayout.line(3, is_horizontal=True, stretch=(1,)) is horizontal
+        assert GridLayout.line(3, is_horizontal=True, stretch=[1]) is horizontal
+
+    def test_script(self):
+        layout = GridLayout(
+            [(0, 0), (0, 2), (1, 1), (0, 2)],
+            row_weights={0: 1, 1: 1}, column_minsizes={1: 5}, sticky="we"
+        )
+        script = layout.script.format(".f", ".f.a", ".f.b", ".f.c", ".f.d")
+
+        assert script.split("\n") == [
+            "grid rowconfigure .f {0 1} -weight 1",
+            "grid columnconfigure .f {1} -minsize 5",
+            "grid .f.a x .f.b -row 0 -sticky {we}",
+            "grid x x .f.d -row 0 -sticky {we}",
+            "grid x .f.c -row 1 -sticky {we}"
+        ]
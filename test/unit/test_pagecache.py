@@ -0,0 +1,45 @@
+from tkcomponents.basiccomponents.classes.pagecache import PageCache
+
+
+class TestPageCache:
+    def test_get_range(self):
+        requests = []
+
+        def get_page(start, stop):
+            requests.append((start, stop))
+            return list(range(start, min(stop, 100)))
+
+        cache = PageCache(get_page, page_size=10, max_pages=2)
+
+        assert cache.get_range(5, 15) == list(range(5, 15))
+        assert requests == [(0, 10), (10, 20)]
+
+        assert cache.get_range(12, 14) == [12, 13]
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        # The least recently used page is evicted
+        cache.get_range(20, 21)
+        cache.get_range(0, 1)
+        assert requests[-2:] == [(20, 30), (0, 10)]
+
+    def test_prefetch(self):
+        cache = PageCache(lambda start, stop: list(range(start, stop)), page_size=10)
+
+        cache.prefetch(-5, 5)
+        assert (cache.hits, cache.misses) == (0, 0)
+
+        cache.get_range(0, 5)
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_revalidate(self):
+        source = list(range(30))
+        cache = PageCache(lambda start, stop: source[start:stop], page_size=10)
+
+        cache.get_range(0, 30)
+        assert not cache.revalidate(0, 10)
+        assert len(cache._pages) == 3
+
+        source[5] = -1
+        assert cache.revalidate(0, 10)
+        assert list(cache._pages) == [0]
+        assert cache.get_range(5, 6) == [-1]
@@ -0,0 +1,37 @@
+from tkcomponents.basiccomponents import ProgressBar
+
+
+class TestProgressBar:
+    def test_canvas_bar(self, window):
+        progress = 0.5
+
+        bar = ProgressBar(
+            window, get_data=lambda bar: progress, is_drawn_on_canvas=True,
+            styles={"width": 100, "height": 10, "filled_bar_frame": {"bg": "#00ff00"}}
+        )
+        bar.render().pack()
+
+        canvas = bar.children["canvas"]
+        assert canvas.coords("filled_bar") == [0, 0, 50, 10]
+
+        progress = 0.504  # Does not change the filled width in pixels
+        bar.update()
+        assert bar._canvas_filled_width == 50
+
+        progress = 0.75
+        bar.update()
+        assert canvas.coords("filled_bar") == [0, 0, 75, 10]
+
+    def test_max_fps(self, window):
+        bar = ProgressBar(window, get_data=lambda bar: 0, max_fps=20, update_interval_ms=15)
+
+        assert bar._update_interval_ms == 50
+
+    def test_restyle(self, window):
+        bar = ProgressBar(window, get_data=lambda bar: 0.5, styles={"filled_bar_frame": {"bg": "#00ff00"}})
+        bar.render().pack()
+        filled_bar_frame = bar.children["filled_bar_frame"]
+
+        bar.restyle({"filled_bar_frame": {"bg": "#0000ff"}})
+        assert bar.children["filled_bar_frame"] is filled_bar_frame
+        assert filled_bar_frame.cget("bg") == "#0000ff"
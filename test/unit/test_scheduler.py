@@ -0,0 +1,83 @@
+import pytest
+from tkinter import Tcl
+
+from tkcomponents import scheduler as scheduler_module
+from tkcomponents import Scheduler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    class FakeClock:
+        def __init__(self):
+            self.now = 1000.0
+
+        def advance(self, ms):
+            self.now += ms / 1000
+
+    fake_clock = FakeClock()
+    monkeypatch.setattr(scheduler_module, "monotonic", lambda: fake_clock.now)
+
+    return fake_clock
+
+
+@pytest.fixture
+def interpreter():
+    return Tcl()
+
+
+class TestScheduler:
+    def test_priority_order(self, clock, interpreter):
+        scheduler = Scheduler(interpreter)
+        runs = []
+
+        def create_task(name):
+            def task():
+                runs.append(name)
+                clock.advance(5)
+            return task
+
+        scheduler.schedule(create_task("background"), priority="background")
+        scheduler.schedule(create_task("visible"), priority="visible")
+        scheduler.schedule(create_task("interaction"), priority="interaction")
+
+        scheduler._handle_tick()
+
+        # Background work does not fit in the remaining budget, so is deferred
+        assert runs == ["interaction", "visible"]
+        assert scheduler.stats["background"]["deferrals"] == 1
+
+        scheduler._handle_tick()
+
+        assert runs == ["interaction", "visible", "background"]
+        assert scheduler.stats["background"]["runs"] == 1
+        assert scheduler.mean_latency_ms["background"] == pytest.approx(10)
+
+    def test_starved_work_runs(self, clock, interpreter):
+        scheduler = Scheduler(interpreter)
+        runs = []
+
+        def slow_task():
+            runs.append("slow")
+            clock.advance(Scheduler.FRAME_BUDGET_MS)
+
+        scheduler.schedule(slow_task, priority="visible")
+        scheduler.schedule(lambda: runs.append("background"), priority="background")
+
+        scheduler._handle_tick()
+        assert runs == ["slow"]
+
+        clock.advance(Scheduler.MAX_DEFERRAL_MS)
+        scheduler.schedule(slow_task, priority="visible")
+        scheduler._handle_tick()
+
+        assert runs == ["slow", "slow", "background"]
+
+    def test_cancel(self, clock, interpreter):
+        scheduler = Scheduler(interpreter)
+        runs = []
+
+        task = scheduler.schedule(lambda: runs.append("cancelled"))
+        scheduler.cancel(task)
+        scheduler._handle_tick()
+
+        assert not runs
@@ -0,0 +1,40 @@
+from tkcomponents.basiccomponents import StepperTable
+
+
+class TestStepperTable:
+    def test_bulk_data(self, window):
+        source = {("a", 1): 0, ("b", 1): 5}
+        read_count = 0
+
+        def get_bulk_data(table):
+            nonlocal read_count
+            read_count += 1
+
+            return dict(source)
+
+        table = StepperTable(
+            window, axis_labels=(("A", "B"), ("1",)), axis_values=(("a", "b"), (1,)), get_bulk_data=get_bulk_data
+        )
+        assert read_count == 0
+
+        table.render().pack()
+        assert read_count == 1
+        assert table.children["steppers"][(1, 0)].value == 5
+
+        assert table._load_bulk_data() == []
+
+        # A new cell is reported as changed even when its value matches the default
+        source[("c", 1)] = 0
+        source[("b", 1)] = 6
+        assert sorted(table._load_bulk_data()) == [("b", 1), ("c", 1)]
+
+        source[("b", 1)] = 7
+        table.update()
+        assert table.children["steppers"][(1, 0)].value == 7
+
+    def test_batched_render(self, window):
+        table = StepperTable(window, axis_labels=(("A", "B"), ("1", "2")), axis_values=((0, 1), (0, 1)))
+        table.render().pack()
+
+        # The nested steppers are rendered without querying Tcl, so the whole table is evaluated in one flush
+        assert table.extension_data["render_transactions"]["flushes"] == 1
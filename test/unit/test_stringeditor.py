@@ -0,0 +1,84 @@
+import pytest
+from time import perf_counter
+
+from tkcomponents.basiccomponents import StringEditor
+
+
+def run_event_loop(window, duration_ms):
+    end_time = perf_counter() + (duration_ms / 1000)
+
+    while perf_counter() < end_time:
+        window.update()
+
+
+class TestStringEditor:
+    def test_source_reads(self, window):
+        source = {"value": "a"}
+        read_count = 0
+
+        def get_data(editor):
+            nonlocal read_count
+            read_count += 1
+
+            return source["value"]
+
+        def on_change(editor, old_value):
+            source["value"] = editor.value
+
+        editor = StringEditor(window, get_data=get_data, on_change=on_change)
+        editor.render().pack()
+        assert read_count == 1
+
+        for value in ("ab", "abc", "abcd"):
+            editor._value__var.set(value)
+
+        assert read_count == 1
+        assert source["value"] == "abcd"
+        assert editor.is_unsaved  # Until the source is re-read
+
+        editor.update()
+        assert read_count == 2
+        assert not editor.is_unsaved
+
+    def test_unsaved_source(self, window):
+        editor = StringEditor(window, get_data=lambda editor: "a")
+        editor.render().pack()
+
+        # The edit is never written to the source, so remains unsaved
+        editor._value__var.set("ab")
+        editor.update()
+        assert editor.is_unsaved
+
+    def test_debounce(self, window):
+        changes = []
+
+        editor = StringEditor(window, on_change=lambda editor, old_value: changes.append(old_value), debounce_ms=30)
+        editor.render().pack()
+
+        for value in ("a", "ab", "abc"):
+            editor._value__var.set(value)
+        assert changes == []
+
+        run_event_loop(window, 80)
+        assert changes == [""]
+        assert editor.value == "abc"
+
+    def test_debounce_and_throttle(self, window):
+        with pytest.raises(ValueError):
+            StringEditor(window, debounce_ms=10, throttle_ms=10)
+
+    def test_restyle(self, window):
+        editor = StringEditor(
+            window, get_data=lambda editor: "a", debounce_ms=1000,
+            styles={"entry": {"width": 10}, "entry_saved": {"bg": "#ffffff"}, "entry_unsaved": {"bg": "#ff0000"}}
+        )
+        editor.render().pack()
+        entry = editor.children["entry"]
+
+        editor.restyle({"entry": {"width": 20}, "entry_unsaved": {"bg": "#00ff00"}})
+        assert editor.children["entry"] is entry
+        assert entry.cget("width") == 20
+        assert entry.cget("bg") == "#ffffff"
+
+        editor._value__var.set("ab")
+        assert entry.cget("bg") == "#00ff00"
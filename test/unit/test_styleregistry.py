@@ -0,0 +1,34 @@
+from tkcomponents import StyleRegistry
+
+
+class TestStyleRegistry:
+    def test_compile(self, window):
+        registry = StyleRegistry.for_widget(window)
+
+        styles = registry.compile({
+            "label": {"font": ("Arial", 12), "background": "red", "text": "Label"},
+            "nested": {"button": {"font": ("Arial", 12), "bg": "#f00"}}
+        })
+
+        assert styles["label"]["font"] == styles["nested"]["button"]["font"]
+        assert styles["label"]["background"] == styles["nested"]["button"]["bg"] == "#ff0000"
+        assert styles["label"]["text"] == "Label"
+
+        assert registry.stats["font_misses"] == 1
+        assert registry.stats["font_hits"] == 1
+
+        assert registry.compile(styles) == styles
+        assert registry.stats["font_misses"] == 1
+
+    def test_compile_in_place(self, window):
+        registry = StyleRegistry.for_widget(window)
+
+        label_styles = {"background": "red", "text": "Label"}
+        styles = {"label": label_styles}
+        registry.compile_in_place(styles)
+
+        assert styles["label"] is label_styles
+        assert label_styles == {"background": "#ff0000", "text": "Label"}
+
+    def test_for_widget(self, window):
+        assert StyleRegistry.for_widget(window) is StyleRegistry.for_widget(window)
@@ -0,0 +1,38 @@
+from tkinter import Label
+
+from tkcomponents.basiccomponents import TabbedPages, TimedFrame
+
+
+class LabelFrame(TimedFrame):
+    def _render(self):
+        self.children["label"] = None
+
+        label = Label(self._frame, text="Label")
+        self.children["label"] = label
+        label.grid(row=0, column=0)
+
+
+class TestTabbedPages:
+    def test_suspend_pages(self, window):
+        tabs = TabbedPages(window, pages=(
+            ("Timed", lambda container: LabelFrame(container, 10000, update_interval_ms=20)),
+            ("Other", lambda container: LabelFrame(container, 10000))
+        ))
+        tabs.render().pack()
+
+        timed_page = tabs.active_page
+        progress_bar = timed_page.children["progress_bar"]
+        assert progress_bar._handle_clock_frame in progress_bar.clock._subscribers
+
+        tabs._handle_click(1)
+        assert timed_page.is_suspended
+        assert progress_bar.is_suspended
+        assert timed_page._update_loop__task is None
+        assert progress_bar._handle_clock_frame not in progress_bar.clock._subscribers
+        assert not timed_page.is_countdown_paused  # Suspending only stops the page's updates
+
+        tabs._handle_click(0)
+        assert not timed_page.is_suspended
+        assert not progress_bar.is_suspended
+        assert timed_page._update_loop__task is not None
+        assert progress_bar._handle_clock_frame in progress_bar.clock._subscribers
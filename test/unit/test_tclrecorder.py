@@ -0,0 +1,70 @@
+from tkinter import Tcl
+
+from tkcomponents.extensions.classes.tclrecorder import TclRecorder
+
+
+class StubInterpreter:
+    def __init__(self):
+        self.calls = []
+
+    def call(self, *args):
+        self.calls.append(args)
+        return "result"
+
+
+class TestTclRecorder:
+    def test_write_only_commands(self):
+        interpreter = StubInterpreter()
+        recorder = TclRecorder(interpreter)
+
+        write_only_commands = (
+            ("button", ".f.b", "-text", "Text"),
+            (".f.b", "configure", "-text", "Text"),
+            ("grid", ".f.b", "-row", 0),
+            ("grid", "remove", ".f.b"),
+            ("grid", "propagate", ".f", 0),
+            ("grid", "columnconfigure", ".f", 0, "-weight", 1),
+            ("bind", ".f.b", "<Button-1>", "command"),
+            ("bindtags", ".f.b", ("tag",)),
+            ("destroy", ".f.b")
+        )
+        for command in write_only_commands:
+            assert recorder.call(*command) == ""
+
+        assert interpreter.calls == []
+        assert recorder.commands_recorded == len(write_only_commands)
+
+    def test_queries(self):
+        interpreter = StubInterpreter()
+        recorder = TclRecorder(interpreter)
+
+        queries = (
+            (".f.b", "configure", "-text"),
+            ("grid", "propagate", ".f"),
+            ("grid", "columnconfigure", ".f", 0, "-weight"),
+            ("bind", ".f.b", "<Button-1>"),
+            ("winfo", "width", ".f.b")
+        )
+        for command in queries:
+            recorder.record("destroy", ".f.old")
+
+            assert recorder.call(*command) == "result"
+            assert interpreter.calls[-2][0] == "apply"  # Recorded commands are flushed first
+            assert interpreter.calls[-1] == command
+
+        assert recorder.flushes == len(queries)
+
+    def test_flush(self):
+        interpreter = Tcl()
+        recorder = TclRecorder(interpreter.tk)
+
+        recorder.record("set", "first", 1)
+        recorder.record("set", "second", 2)
+        assert interpreter.tk.call("info", "exists", "first") == 0
+
+        assert recorder.call("expr", "$first + $second") == 3
+        assert recorder.flushes == 1
+
+        recorder.stop()
+        recorder.record("set", "third", 3)
+        assert interpreter.tk.call("set", "third") == 3
@@ -0,0 +1,67 @@
+from tkcomponents.basiccomponents import TextCarousel
+
+
+class TestTextCarousel:
+    def test_paged_updates(self, window):
+        source = [str(value) for value in range(100)]
+        requests = []
+
+        def get_page(carousel, start, stop):
+            requests.append((start, stop))
+            return source[start:stop]
+
+        carousel = TextCarousel(
+            window, get_page=get_page, get_count=lambda carousel: len(source), amount_to_display=2, page_size=10
+        )
+        carousel.render().pack()
+        window.update()  # Runs the prefetch
+
+        request_count = len(requests)
+        carousel.update()
+        window.update()
+
+        # Only the displayed page is reloaded to check for changes
+        assert len(requests) == request_count + 1
+
+        source[0] = "changed"
+        carousel.update()
+
+        assert carousel._displayed_text__vars[0].get() == "changed"
+
+    def test_versioned_updates(self, window):
+        source = [str(value) for value in range(100)]
+        version = 0
+        requests = []
+
+        def get_page(carousel, start, stop):
+            requests.append((start, stop))
+            return source[start:stop]
+
+        carousel = TextCarousel(
+            window, get_page=get_page, get_count=lambda carousel: len(source),
+            get_version=lambda carousel: version, page_size=10
+        )
+        carousel.render().pack()
+        window.update()
+
+        request_count = len(requests)
+        carousel.update()
+        window.update()
+        assert len(requests) == request_count
+
+        source[0] = "changed"
+        version += 1
+        carousel.update()
+
+        assert carousel._displayed_text__vars[0].get() == "changed"
+
+    def test_prefetch_after_destroy(self, window):
+        carousel = TextCarousel(
+            window, get_page=lambda carousel, start, stop: [], get_count=lambda carousel: 0
+        )
+        carousel.render().pack()
+
+        carousel._outer_frame.destroy()
+        assert carousel._prefetch__after_id is None
+
+        window.update()
@@ -0,0 +1,79 @@
+import pytest
+
+from tkcomponents.basiccomponents import TextEditor
+from tkcomponents.basiccomponents import texteditor as texteditor_module
+
+
+class TestTextEditor:
+    def test_chunked_loading(self, window, tmp_path):
+        file_path = tmp_path / "file.txt"
+        file_path.write_bytes(b"line\n" * 100)
+
+        editor = TextEditor(window, get_data=lambda editor: str(file_path), chunk_size=50)
+        editor.render().pack()
+
+        assert not editor.is_fully_loaded
+        assert editor.children["text"].get("1.0", "end-1c") == "line\n" * 10
+
+        editor.save()
+        assert file_path.read_bytes() == b"line\n" * 100
+
+    def test_invalid_bytes(self, window, tmp_path):
+        file_path = tmp_path / "file.txt"
+        file_path.write_bytes(b"valid\n\xff\xfe invalid\n")
+
+        editor = TextEditor(window, get_data=lambda editor: str(file_path))
+        editor.render().pack()
+
+        editor.children["text"].insert("1.0", "edited ")
+        editor.save()
+
+        assert file_path.read_bytes() == b"edited valid\n\xff\xfe invalid\n"
+
+    def test_save_as(self, window, tmp_path):
+        file_path = tmp_path / "file.txt"
+        file_path.write_bytes(b"text\n")
+        other_file_path = tmp_path / "other.txt"
+
+        editor = TextEditor(window, get_data=lambda editor: str(file_path))
+        editor.render().pack()
+
+        editor.children["text"].insert("1.0", "edited ")
+        editor.save(str(other_file_path))
+        editor.update()
+
+        assert editor.path == str(other_file_path)
+        assert editor.children["text"].get("1.0", "end-1c") == "edited text\n"
+        assert file_path.read_bytes() == b"text\n"
+
+    def test_render_on_complete(self, window, tmp_path):
+        file_path = tmp_path / "file.txt"
+        file_path.write_bytes(b"text\n")
+        completed = []
+
+        editor = TextEditor(window, get_data=lambda editor: str(file_path))
+        editor.render(on_complete=completed.append).pack()
+
+        assert completed == [editor]
+
+    def test_failed_replace(self, window, tmp_path, monkeypatch):
+        file_path = tmp_path / "file.txt"
+        file_path.write_bytes(b"line\n" * 100)
+
+        editor = TextEditor(window, get_data=lambda editor: str(file_path), chunk_size=50)
+        editor.render().pack()
+
+        def fail_replace(source_path, target_path):
+            raise OSError
+
+        with monkeypatch.context() as patch:
+            patch.setattr(texteditor_module, "replace", fail_replace)
+
+            with pytest.raises(OSError):
+                editor.save()
+
+        assert not editor.is_fully_loaded
+        assert list(tmp_path.iterdir()) == [file_path]
+
+        editor.save()
+        assert file_path.read_bytes() == b"line\n" * 100
@@ -0,0 +1,60 @@
+from time import perf_counter
+from tkinter import Label
+
+from tkcomponents.basiccomponents import TimedFrame
+
+
+class LabelFrame(TimedFrame):
+    def _render(self):
+        self.children["label"] = None
+
+        label = Label(self._frame, text="Label")
+        self.children["label"] = label
+        label.grid(row=0, column=0)
+
+
+def run_event_loop(window, duration_ms):
+    end_time = perf_counter() + (duration_ms / 1000)
+
+    while perf_counter() < end_time:
+        window.update()
+
+
+class TestTimedFrame:
+    def test_expiry(self, window):
+        expired_frames = []
+
+        timed_frame = LabelFrame(window, 50, on_expire=expired_frames.append)
+        timed_frame.render().pack()
+
+        run_event_loop(window, 20)
+        assert not timed_frame.is_expired
+
+        run_event_loop(window, 80)
+        assert timed_frame.is_expired
+        assert expired_frames == [timed_frame]
+
+    def test_extend(self, window):
+        timed_frame = LabelFrame(window, 50)
+        timed_frame.render().pack()
+
+        timed_frame.extend(100)
+        assert timed_frame.duration_ms == 150
+
+        run_event_loop(window, 80)
+        assert not timed_frame.is_expired
+
+        run_event_loop(window, 120)
+        assert timed_frame.is_expired
+
+    def test_pause(self, window):
+        timed_frame = LabelFrame(window, 50)
+        timed_frame.render().pack()
+
+        timed_frame.pause_countdown()
+        run_event_loop(window, 100)
+        assert not timed_frame.is_expired
+
+        timed_frame.resume_countdown()
+        run_event_loop(window, 100)
+        assert timed_frame.is_expired
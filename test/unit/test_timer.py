@@ -0,0 +1,103 @@
+import pytest
+from datetime import timedelta
+
+from tkcomponents.basiccomponents.classes import timer as timer_module
+from tkcomponents.basiccomponents.classes.timer import Timer
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    class FakeClock:
+        def __init__(self):
+            self.monotonic_ns = 0
+            self.time_ns = 1_700_000_000 * (10 ** 9)
+
+        def advance(self, seconds):
+            self.monotonic_ns += int(seconds * (10 ** 9))
+            self.time_ns += int(seconds * (10 ** 9))
+
+    fake_clock = FakeClock()
+    monkeypatch.setattr(timer_module, "monotonic_ns", lambda: fake_clock.monotonic_ns)
+    monkeypatch.setattr(timer_module, "time_ns", lambda: fake_clock.time_ns)
+
+    return fake_clock
+
+
+class TestTimer:
+    def test_time_elapsed(self, clock):
+        timer = Timer()
+
+        assert not timer.is_running
+        assert timer.time_elapsed == timedelta(0)
+
+        timer.start()
+        clock.advance(5)
+        timer.stop()
+        clock.advance(100)  # Time passing while the timer is stopped should not count
+
+        assert timer.time_elapsed == timedelta(seconds=5)
+
+        timer.start()
+        clock.advance(2)
+
+        assert timer.is_running
+        assert timer.time_elapsed == timedelta(seconds=7)
+        assert timer.elapsed_string == "00:00:07"
+
+        timer.reset()
+
+        assert not timer.is_running
+        assert timer.time_elapsed == timedelta(0)
+
+    def test_laps(self, clock):
+        timer = Timer()
+        timer.start()
+
+        clock.advance(3)
+        assert timer.lap() == timedelta(seconds=3)
+        clock.advance(4)
+        assert timer.lap() == timedelta(seconds=4)
+
+        assert timer.splits == [timedelta(seconds=3), timedelta(seconds=7)]
+        assert timer.laps == [timedelta(seconds=3), timedelta(seconds=4)]
+
+    def test_history(self, clock):
+        assert Timer().history is None
+
+        timer = Timer(is_history_kept=True)
+        timer.start()
+        clock.advance(1)
+        timer.stop()
+        clock.advance(1)
+        timer.start()
+
+        history = timer.history
+
+        assert len(history) == 2
+        assert history[0][1] - history[0][0] == timedelta(seconds=1)
+        assert history[1][1] is None
+
+    def test_snapshot(self, clock):
+        timer = Timer(is_history_kept=True)
+        timer.start()
+        clock.advance(10)
+        timer.lap()
+
+        snapshot = timer.snapshot()
+        clock.advance(5)  # A running timer should count time passed between the snapshot and its restoration
+
+        restored_timer = Timer.from_snapshot(snapshot)
+
+        assert restored_timer.is_running
+        assert restored_timer.time_elapsed == timedelta(seconds=15)
+        assert restored_timer.splits == timer.splits
+        assert restored_timer.history == timer.history
+
+        timer.stop()
+        snapshot = timer.snapshot()
+        clock.advance(5)
+
+        restored_timer.restore(snapshot)
+
+        assert not restored_timer.is_running
+        assert restored_timer.time_elapsed == timedelta(seconds=15)
@@ -0,0 +1,18 @@
+from tkcomponents.basiccomponents import TimerControl
+from tkcomponents.basiccomponents.classes.timer import Timer
+
+
+class TestTimerControl:
+    def test_suspend(self, window):
+        timer = Timer()
+        timer.start()
+
+        timer_control = TimerControl(window, get_data=lambda timer_control: timer)
+        timer_control.render().pack()
+        assert timer_control._tick__after_id is not None
+
+        timer_control.suspend()
+        assert timer_control._tick__after_id is None
+
+        timer_control.resume()
+        assert timer_control._tick__after_id is not None
@@ -0,0 +1,65 @@
+import json
+from time import sleep, perf_counter
+from tkinter import Tcl
+
+from tkcomponents.diagnostics import TraceRecorder
+
+
+class TracedComponent:
+    def __init__(self, path):
+        self._outer_frame = path
+
+
+def run_event_loop(interpreter, duration_ms):
+    end_time = perf_counter() + (duration_ms / 1000)
+
+    while perf_counter() < end_time:
+        interpreter.update()
+
+
+class TestTraceRecorder:
+    def test_nested_spans(self, tmp_path):
+        interpreter = Tcl()
+        table = TracedComponent(".!frame")
+        stepper = TracedComponent(".!frame.!frame")
+
+        recorder = TraceRecorder(interpreter)
+        recorder.start()
+
+        table_token = recorder.begin(table, "render")
+        stepper_token = recorder.begin(stepper, "render")
+        sleep(0.001)
+        recorder.end(stepper, "render", stepper_token)
+        recorder.end(table, "render", table_token)
+
+        recorder.stop()
+
+        trace_path = tmp_path / "trace.json"
+        recorder.save(str(trace_path))
+        stepper_event, table_event = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+
+        assert (stepper_event["cat"], stepper_event["args"]["component"]) == ("TracedComponent", ".!frame.!frame")
+        assert table_event["ph"] == stepper_event["ph"] == "X"
+        assert table_event["ts"] <= stepper_event["ts"]
+        assert (stepper_event["ts"] + stepper_event["dur"]) <= (table_event["ts"] + table_event["dur"])
+        assert stepper_event["dur"] >= 1000
+
+    def test_time_window(self):
+        interpreter = Tcl()
+
+        recorder = TraceRecorder(interpreter)
+        recorder.start(duration_ms=20)
+        assert recorder.is_running
+
+        run_event_loop(interpreter, 50)
+        assert not recorder.is_running
+
+    def test_buffer_size(self):
+        interpreter = Tcl()
+        component = TracedComponent(".!frame")
+
+        recorder = TraceRecorder(interpreter, buffer_size=2)
+        for name in ("_refresh_frame", "_render", "render"):
+            recorder.end(component, name, recorder.begin(component, name))
+
+        assert [event["name"] for event in recorder.get_trace()["traceEvents"]] == ["_render", "render"]
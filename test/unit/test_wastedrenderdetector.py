@@ -0,0 +1,37 @@
+from tkcomponents.diagnostics import WastedRenderDetector
+
+
+class TestWastedRenderDetector:
+    def test_wasted_render(self, window, nested_button_cls):
+        wasted_renders = []
+
+        detector = WastedRenderDetector(on_wasted_render=lambda component, duration_ms: wasted_renders.append(component))
+        detector.start()
+
+        parent = nested_button_cls(window, styles={"button_wrapper": {"button": {"text": "Before"}}})
+        parent.render().pack()
+        parent.render()
+
+        parent.styles["button_wrapper"] = {"button": {"text": "After"}}
+        parent.render()
+
+        detector.stop()
+
+        assert wasted_renders == [parent]
+
+        parent_key = f"{type(parent).__name__} {parent._outer_frame}"
+        component_key, renders, wasted_render_count, wasted_ms = detector.get_report()[0]
+        assert (component_key, renders, wasted_render_count) == (parent_key, 3, 1)
+        assert wasted_ms >= 0
+
+    def test_fingerprint(self, window, nested_button_cls):
+        first_parent = nested_button_cls(window)
+        second_parent = nested_button_cls(window)
+
+        first_parent.render().pack()
+        second_parent.render().pack()
+
+        assert (
+            WastedRenderDetector.get_fingerprint(first_parent._outer_frame) ==
+            WastedRenderDetector.get_fingerprint(second_parent._outer_frame)
+        )
@@ -1 +1,3 @@
 from .component import Component
+from .styleregistry import StyleRegistry
+from .scheduler import Scheduler
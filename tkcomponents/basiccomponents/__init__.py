@@ -8,8 +8,11 @@ from .buttonlistbox import ButtonListBox
 from .steppertable import StepperTable
 from .progressbar import ProgressBar
 from .alert import Alert
+from .alertmanager import AlertManager
 from .stringeditor import StringEditor
+from .texteditor import TextEditor
 from .labelwrapper import LabelWrapper
+from .tabbedpages import TabbedPages
 
 from .timedframe import TimedFrame
 from .scrollframe import ScrollFrame
@@ -1,14 +1,20 @@
 from tkinter import StringVar, Label, Button
 
-from ..extensions import GridHelper
+from ..extensions import GridHelper, ConfigCache
 from .timedframe import TimedFrame
 from .constants import Constants
 
 
-class Alert(TimedFrame.with_extensions(GridHelper)):
-    def __init__(self, container, duration, get_data, on_expire=lambda alert: None, update_interval_ms=None, styles=None):
-        super().__init__(container, duration, on_expire=on_expire, get_data=get_data,
-                         update_interval_ms=update_interval_ms, styles=styles)
+class Alert(TimedFrame.with_extensions(GridHelper, ConfigCache)):
+    def __init__(self, container, duration, get_data, on_expire=lambda alert: None, is_paused_on_hover=False,
+                 is_expiry_scheduled=True, update_interval_ms=None, styles=None):
+        super().__init__(container, duration, on_expire=on_expire, is_expiry_scheduled=is_expiry_scheduled,
+                         get_data=get_data, update_interval_ms=update_interval_ms, styles=styles)
+
+        # The countdown to expiry can be held while the user has their cursor over the alert
+        if is_paused_on_hover:
+            self._outer_frame.bind("<Enter>", lambda event: self.pause_countdown())
+            self._outer_frame.bind("<Leave>", self._handle_leave)
 
         styles = styles or {}
         self.styles["label"] = styles.get("label", {})
@@ -21,13 +27,17 @@ class Alert(TimedFrame.with_extensions(GridHelper)):
 
     def _update(self):
         self.value = self._get_data(self)
-        self._value__var.set(self.value)
+        self._cached_set(self._value__var, self.value)
 
-    def _render(self):
-        def command__button():
-            self.children["progress_bar"].is_expired = True
-            self._on_expire(self)
+    def _handle_leave(self, event):
+        # Moving the cursor onto a child widget also counts as leaving the outer frame
+        hovered_widget = self._outer_frame.winfo_containing(event.x_root, event.y_root)
+        if hovered_widget and f"{hovered_widget}.".startswith(f"{self._outer_frame}."):
+            return
 
+        self.resume_countdown()
+
+    def _render(self):
         self.children["label"] = None
         self.children["button"] = None
 
@@ -36,8 +46,15 @@ class Alert(TimedFrame.with_extensions(GridHelper)):
         label = Label(self._frame, textvariable=self._value__var, **self.styles["label"])
         self.children["label"] = label
 
-        button = Button(self._frame, text=Constants.SYMBOLS["cancel"], command=command__button, **self.styles["button"])
+        button = Button(self._frame, text=Constants.SYMBOLS["cancel"], command=self.expire, **self.styles["button"])
         self.children["button"] = button
 
         label.grid(row=0, column=0, sticky="nswe")
         button.grid(row=0, column=1, sticky="nswe")
+
+    def _get_style_targets(self):
+        return {
+            **super()._get_style_targets(),
+            "label": [self.children["label"]],
+            "button": [self.children["button"]]
+        }
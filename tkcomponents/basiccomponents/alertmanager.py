@@ -0,0 +1,198 @@
+from collections import deque
+from typing import Callable, Optional
+
+from ..component import Component
+from .alert import Alert
+
+
+class AlertManager(Component):
+    def __init__(
+        self, container, duration_ms,
+        max_visible: int = 5, max_queued: int = 100, expiry_batch_ms: int = 100,
+        format_text: Callable[[str, int], str] = (lambda message, count: message if count == 1 else f"{message} (x{count})"),
+        styles=None
+    ):
+        super().__init__(container, styles=styles)
+
+        """
+        Alerts are displayed in the order their messages were first pushed, up to `max_visible` at a time.
+        Any further messages wait in a queue (the oldest being discarded beyond `max_queued`)
+        until a visible alert expires. If `max_queued` is 0, further messages are discarded instead.
+        Pushing a message which is already visible or queued increments its counter rather than adding a new alert.
+
+        Expired alerts are hidden and pooled for reuse rather than destroyed,
+        and are all expired together off a single timer, grouped into batches `expiry_batch_ms` wide
+        """
+        self.duration_ms = duration_ms
+        self.max_visible = max_visible
+        self.max_queued = max_queued
+        self.expiry_batch_ms = expiry_batch_ms
+        self.format_text = format_text
+
+        styles = styles or {}
+        self.styles["alert"] = styles.get("alert", {})
+
+        self._counts = {}  # Holds the current count for every visible or queued message
+        self._visible = []  # Messages currently displayed, in display order
+        self._queued = deque()
+        self._changed = set()  # Visible messages which have been pushed again since the last flush
+
+        self._alerts = {}  # Visible message -> the Alert displaying it
+        self._alert_messages = {}  # Alert -> the visible message it is displaying
+        self._alert_pool = []
+        self._alert_frames = {}  # Alert -> the frame returned when it was rendered
+
+        self._flush__after_id: Optional[str] = None
+        self._expiry__after_id: Optional[str] = None
+
+    def push(self, message: str) -> None:
+        """
+        Queues a message to be displayed.
+        No widgets are touched by this method; all pending messages are displayed together once the event loop is idle,
+        so it is safe to call at a high rate
+        """
+
+        if message in self._counts:
+            self._counts[message] += 1
+            self._changed.add(message)
+        else:
+            # Messages which will fill free alert slots at the next flush do not count towards `max_queued`
+            queue_limit = self.max_queued + max(0, self.max_visible - len(self._visible))
+
+            if len(self._queued) >= queue_limit:
+                if self.max_queued > 0:
+                    del self._counts[self._queued.popleft()]
+                else:  # Nothing may wait, so there is no older message to make room by discarding
+                    return
+
+            self._counts[message] = 1
+            self._queued.append(message)
+
+        if self._flush__after_id is None:
+            self._flush__after_id = self._outer_frame._root().after_idle(self._flush)
+
+    def clear(self) -> None:
+        for message in self._queued:
+            del self._counts[message]
+        self._queued.clear()
+
+        for alert in list(self._alert_messages):
+            alert.expire()
+
+    def _render(self):
+        # Any alerts from a previous render are destroyed along with it, so their messages are re-queued to the front
+        self._queued.extendleft(reversed(self._visible))
+        self._visible = []
+        self._changed.clear()
+        self._alerts = {}
+        self._alert_messages = {}
+        self._alert_pool = []
+        self._alert_frames = {}
+
+        self.children["alerts"] = self._alert_pool  # Holds every Alert created for the current render
+
+        self._flush()
+
+    def _get_style_targets(self):
+        return {
+            **super()._get_style_targets(),
+            "alert": self.children["alerts"]
+        }
+
+    def _get_child_components(self):
+        # Pooled alerts which are not currently shown stay suspended, whatever happens to this component
+        return [alert for alert in self._alert_pool if alert in self._alert_messages]
+
+    def _flush(self):
+        self._flush__after_id = None
+
+        # Any pending messages will be displayed once this component is rendered
+        if (self._frame is None) or (not self.exists):
+            return
+
+        for message in self._changed:
+            if message in self._alerts:
+                alert = self._alerts[message]
+                alert.restart(self.duration_ms)
+                alert.update()
+        self._changed.clear()
+
+        while self._queued and (len(self._visible) < self.max_visible):
+            self._show(self._queued.popleft())
+
+        self._schedule_expiry()
+
+    def _show(self, message):
+        alert = next((alert for alert in self._alert_pool if alert not in self._alert_messages), None)
+
+        if alert is None:
+            alert = Alert(
+                self._frame, self.duration_ms, self._get_alert_text,
+                on_expire=self._handle_alert_expire, is_expiry_scheduled=False,
+                styles=self.styles["alert"]
+            )
+            self._alert_pool.append(alert)
+            self._alert_frames[alert] = alert.render()
+
+        self._visible.append(message)
+        self._alerts[message] = alert
+        self._alert_messages[alert] = message
+
+        alert.restart(self.duration_ms)
+
+        # Alerts shown while this component is suspended stay suspended until it is resumed
+        if self.is_suspended:
+            alert.suspend()
+            alert.update()
+        else:
+            alert.resume()  # Also updates the alert's text
+        self._alert_frames[alert].pack(side="top", fill="x")  # Reused alerts are moved to the bottom of the stack
+
+    def _get_alert_text(self, alert):
+        message = self._alert_messages.get(alert)
+        if message is None:
+            return ""
+
+        return self.format_text(message, self._counts[message])
+
+    def _handle_alert_expire(self, alert):
+        message = self._alert_messages.pop(alert, None)
+        if message is None:
+            return
+
+        del self._alerts[message]
+        del self._counts[message]
+        self._visible.remove(message)
+
+        if alert.exists:
+            self._alert_frames[alert].pack_forget()
+
+            # Pooled alerts are hidden, so their progress bars should not keep the animation clock running
+            alert.suspend()
+
+        if self._flush__after_id is None:
+            self._flush__after_id = self._outer_frame._root().after_idle(self._flush)
+
+    def _schedule_expiry(self):
+        if self._expiry__after_id is not None:
+            self._outer_frame._root().after_cancel(self._expiry__after_id)
+            self._expiry__after_id = None
+
+        if not self._alerts:
+            return
+
+        next_expiry_ms = min(alert.remaining_ms for alert in self._alerts.values())
+        self._expiry__after_id = self._outer_frame._root().after(int(next_expiry_ms) + 1, self._handle_expiry)
+
+    def _handle_expiry(self):
+        self._expiry__after_id = None
+
+        if not self.exists:
+            return
+
+        # Any alerts due to expire shortly after the earliest one are expired alongside it
+        for alert in list(self._alerts.values()):
+            if alert.remaining_ms <= self.expiry_batch_ms:
+                alert.expire()
+
+        self._schedule_expiry()
@@ -1,12 +1,14 @@
 from tkinter import Button
 from functools import partial
 
+from ..extensions import ConfigCache
 from .scrollframe import ScrollFrame
 
 
-class ButtonListBox(ScrollFrame):
+class ButtonListBox(ScrollFrame.with_extensions(ConfigCache)):
     def __init__(self, container, current_value, get_size,
-                 get_data, on_change=(lambda picker, new_value: None), styles=None):
+                 get_data, on_change=(lambda picker, new_value: None), is_rendered_progressively: bool = False,
+                 styles=None):
         super().__init__(
             container, get_size, is_scroll_vertical=True,
             get_data=get_data, on_change=on_change, styles=styles
@@ -29,12 +31,28 @@ class ButtonListBox(ScrollFrame):
             raise ValueError
         self.current_value = current_value
 
+        """
+        If `is_rendered_progressively` is True, the buttons are rendered in slices (see Component._render()),
+        so that long lists do not block the application while being built.
+        Not all buttons will then be in self.children until rendering has completed,
+        and subclasses extending ._render() should return the steps returned by super()._render()
+        """
+        self.is_rendered_progressively = is_rendered_progressively
+
     def _update(self):
         self._set_button_states()
 
     def _render(self):
         self.children["buttons"] = {}
 
+        render_steps = self._render_buttons()
+        if self.is_rendered_progressively:
+            return render_steps
+
+        for _ in render_steps:
+            pass
+
+    def _render_buttons(self):
         row_index = 0
         for value in self.order:
             row_index += 1
@@ -45,6 +63,19 @@ class ButtonListBox(ScrollFrame):
             self.children["buttons"][value] = button
             button.grid(row=row_index, column=0, sticky="nswe")
 
+            yield
+
+        self._set_button_states()
+
+    def _get_style_targets(self):
+        return {
+            **super()._get_style_targets(),
+            "button": [],
+            "button_selected": []
+        }
+
+    def _apply_layered_styles(self):
+        # Each button's style is layered from the shared button styles and its own individual style
         self._set_button_states()
 
     def _handle_click(self, new_value):
@@ -58,6 +89,8 @@ class ButtonListBox(ScrollFrame):
     def _set_button_states(self):
         for value, button in self.children["buttons"].items():
             if value == self.current_value:
-                button.configure(state="disabled", **self.styles["button_selected"])
+                self._cached_configure(button, state="disabled", **self.styles["button_selected"])
             else:
-                button.configure(state="normal", **{**self.styles["button"], **self.values[value]["style"]})
+                self._cached_configure(
+                    button, state="normal", **{**self.styles["button"], **self.values[value]["style"]}
+                )
@@ -0,0 +1,79 @@
+from tkinter import Misc
+from time import monotonic
+from weakref import WeakKeyDictionary
+from typing import Callable, Optional
+
+from ...scheduler import Scheduler, ScheduledTask
+
+
+class AnimationClock:
+    """
+    A single frame timer shared by every animated component under the same Tk root.
+    Monotonic time is sampled once per frame and passed to each subscriber in turn, so that all subscribed animations
+    advance in sync for the cost of one scheduled callback per frame.
+    The clock stops scheduling frames while it has no subscribers
+    """
+
+    FRAME_INTERVAL_MS = 15
+
+    __instances = WeakKeyDictionary()  # Keyed by Tk root
+
+    def __init__(self, root: Misc, frame_interval_ms: int = FRAME_INTERVAL_MS):
+        self._root = root
+        self.frame_interval_ms = frame_interval_ms
+
+        self.now = monotonic()  # The time sampled for the current frame
+        self._subscribers = {}  # Used as an ordered set
+        self._frame__task: Optional[ScheduledTask] = None
+        self._is_handling_frame = False  # The next frame is scheduled once all subscribers have been called
+
+    @classmethod
+    def for_widget(cls, widget: Misc) -> "AnimationClock":
+        """
+        Returns the clock shared by all widgets under the same Tk root as the provided widget
+        """
+
+        root = widget._root()
+
+        if root not in cls.__instances:
+            cls.__instances[root] = cls(root)
+        return cls.__instances[root]
+
+    @property
+    def is_running(self) -> bool:
+        return self._frame__task is not None
+
+    def subscribe(self, callback: Callable[[float], Optional[bool]]) -> None:
+        """
+        The provided callback will be called once per frame and passed the time sampled for that frame.
+        If it returns False, it will be unsubscribed
+        """
+
+        if not (self.is_running or self._is_handling_frame):
+            self.now = monotonic()  # Otherwise the last sampled time may be stale, from before the clock was paused
+            self._frame__task = Scheduler.for_widget(self._root).schedule(
+                self._handle_frame, self.frame_interval_ms, priority="animation"
+            )
+
+        self._subscribers[callback] = None
+
+    def unsubscribe(self, callback: Callable[[float], Optional[bool]]) -> None:
+        self._subscribers.pop(callback, None)
+
+    def _handle_frame(self) -> None:
+        self._frame__task = None
+        self._is_handling_frame = True
+        self.now = monotonic()
+
+        try:
+            for callback in list(self._subscribers):
+                if callback(self.now) is False:
+                    self.unsubscribe(callback)
+
+        finally:
+            self._is_handling_frame = False
+
+            if self._subscribers:
+                self._frame__task = Scheduler.for_widget(self._root).schedule(
+                    self._handle_frame, self.frame_interval_ms, priority="animation"
+                )
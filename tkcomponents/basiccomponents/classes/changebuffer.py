@@ -0,0 +1,53 @@
+from tkinter import Widget
+from typing import Callable, Hashable, Any, Optional
+
+from ...scheduler import Scheduler, ScheduledTask
+
+
+class ChangeBuffer:
+    """
+    Accumulates numeric deltas per key, and passes them on as a single batch once no further deltas have been
+    added for the duration of the quiet period (or immediately, if .flush() is called)
+    """
+
+    def __init__(self, widget: Widget, on_flush: Callable[[dict[Hashable, Any]], None], quiet_period_ms: int = 0):
+        # Flushes are scheduled against the Tk root, so that pending deltas are still passed on
+        # if the widget's component is destroyed by a re-render before the quiet period ends.
+        # They are the result of user input, and so are never deferred behind other scheduled work
+        self._scheduler = Scheduler.for_widget(widget)
+        self._on_flush = on_flush
+        self.quiet_period_ms = quiet_period_ms
+
+        self._deltas = {}
+        self._flush__task: Optional[ScheduledTask] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._deltas
+
+    def is_pending(self, key: Hashable) -> bool:
+        return key in self._deltas
+
+    def add(self, key: Hashable, delta: Any) -> None:
+        self._deltas[key] = self._deltas.get(key, 0) + delta
+
+        if self._flush__task is not None:
+            self._scheduler.cancel(self._flush__task)
+        self._flush__task = self._scheduler.schedule(
+            self.__handle_quiet_period, self.quiet_period_ms, priority="interaction"
+        )
+
+    def flush(self) -> None:
+        if self._flush__task is not None:
+            self._scheduler.cancel(self._flush__task)
+            self._flush__task = None
+
+        if not self._deltas:
+            return
+
+        deltas, self._deltas = self._deltas, {}
+        self._on_flush(deltas)
+
+    def __handle_quiet_period(self) -> None:
+        self._flush__task = None  # The scheduled call has already fired, so there is nothing left to cancel
+        self.flush()
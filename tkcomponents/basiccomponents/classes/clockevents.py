@@ -0,0 +1,128 @@
+from tkinter import Misc
+from datetime import datetime, timedelta, time as datetime_time
+from math import ceil
+from time import time
+from weakref import WeakKeyDictionary
+from typing import Callable, Optional
+
+
+class ClockEvents:
+    """
+    A single wakeup timer shared by every widget under the same Tk root, which notifies subscribers
+    as the local wall clock crosses calendar boundaries (the next second, minute or midnight).
+
+    Boundaries are calculated in local time, so midnight is correct across DST changes.
+    The service re-checks the clock at least once every `MAX_SLEEP_MS`, so if the system clock jumps
+    (or the machine sleeps) any boundaries passed in the meantime are still delivered, once each
+    """
+
+    BOUNDARIES = ("second", "minute", "midnight")
+    MAX_SLEEP_MS = 60000
+
+    __instances = WeakKeyDictionary()  # Keyed by Tk root
+
+    def __init__(self, root: Misc):
+        self._root = root
+
+        self._subscribers = {boundary: {} for boundary in self.BOUNDARIES}  # Each used as an ordered set
+        self._next_boundaries: dict[str, datetime] = {}
+        self._wakeup__after_id: Optional[str] = None
+
+    @classmethod
+    def for_widget(cls, widget: Misc) -> "ClockEvents":
+        """
+        Returns the service shared by all widgets under the same Tk root as the provided widget
+        """
+
+        root = widget._root()
+
+        if root not in cls.__instances:
+            cls.__instances[root] = cls(root)
+        return cls.__instances[root]
+
+    def subscribe(self, boundary: str, callback: Callable[[datetime], Optional[bool]]) -> None:
+        """
+        The provided callback will be called and passed the current local time each time the boundary is crossed.
+        If it returns False, it will be unsubscribed
+        """
+
+        if boundary not in self.BOUNDARIES:
+            raise ValueError
+
+        self._subscribers[boundary][callback] = None
+
+        if boundary not in self._next_boundaries:
+            self._next_boundaries[boundary] = self._get_next_boundary(boundary, datetime.now().astimezone())
+            self._schedule_wakeup()
+
+    def unsubscribe(self, boundary: str, callback: Callable[[datetime], Optional[bool]]) -> None:
+        self._subscribers[boundary].pop(callback, None)
+
+        if (not self._subscribers[boundary]) and (boundary in self._next_boundaries):
+            del self._next_boundaries[boundary]
+            self._schedule_wakeup()
+
+    @staticmethod
+    def _get_next_boundary(boundary: str, now: datetime) -> datetime:
+        if boundary == "second":
+            return now.replace(microsecond=0) + timedelta(seconds=1)
+        if boundary == "minute":
+            return now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        if boundary == "midnight":
+            # Localised separately, as the UTC offset at midnight may differ from the current one
+            return datetime.combine(now.date() + timedelta(days=1), datetime_time()).astimezone()
+
+        raise ValueError
+
+    @staticmethod
+    def _get_max_interval(boundary: str) -> timedelta:
+        """
+        The furthest away the next boundary can ever legitimately be.
+        If it is further away than this, the clock must have been turned back
+        """
+
+        return {
+            "second": timedelta(seconds=1),
+            "minute": timedelta(minutes=1),
+            "midnight": timedelta(hours=25)  # Allows for a DST change
+        }[boundary]
+
+    def _schedule_wakeup(self) -> None:
+        if self._wakeup__after_id is not None:
+            self._root.after_cancel(self._wakeup__after_id)
+            self._wakeup__after_id = None
+
+        if not self._next_boundaries:
+            return
+
+        now_timestamp = time()
+        delay_ms = min(
+            ceil((next_boundary.timestamp() - now_timestamp) * 1000)
+            for next_boundary in self._next_boundaries.values()
+        )
+        delay_ms = max(0, min(self.MAX_SLEEP_MS, delay_ms + 1))  # Rounded up so as not to wake before the boundary
+
+        self._wakeup__after_id = self._root.after(delay_ms, self._handle_wakeup)
+
+    def _handle_wakeup(self) -> None:
+        self._wakeup__after_id = None
+
+        now = datetime.now().astimezone()
+
+        try:
+            for boundary, next_boundary in list(self._next_boundaries.items()):
+                is_boundary_crossed = now >= next_boundary
+                is_clock_turned_back = (next_boundary - now) > self._get_max_interval(boundary)
+
+                if is_boundary_crossed or is_clock_turned_back:
+                    self._next_boundaries[boundary] = self._get_next_boundary(boundary, now)
+
+                if not is_boundary_crossed:
+                    continue
+
+                for callback in list(self._subscribers[boundary]):
+                    if callback(now) is False:
+                        self.unsubscribe(boundary, callback)
+
+        finally:
+            self._schedule_wakeup()
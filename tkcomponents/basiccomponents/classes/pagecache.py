@@ -0,0 +1,99 @@
+from collections import OrderedDict
+from typing import Callable, Sequence, Any
+
+
+class PageCache:
+    """
+    An LRU cache sitting in front of a paged data source.
+    Items are requested from the source one fixed-size page at a time, and only the `max_pages`
+    most recently used pages are kept
+    """
+
+    def __init__(self, get_page: Callable[[int, int], Sequence[Any]], page_size: int = 64, max_pages: int = 16):
+        self._get_page = get_page  # Receives a start and stop index, and returns the items in that range
+        self.page_size = page_size
+        self.max_pages = max_pages
+
+        self._pages = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_range(self, start: int, stop: int) -> list[Any]:
+        result = []
+        for page_index in self._get_page_indices(start, stop):
+            page = self._load_page(page_index, is_prefetch=False)
+            page_start = page_index * self.page_size
+
+            result += page[max(0, start - page_start):(stop - page_start)]
+
+        return result
+
+    def prefetch(self, start: int, stop: int) -> None:
+        """
+        Loads any pages in the provided range which are not already cached,
+        without counting towards the cache statistics
+        """
+
+        for page_index in self._get_page_indices(start, stop):
+            self._load_page(page_index, is_prefetch=True)
+
+    def revalidate(self, start: int, stop: int) -> bool:
+        """
+        Reloads the pages in the provided range from the source. If any of them no longer match their cached copies,
+        every other cached page is discarded as well, since those may also be out of date.
+        Returns True if a change was found
+        """
+
+        is_changed = False
+
+        fresh_pages = {}
+        for page_index in self._get_page_indices(start, stop):
+            page_start = page_index * self.page_size
+            page = self._get_page(page_start, page_start + self.page_size)
+
+            if (page_index in self._pages) and (self._pages[page_index] != page):
+                is_changed = True
+            fresh_pages[page_index] = page
+
+        if is_changed:
+            self._pages.clear()
+
+        for page_index, page in fresh_pages.items():
+            self._store_page(page_index, page)
+
+        return is_changed
+
+    def clear(self) -> None:
+        self._pages.clear()
+
+    def _get_page_indices(self, start: int, stop: int) -> range:
+        start = max(0, start)
+        if stop <= start:
+            return range(0)
+
+        return range(start // self.page_size, ((stop - 1) // self.page_size) + 1)
+
+    def _load_page(self, page_index: int, is_prefetch: bool) -> Sequence[Any]:
+        if page_index in self._pages:
+            if not is_prefetch:
+                self.hits += 1
+                self._pages.move_to_end(page_index)
+
+            return self._pages[page_index]
+
+        if not is_prefetch:
+            self.misses += 1
+
+        page_start = page_index * self.page_size
+        page = self._get_page(page_start, page_start + self.page_size)
+        self._store_page(page_index, page)
+
+        return page
+
+    def _store_page(self, page_index: int, page: Sequence[Any]) -> None:
+        self._pages[page_index] = page
+        self._pages.move_to_end(page_index)
+
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
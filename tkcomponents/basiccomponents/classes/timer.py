@@ -1,29 +1,42 @@
+from array import array
 from datetime import datetime, timedelta
+from time import monotonic_ns, time_ns
+from typing import Optional
 
 
 class Timer:
-    def __init__(self):
-        self._nodes = []
+    """
+    Elapsed time is tracked as a running total of all finished segments plus the start of the current segment,
+    both measured with a monotonic clock, so reading it costs the same however many times the timer is toggled.
 
-    @property
-    def is_running(self):
-        return self._nodes and len(self._nodes[-1]) < 2
+    If `is_history_kept` is True, the wall-clock start and stop times of each segment are also recorded.
+    Both history and laps are stored as flat arrays of nanosecond integers to keep their footprint small
+    """
+
+    def __init__(self, is_history_kept: bool = False):
+        self._accumulated_ns = 0
+        self._segment_start_ns: Optional[int] = None  # Monotonic; only set while the timer is running
+
+        self._splits = array("q")  # Elapsed time at each call to .lap()
+        self._history: Optional[array] = array("q") if is_history_kept else None  # Alternating start/stop times
 
     @property
-    def time_elapsed(self):
-        result = timedelta(0)
-        nodes_working = list(self._nodes)
+    def is_running(self) -> bool:
+        return self._segment_start_ns is not None
 
+    @property
+    def elapsed_ns(self) -> int:
         if self.is_running:
-            result += datetime.now() - nodes_working.pop()[0]
+            return self._accumulated_ns + (monotonic_ns() - self._segment_start_ns)
 
-        for start_stop_pair in nodes_working:
-            result += start_stop_pair[1] - start_stop_pair[0]
+        return self._accumulated_ns
 
-        return result
+    @property
+    def time_elapsed(self) -> timedelta:
+        return timedelta(microseconds=self.elapsed_ns // 1000)
 
     @property
-    def elapsed_string(self):  # Ignores days
+    def elapsed_string(self) -> str:  # Ignores days
         current_elapsed = self.time_elapsed
 
         hours, rem = divmod(current_elapsed.seconds, 3600)
@@ -31,17 +44,120 @@ class Timer:
 
         return "{0}:{1}:{2}".format(str(hours).zfill(2), str(mins).zfill(2), str(seconds).zfill(2))
 
-    def reset(self):
-        self._nodes = []
+    @property
+    def splits(self) -> list[timedelta]:
+        """
+        The total elapsed time at each lap
+        """
+
+        return [timedelta(microseconds=split_ns // 1000) for split_ns in self._splits]
+
+    @property
+    def laps(self) -> list[timedelta]:
+        """
+        The time elapsed between each lap and the one before it
+        """
+
+        result = []
+
+        previous_split_ns = 0
+        for split_ns in self._splits:
+            result.append(timedelta(microseconds=(split_ns - previous_split_ns) // 1000))
+            previous_split_ns = split_ns
+
+        return result
+
+    @property
+    def history(self) -> Optional[list[tuple[datetime, Optional[datetime]]]]:
+        """
+        The wall-clock start and stop times of each segment the timer has run for,
+        or None if this timer was not set to keep its history
+        """
+
+        if self._history is None:
+            return None
+
+        timestamps = [datetime.fromtimestamp(timestamp_ns / 1e9) for timestamp_ns in self._history]
+        if len(timestamps) % 2:
+            timestamps.append(None)  # The current segment has not been stopped yet
 
-    def start(self):
+        return list(zip(timestamps[::2], timestamps[1::2]))
+
+    def reset(self) -> None:
+        self._accumulated_ns = 0
+        self._segment_start_ns = None
+
+        self._splits = array("q")
+        if self._history is not None:
+            self._history = array("q")
+
+    def start(self) -> None:
         if self.is_running:
             return
 
-        self._nodes.append([datetime.now()])
+        self._segment_start_ns = monotonic_ns()
 
-    def stop(self):
+        if self._history is not None:
+            self._history.append(time_ns())
+
+    def stop(self) -> None:
         if not self.is_running:
             return
 
-        self._nodes[-1].append(datetime.now())
+        self._accumulated_ns += monotonic_ns() - self._segment_start_ns
+        self._segment_start_ns = None
+
+        if self._history is not None:
+            self._history.append(time_ns())
+
+    def lap(self) -> timedelta:
+        """
+        Records the current elapsed time as a split, and returns the time elapsed since the previous split
+        """
+
+        split_ns = self.elapsed_ns
+        previous_split_ns = self._splits[-1] if self._splits else 0
+
+        self._splits.append(split_ns)
+        return timedelta(microseconds=(split_ns - previous_split_ns) // 1000)
+
+    def snapshot(self) -> tuple:
+        """
+        Returns the full state of this timer as a tuple of plain values, suitable for persisting.
+        Since monotonic time is not comparable between sessions, a running timer's progress is stored
+        against the wall clock at the time of the snapshot
+        """
+
+        return (
+            self.elapsed_ns,
+            self.is_running,
+            time_ns(),
+            tuple(self._splits),
+            None if self._history is None else tuple(self._history)
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        """
+        Replaces the state of this timer with that of the provided snapshot.
+        If the timer was running when the snapshot was taken,
+        the wall-clock time which has passed since then is counted as elapsed
+        """
+
+        elapsed_ns, is_running, taken_at_ns, splits, history = snapshot
+
+        self._accumulated_ns = elapsed_ns
+        self._segment_start_ns = None
+
+        if is_running:
+            self._accumulated_ns += max(0, time_ns() - taken_at_ns)
+            self._segment_start_ns = monotonic_ns()
+
+        self._splits = array("q", splits)
+        self._history = None if history is None else array("q", history)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: tuple) -> "Timer":
+        timer = cls()
+        timer.restore(snapshot)
+
+        return timer
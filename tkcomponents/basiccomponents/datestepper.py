@@ -2,12 +2,12 @@ from tkinter import Label, Button, StringVar
 from datetime import datetime, timedelta
 
 from ..component import Component
-from ..extensions import GridHelper
+from ..extensions import GridHelper, ConfigCache
 from .constants import Constants
-from .classes.dateticker import DateTicker
+from .classes.clockevents import ClockEvents
 
 
-class DateStepper(Component.with_extensions(GridHelper)):
+class DateStepper(Component.with_extensions(GridHelper, ConfigCache)):
     def __init__(
             self, container, date_text_format="%Y/%m/%d",
             get_data=None, on_change=(lambda stepper, increment_amount: None), update_interval_ms=None, styles=None
@@ -19,8 +19,6 @@ class DateStepper(Component.with_extensions(GridHelper)):
 
         self.date_text_format = date_text_format
 
-        self._date_ticker = DateTicker()
-
         styles = styles or {}
         self.styles["button"] = styles.get("button", {})
         self.styles["label"] = styles.get("label", {})
@@ -31,19 +29,23 @@ class DateStepper(Component.with_extensions(GridHelper)):
         working_date = datetime.now().date() + timedelta(days=self.offset)
         self._date__var.set(working_date.strftime(self.date_text_format))
 
-    def _update(self):
-        if self._date_ticker.is_tomorrow:
-            if self.offset != 0:
-                self.offset += 1
-                self._on_change(self, 1)
-            else:
-                self._on_change(self, 0)
+        # Woken exactly at local midnight, rather than polling the date every update interval
+        self._clock_events = ClockEvents.for_widget(container)
+        self._clock_events.subscribe("midnight", self._handle_midnight)
+        self._suspended__date = None  # Any midnights passed while suspended are caught up on when resumed
+        self._outer_frame.bind("<Destroy>", self._handle_destroy, add="+")
 
+    def _update(self):
         if self.exists:
             working_date = datetime.now().date() + timedelta(days=self.offset)
-            self._date__var.set(working_date.strftime(self.date_text_format))
+            self._cached_set(self._date__var, working_date.strftime(self.date_text_format))
 
-            self.children["forward_button"].config(state="disabled" if self.offset == 0 else "normal")
+            if self.children.get("forward_button") is None:  # Not rendered yet
+                return
+
+            self._cached_configure(
+                self.children["forward_button"], state=("disabled" if self.offset == 0 else "normal")
+            )
 
     def _render(self):
         self.children["back_button"] = None
@@ -65,7 +67,54 @@ class DateStepper(Component.with_extensions(GridHelper)):
                                                  command=lambda: self._handle_click(1), **self.styles["button"])
         self.children["forward_button"].grid(row=0, column=2, sticky="nswe")
 
-        self.children["forward_button"].config(state="disabled" if is_rendering_today else "normal")
+        self._cached_configure(self.children["forward_button"], state=("disabled" if is_rendering_today else "normal"))
+
+    def _get_style_targets(self):
+        return {
+            **super()._get_style_targets(),
+            "button": [self.children["back_button"], self.children["forward_button"]],
+            "label": [self.children["label"]]
+        }
+
+    def suspend(self):
+        super().suspend()
+
+        self._clock_events.unsubscribe("midnight", self._handle_midnight)
+        if self._suspended__date is None:
+            self._suspended__date = datetime.now().date()
+
+    def resume(self):
+        self._clock_events.subscribe("midnight", self._handle_midnight)
+
+        if self._suspended__date is not None:
+            missed_midnights = (datetime.now().date() - self._suspended__date).days
+            self._suspended__date = None
+
+            for midnight_index in range(missed_midnights):
+                self._pass_midnight()
+
+        super().resume()
+
+    def _handle_destroy(self, event):
+        if str(event.widget) == str(self._outer_frame):
+            self._clock_events.unsubscribe("midnight", self._handle_midnight)
+
+    def _handle_midnight(self, now):
+        if not self.exists:
+            return False
+
+        self._pass_midnight()
+
+        if self.exists:
+            self._update()
+
+    def _pass_midnight(self):
+        # Any date other than today is kept on screen by moving its offset along with the current date
+        if self.offset != 0:
+            self.offset += 1
+            self._on_change(self, 1)
+        else:
+            self._on_change(self, 0)
 
     def _handle_click(self, increment_amount):
         self.offset += increment_amount
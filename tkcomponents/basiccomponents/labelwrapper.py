@@ -1,9 +1,10 @@
 from tkinter import Label, StringVar
 
 from ..component import Component
+from ..extensions import ConfigCache
 
 
-class LabelWrapper(Component):
+class LabelWrapper(Component.with_extensions(ConfigCache)):
     def __init__(self, container, get_data,
                  update_interval_ms=None, styles=None):
         super().__init__(container, get_data=get_data,
@@ -13,10 +14,10 @@ class LabelWrapper(Component):
         self.styles["label"] = styles.get("label", {})
 
         self._text__var = StringVar()
-        self._text__var.set(self._get_data(self))
+        self._cached_set(self._text__var, self._get_data(self))
 
     def _update(self):
-        self._text__var.set(self._get_data(self))
+        self._cached_set(self._text__var, self._get_data(self))
 
     def _render(self):
         self.children["label"] = None
@@ -24,3 +25,9 @@ class LabelWrapper(Component):
         label = Label(self._frame, textvariable=self._text__var, **self.styles["label"])
         self.children["label"] = label
         label.pack(expand=True, fill="both")
+
+    def _get_style_targets(self):
+        return {
+            **super()._get_style_targets(),
+            "label": [self.children["label"]]
+        }
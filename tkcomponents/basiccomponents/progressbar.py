@@ -1,20 +1,46 @@
-from tkinter import Frame
+from tkinter import Frame, Canvas
+from math import ceil
+from typing import Optional
 
 from ..component import Component
 from ..extensions import GridHelper
+from .classes.animationclock import AnimationClock
 
 
 class ProgressBar(Component.with_extensions(GridHelper)):
     RESOLUTION = 10000
 
     def __init__(self, container, get_data, on_change=lambda bar: None, is_reversed=False,
+                 is_drawn_on_canvas: bool = False, max_fps: Optional[int] = None, is_clock_driven: bool = False,
                  update_interval_ms=15, styles=None):
+        # The update interval is lengthened as necessary so that the bar is not redrawn more often than `max_fps`
+        if max_fps and update_interval_ms:
+            update_interval_ms = max(update_interval_ms, ceil(1000 / max_fps))
+
         super().__init__(container, get_data=get_data, on_change=on_change,
-                         update_interval_ms=update_interval_ms, styles=styles)
+                         update_interval_ms=(None if is_clock_driven else update_interval_ms), styles=styles)
+
+        """
+        If `is_clock_driven` is True, the bar will not run its own update loop and will instead be updated
+        on each frame of the `AnimationClock` shared by all widgets under the same Tk root.
+        The current frame's time can be read by `get_data` from `bar.clock.now`
+        """
+        self.clock = AnimationClock.for_widget(container) if is_clock_driven else None
+        self._min_frame_interval = (1 / max_fps) if max_fps else 0
+        self._last_frame_time = None
 
         self.is_reversed = is_reversed
         self.is_expired = False
 
+        """
+        When drawn on a canvas, the bar is a single rectangle which is resized in place,
+        and is only redrawn when its filled width in pixels actually changes.
+        The bar's colours are taken from the "bg" (or "background") option of its two frame styles
+        """
+        self.is_drawn_on_canvas = is_drawn_on_canvas
+        self._canvas_size = (0, 0)
+        self._canvas_filled_width = None
+
         styles = styles or {}
         self.styles["filled_bar_frame"] = styles.get("filled_bar_frame", {})
         self.styles["empty_bar_frame"] = styles.get("empty_bar_frame", {})
@@ -27,7 +53,15 @@ class ProgressBar(Component.with_extensions(GridHelper)):
         old_value = self.value
         self.value = self._get_data(self)
 
-        if (old_value in (0, 1)) != (self.value in (0, 1)) or abs(self.value - old_value) == 1:
+        if self.is_drawn_on_canvas:
+            if self.value == 1 and not self.is_expired:
+                self.is_expired = True
+                self._on_change(self)
+
+            if self.exists:
+                self._draw_canvas_bar()
+
+        elif (old_value in (0, 1)) != (self.value in (0, 1)) or abs(self.value - old_value) == 1:
             if self.value == 1:
                 if not self.is_expired:
                     self.is_expired = True
@@ -38,12 +72,19 @@ class ProgressBar(Component.with_extensions(GridHelper)):
             self._configure_bar_proportions()
 
     def _render(self):
+        if self.clock and not self.is_suspended:
+            self.clock.subscribe(self._handle_clock_frame)
+
         self.children["filled_bar_frame"] = None
         self.children["empty_bar_frame"] = None
+        self.children["canvas"] = None
 
         self._apply_frame_stretch(rows=[0])
 
-        if self.value in (0, 1):
+        if self.is_drawn_on_canvas:
+            self._render_canvas_bar()
+
+        elif self.value in (0, 1):
             bar_style = "empty_bar_frame" if self.value == self.is_reversed else "filled_bar_frame"
 
             bar_frame = Frame(self._frame, **self.styles[bar_style])
@@ -61,8 +102,83 @@ class ProgressBar(Component.with_extensions(GridHelper)):
 
         self._configure_bar_proportions()
 
+    def suspend(self):
+        super().suspend()
+
+        if self.clock:
+            self.clock.unsubscribe(self._handle_clock_frame)
+
+    def resume(self):
+        super().resume()
+
+        if self.clock and (self._frame is not None):
+            self.clock.subscribe(self._handle_clock_frame)
+
+    def _get_style_targets(self):
+        # The canvas bar's colours are only read when it is rendered, so changes to them require a re-render
+        if self.is_drawn_on_canvas:
+            return super()._get_style_targets()
+
+        return {
+            **super()._get_style_targets(),
+            **{
+                style_key: ([] if self.children[style_key] is None else [self.children[style_key]])
+                for style_key in ("filled_bar_frame", "empty_bar_frame")
+            }
+        }
+
+    def _handle_clock_frame(self, now):
+        if (not self.exists) or self.is_suspended:
+            return False
+
+        if (self._last_frame_time is not None) and (now - self._last_frame_time < self._min_frame_interval):
+            return
+        self._last_frame_time = now
+
+        self.update()
+
+    def _render_canvas_bar(self):
+        def on_resize(event):
+            self._canvas_size = (event.width, event.height)
+            self._draw_canvas_bar(is_forced=True)
+
+        filled_colour = self._get_style_colour("filled_bar_frame")
+        empty_colour = self._get_style_colour("empty_bar_frame")
+
+        self._canvas_size = (self.styles["width"] or 0, self.styles["height"] or 0)
+        self._canvas_filled_width = None
+
+        canvas = Canvas(
+            self._frame, width=self._canvas_size[0], height=self._canvas_size[1],
+            highlightthickness=0, borderwidth=0, **({"background": empty_colour} if empty_colour else {})
+        )
+        self.children["canvas"] = canvas
+        canvas.create_rectangle(
+            0, 0, 0, 0, width=0, tags=("filled_bar",), **({"fill": filled_colour} if filled_colour else {})
+        )
+        canvas.bind("<Configure>", on_resize)
+        canvas.grid(row=0, column=0, sticky="nswe")
+
+        self._draw_canvas_bar(is_forced=True)
+
+    def _draw_canvas_bar(self, is_forced=False):
+        width, height = self._canvas_size
+
+        completed_width = int(self.value * width)  # Always floor how complete the bar is
+        filled_width = (width - completed_width) if self.is_reversed else completed_width
+
+        if filled_width == self._canvas_filled_width and not is_forced:
+            return
+
+        self._canvas_filled_width = filled_width
+        self.children["canvas"].coords("filled_bar", 0, 0, filled_width, height)
+
+    def _get_style_colour(self, style_key):
+        style = self.styles[style_key]
+        return style.get("bg", style.get("background", None))
+
     def _configure_bar_proportions(self):
-        if self.value in (0, 1):
+        if self.is_drawn_on_canvas or (self.value in (0, 1)):
             self._frame.columnconfigure(0, weight=1)
 
             if self.styles["width"]:
@@ -34,11 +34,11 @@ class ScrollFrame(Component, ABC):
             )  ##### TODO: Test if this correctly allows the component to resize back down when not being stretched
 
             if self._is_scroll_vertical:
-                height = self._get_size()
+                height = self._call_traced("get_size", self._get_size)
                 width = self._frame.winfo_reqwidth()
             else:
                 height = self._frame.winfo_reqheight()
-                width = self._get_size()
+                width = self._call_traced("get_size", self._get_size)
 
             self._frame__canvas.configure(
                 width=width,
@@ -62,12 +62,12 @@ class ScrollFrame(Component, ABC):
 
         # Custom configuration for the Canvas window
         if self._is_scroll_vertical:
-            canvas_height = self._get_size()
+            canvas_height = self._call_traced("get_size", self._get_size)
             canvas_width = self._frame.winfo_reqwidth()
             canvas_scrollcommand_option = "yscrollcommand"
         else:
             canvas_height = self._frame.winfo_reqheight()
-            canvas_width = self._get_size()
+            canvas_width = self._call_traced("get_size", self._get_size)
             canvas_scrollcommand_option = "xscrollcommand"
 
         self._frame__canvas.create_window((0, 0), window=self._frame, anchor="nw")
@@ -77,6 +77,12 @@ class ScrollFrame(Component, ABC):
             **{canvas_scrollcommand_option: self._frame__scroll.set}
         )
         self._frame__main.bind("<Configure>", on_resize)
+
+        # The scrollable area is kept up to date as child widgets are added, which may happen after the initial render
+        self._frame.bind(
+            "<Configure>",
+            lambda event: self._frame__canvas.configure(scrollregion=self._frame__canvas.bbox("all"))
+        )
         self._enable_mousewheel_scroll(self._frame__canvas, do_include_children=False)
 
         if self._is_scroll_vertical:
@@ -86,6 +92,14 @@ class ScrollFrame(Component, ABC):
         self._frame__main.grid(row=0, column=0, sticky="nswe")
         self._frame__canvas.grid(row=0, column=0, sticky="nswe")
 
+    def _get_style_targets(self):
+        return {
+            "frame": [self._frame__main],
+            "canvas": [self._frame__canvas],
+            "scrollbar": [self._frame__scroll],
+            "inner_frame": [self._frame]
+        }
+
     def _enable_mousewheel_scroll(self, widget, do_include_children: bool = False):
         """
         Any widgets rendered inside this component which should still allow the canvas to scroll when hovering over
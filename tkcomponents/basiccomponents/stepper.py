@@ -3,10 +3,14 @@ from functools import partial
 from typing import Callable, Any, Optional
 
 from ..component import Component
-from ..extensions import GridHelper
+from ..scheduler import Scheduler
+from ..extensions import GridHelper, ConfigCache, GridLayout
+from .classes.changebuffer import ChangeBuffer
 
 
-class Stepper(Component.with_extensions(GridHelper)):
+class Stepper(Component.with_extensions(GridHelper, ConfigCache)):
+    MIN_REPEAT_INTERVAL_MS = 20
+
     def __init__(
         self, container,
         get_data: Optional[Callable[["Stepper"], Any]] = None,
@@ -15,6 +19,8 @@ class Stepper(Component.with_extensions(GridHelper)):
         after_steps: tuple[tuple[str,  Any], ...] = (("+", 1),),
         format_label: Callable[["Stepper"], str] = (lambda stepper: str(stepper.value)),
         limits: Optional[tuple[Any, Any]] = (None, None), is_horizontal: bool = True,
+        change_buffer_ms: Optional[int] = None,
+        repeat_delay_ms: Optional[int] = None, repeat_interval_ms: int = 100, repeat_acceleration: float = 1,
         update_interval_ms=None, styles=None
     ):
         super().__init__(container, get_data=get_data, on_change=on_change,
@@ -28,6 +34,30 @@ class Stepper(Component.with_extensions(GridHelper)):
         self.min = limits[0]
         self.max = limits[1]
 
+        """
+        If `change_buffer_ms` is provided, consecutive steps are coalesced and passed to `on_change` as a single
+        total step amount once no further steps have been taken for that many milliseconds.
+        Pending steps can also be passed on immediately by calling .flush_changes()
+        """
+        self._change_buffer = None
+        if change_buffer_ms is not None:
+            self._change_buffer = ChangeBuffer(
+                self._outer_frame,
+                lambda deltas: self._on_change(self, deltas[None]),
+                quiet_period_ms=change_buffer_ms
+            )
+
+        """
+        If `repeat_delay_ms` is provided, holding down a step button will repeat that step after the delay.
+        Each repeat after the first will be `repeat_acceleration` times quicker than the last,
+        down to a minimum interval of `.MIN_REPEAT_INTERVAL_MS`
+        """
+        self.repeat_delay_ms = repeat_delay_ms
+        self.repeat_interval_ms = repeat_interval_ms
+        self.repeat_acceleration = repeat_acceleration
+        self._repeat__task = None
+        self._repeat__is_pointer_pressed = False
+
         styles = styles or {}
         self.styles["button"] = styles.get("button", {})
         self.styles["label"] = styles.get("label", {})
@@ -35,13 +65,14 @@ class Stepper(Component.with_extensions(GridHelper)):
         self.value = self._get_data(self) if self._get_data else 0
 
         self._label_var = StringVar()
-        self._label_var.set(self.format_label(self))
+        self._cached_set(self._label_var, self.format_label(self))
 
     def _update(self):
-        if self._get_data:
+        # Any buffered steps have not yet been passed on, so the data source will not reflect them yet
+        if self._get_data and (self._change_buffer is None or self._change_buffer.is_empty):
             self.value = self._get_data(self)
 
-        self._label_var.set(self.format_label(self))
+        self._cached_set(self._label_var, self.format_label(self))
 
         self._set_button_states()
 
@@ -50,62 +81,114 @@ class Stepper(Component.with_extensions(GridHelper)):
         self.children["after_buttons"] = []
         self.children["label"] = None
 
-        row_stretch = [0] if self.is_horizontal else [len(self.before_steps)]
-        column_stretch = [len(self.before_steps)] if self.is_horizontal else [0]
-        self._apply_frame_stretch(rows=row_stretch, columns=column_stretch)
-
-        row_index, column_index = 0, 0
-
-        if self.is_horizontal:
-            for step_label, step_amount in self.before_steps:
-                button = Button(
-                    self._frame, text=step_label,
-                    command=partial(self._handle_click, step_amount), **self.styles["button"]
-                )
-                self.children["before_buttons"].append(((step_label, step_amount), button))
-                button.grid(row=row_index, column=column_index, sticky="nswe")
-                column_index += 1
-
-            label = Label(self._frame, textvariable=self._label_var, **self.styles["label"])
-            self.children["label"] = label
-            label.grid(row=row_index, column=column_index, sticky="nswe")
-            column_index += 1
-
-            for step_label, step_amount in self.after_steps:
-                button = Button(
-                    self._frame, text=step_label,
-                    command=partial(self._handle_click, step_amount), **self.styles["button"]
-                )
-                self.children["after_buttons"].append(((step_label, step_amount), button))
-                button.grid(row=row_index, column=column_index, sticky="nswe")
-                column_index += 1
+        for step_label, step_amount in self.before_steps:
+            button = self._create_step_button(step_label, step_amount)
+            self.children["before_buttons"].append(((step_label, step_amount), button))
 
-        else:
-            for step_label, step_amount in self.before_steps:
-                button = Button(
-                    self._frame, text=step_label,
-                    command=partial(self._handle_click, step_amount), **self.styles["button"]
-                )
-                self.children["before_buttons"].append(((step_label, step_amount), button))
-                button.grid(row=row_index, column=column_index, sticky="nswe")
-                row_index += 1
-
-            label = Label(self._frame, textvariable=self._label_var, **self.styles["label"])
-            self.children["label"] = label
-            label.grid(row=row_index, column=column_index, sticky="nswe")
-            row_index += 1
-
-            for step_label, step_amount in self.after_steps:
-                button = Button(
-                    self._frame, text=step_label,
-                    command=partial(self._handle_click, step_amount), **self.styles["button"]
-                )
-                self.children["after_buttons"].append(((step_label, step_amount), button))
-                button.grid(row=row_index, column=column_index, sticky="nswe")
-                row_index += 1
+        label = Label(self._frame, textvariable=self._label_var, **self.styles["label"])
+        self.children["label"] = label
+
+        for step_label, step_amount in self.after_steps:
+            button = self._create_step_button(step_label, step_amount)
+            self.children["after_buttons"].append(((step_label, step_amount), button))
+
+        # Buttons and label are laid out in a line, with only the label stretching along it
+        layout = GridLayout.line(
+            len(self.before_steps) + 1 + len(self.after_steps),
+            is_horizontal=self.is_horizontal, stretch=(len(self.before_steps),)
+        )
+        self._apply_grid_layout(layout, [
+            *(button for step, button in self.children["before_buttons"]),
+            label,
+            *(button for step, button in self.children["after_buttons"])
+        ])
 
         self._set_button_states()
 
+    def _get_style_targets(self):
+        return {
+            **super()._get_style_targets(),
+            "button": [button for step, button in self.children["before_buttons"] + self.children["after_buttons"]],
+            "label": [self.children["label"]]
+        }
+
+    def flush_changes(self):
+        """
+        Passes any buffered steps on to `on_change` immediately, rather than waiting for the buffer's quiet period
+        """
+
+        if self._change_buffer:
+            self._change_buffer.flush()
+
+    def _create_step_button(self, step_label, step_amount):
+        if self.repeat_delay_ms is None:
+            return Button(
+                self._frame, text=step_label,
+                command=partial(self._handle_click, step_amount), **self.styles["button"]
+            )
+
+        """
+        Auto-repeating buttons step on mouse press rather than on release, so mouse clicks are handled via bindings.
+        The button's command is still used for keyboard activation, but is skipped when invoked by a mouse release
+        """
+        button = Button(
+            self._frame, text=step_label,
+            command=partial(self._handle_invoke, step_amount), **self.styles["button"]
+        )
+        button.bind("<ButtonPress-1>", lambda event: self._handle_press(step_amount))
+        button.bind("<ButtonRelease-1>", lambda event: self._handle_release())
+        button.bind("<Leave>", lambda event: self._cancel_repeat())
+
+        return button
+
+    def _handle_invoke(self, step_amount):
+        if self._repeat__is_pointer_pressed or not self._can_step(step_amount):
+            return
+
+        self._handle_click(step_amount)
+
+    def _handle_press(self, step_amount):
+        self._repeat__is_pointer_pressed = True
+
+        if not self._can_step(step_amount):
+            return
+
+        self._cancel_repeat()
+        self._handle_click(step_amount)
+
+        # Repeats are the result of user input, and so are never deferred behind other scheduled work
+        self._repeat__task = Scheduler.for_widget(self._outer_frame).schedule(
+            partial(self._handle_repeat, step_amount, self.repeat_interval_ms),
+            self.repeat_delay_ms, priority="interaction"
+        )
+
+    def _handle_repeat(self, step_amount, interval_ms):
+        self._repeat__task = None
+
+        if not (self.exists and self._can_step(step_amount)):
+            return
+
+        self._handle_click(step_amount)
+
+        next_interval_ms = max(self.MIN_REPEAT_INTERVAL_MS, int(interval_ms / self.repeat_acceleration))
+        self._repeat__task = Scheduler.for_widget(self._outer_frame).schedule(
+            partial(self._handle_repeat, step_amount, next_interval_ms), interval_ms, priority="interaction"
+        )
+
+    def _handle_release(self):
+        self._cancel_repeat()
+
+        # The button's command is invoked by the release after this handler, so the press is only cleared afterwards
+        self._outer_frame._root().after_idle(self._clear_pointer_press)
+
+    def _clear_pointer_press(self):
+        self._repeat__is_pointer_pressed = False
+
+    def _cancel_repeat(self):
+        if self._repeat__task is not None:
+            Scheduler.for_widget(self._outer_frame).cancel(self._repeat__task)
+            self._repeat__task = None
+
     def _handle_click(self, step_amount):
         self.value += step_amount
 
@@ -115,20 +198,26 @@ class Stepper(Component.with_extensions(GridHelper)):
         if self.max is not None:
             self.value = min(self.max, self.value)
 
-        self._on_change(self, step_amount)
+        if self._change_buffer:
+            self._change_buffer.add(None, step_amount)
+        else:
+            self._on_change(self, step_amount)
 
         if self.exists:
             self._update()
 
+    def _can_step(self, step_amount):
+        value_after_step = self.value + step_amount
+
+        if (self.min is not None) and (value_after_step < self.min):
+            return False
+        if (self.max is not None) and (value_after_step > self.max):
+            return False
+
+        return True
+
     def _set_button_states(self):
         all_buttons = self.children["before_buttons"] + self.children["after_buttons"]
 
         for (step_label, step_amount), button in all_buttons:
-            value_after_button_press = self.value + step_amount
-
-            if (self.min is not None) and (value_after_button_press < self.min):
-                button.config(state="disabled")
-            elif (self.max is not None) and (value_after_button_press > self.max):
-                button.config(state="disabled")
-            else:
-                button.config(state="normal")
+            self._cached_configure(button, state=("normal" if self._can_step(step_amount) else "disabled"))
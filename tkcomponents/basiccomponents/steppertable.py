@@ -3,11 +3,14 @@ from tkinter import Label
 from typing import Any, Optional, Callable
 
 from ..component import Component
-from ..extensions import GridHelper
+from ..extensions import GridHelper, BatchedRender
 from .stepper import Stepper
+from .classes.changebuffer import ChangeBuffer
 
 
-class StepperTable(Component.with_extensions(GridHelper)):
+class StepperTable(Component.with_extensions(GridHelper, BatchedRender)):
+    BULK_CHANGE_BUFFER_MS = 200  # Used when `on_bulk_change` is provided without `change_buffer_ms`
+
     def __init__(
         self, container,
         axis_labels: tuple[tuple[str, ...], tuple[str, ...]], axis_values: tuple[tuple[Any, ...], tuple[Any, ...]],
@@ -15,13 +18,21 @@ class StepperTable(Component.with_extensions(GridHelper)):
         on_change=(lambda x_value, y_value, stepper, step_amount: None),
         before_steps=(("-", -1),), after_steps=(("+", 1),),
         format_label=(lambda stepper: str(stepper.value)), limits=(None, None), is_horizontal=True,
+        get_bulk_data: Optional[Callable[["StepperTable"], dict[tuple[Any, Any], Any]]] = None,
+        on_bulk_change: Optional[Callable[["StepperTable", dict[tuple[Any, Any], Any]], None]] = None,
+        change_buffer_ms: Optional[int] = None,
+        repeat_delay_ms=None, repeat_interval_ms=100, repeat_acceleration=1,
         update_interval_ms=None, styles=None
     ):
-        super().__init__(container, get_data=get_data, on_change=on_change, styles=styles)
+        super().__init__(
+            container, get_data=get_data, on_change=on_change,
+            update_interval_ms=(update_interval_ms if get_bulk_data else None), styles=styles
+        )
 
         styles = styles or {}
         self.styles["x_label"] = styles.get("x_label", {})
         self.styles["y_label"] = styles.get("y_label", {})
+        self.styles["stepper"] = styles.get("stepper", {})
 
         self._stepper_kwargs = {
             "before_steps": before_steps,
@@ -29,17 +40,66 @@ class StepperTable(Component.with_extensions(GridHelper)):
             "format_label": format_label,
             "limits": limits,
             "is_horizontal": is_horizontal,
-            "update_interval_ms": update_interval_ms,
-            "styles": styles.get("stepper", {})
+            "change_buffer_ms": (None if on_bulk_change else change_buffer_ms),
+            "repeat_delay_ms": repeat_delay_ms,
+            "repeat_interval_ms": repeat_interval_ms,
+            "repeat_acceleration": repeat_acceleration,
+            "update_interval_ms": (None if get_bulk_data else update_interval_ms)
         }
 
         self.axis_labels = axis_labels
         self.axis_values = axis_values
 
+        """
+        If provided, the below function is used in place of `get_data` as the only data source for the table.
+        It should receive this component instance and return a dict of cell values keyed by (x_value, y_value),
+        and will be called once per table update rather than once per cell.
+        Cells missing from the returned dict keep their last known value,
+        so the function may return only the cells that have changed since it was last called
+        """
+        self._get_bulk_data = get_bulk_data
+
+        self.values = {}  # Only populated when a bulk data source is in use
+        self._is_bulk_data_loaded = False  # The bulk data source is first read when this component is rendered
+
+        """
+        If `on_bulk_change` is provided, it is used in place of `on_change`.
+        Steps taken on any cell are accumulated per (x_value, y_value), and passed to the function as a single dict
+        of total step amounts once no further steps have been taken for `change_buffer_ms` milliseconds
+        (or `.BULK_CHANGE_BUFFER_MS`, if not provided).
+        Pending steps can also be passed on immediately by calling .flush_changes()
+        """
+        self._change_buffer = None
+        if on_bulk_change:
+            self._change_buffer = ChangeBuffer(
+                self._outer_frame,
+                lambda deltas: on_bulk_change(self, deltas),
+                quiet_period_ms=(self.BULK_CHANGE_BUFFER_MS if change_buffer_ms is None else change_buffer_ms)
+            )
+
+    def _update(self):
+        if not self._get_bulk_data:
+            return
+
+        changed_cells = self._load_bulk_data()
+        if not (changed_cells and self.children.get("steppers")):
+            return
+
+        x_indices = {x_value: x_index for x_index, x_value in enumerate(self.axis_values[0])}
+        y_indices = {y_value: y_index for y_index, y_value in enumerate(self.axis_values[1])}
+        for x_value, y_value in changed_cells:
+            stepper = self.children["steppers"].get((x_indices.get(x_value), y_indices.get(y_value)))
+
+            if stepper:
+                stepper.update()
+
     def _render(self):
         self.children["axis_labels"] = [[], []]
         self.children["steppers"] = {}
 
+        if self._get_bulk_data and not self._is_bulk_data_loaded:
+            self._load_bulk_data()
+
         self._apply_frame_stretch(columns=[0], rows=[1])
 
         for x_index, x_label in enumerate(self.axis_labels[0]):
@@ -56,9 +116,80 @@ class StepperTable(Component.with_extensions(GridHelper)):
             for y_index, y_value in enumerate(self.axis_values[1]):
                 stepper = Stepper(
                     self._frame,
-                    get_data=partial(self._get_data, x_value, y_value) if self._get_data else None,
-                    on_change=partial(self._on_change, x_value, y_value),
-                    **self._stepper_kwargs
+                    get_data=self._get_cell_data_source(x_value, y_value),
+                    on_change=partial(self._handle_cell_change, x_value, y_value),
+                    **self._stepper_kwargs, styles=self.styles["stepper"]
                 )
                 self.children["steppers"][(x_index, y_index)] = stepper
                 stepper.render().grid(row=y_index+2, column=x_index+1, sticky="nswe")
+
+    def _get_style_targets(self):
+        return {
+            **super()._get_style_targets(),
+            "x_label": self.children["axis_labels"][0],
+            "y_label": self.children["axis_labels"][1],
+            "stepper": list(self.children["steppers"].values())
+        }
+
+    def flush_changes(self):
+        """
+        Passes any buffered steps on immediately, rather than waiting for the buffer's quiet period
+        """
+
+        if self._change_buffer:
+            self._change_buffer.flush()
+        else:
+            for stepper in self.children.get("steppers", {}).values():
+                stepper.flush_changes()
+
+    def _load_bulk_data(self):
+        """
+        Reads the bulk data source into self.values, and returns the cells whose values have changed
+        """
+
+        self._is_bulk_data_loaded = True
+
+        changed_cells = []
+        for cell, value in self._get_bulk_data(self).items():
+            # Any buffered steps have not yet been passed on, so the data source will not reflect them yet
+            if self._change_buffer and self._change_buffer.is_pending(cell):
+                continue
+
+            # Cells seen for the first time are always changed, whatever their value
+            if (cell not in self.values) or (self.values[cell] != value):
+                changed_cells.append(cell)
+            self.values[cell] = value
+
+        return changed_cells
+
+    def _handle_cell_change(self, x_value, y_value, stepper, step_amount):
+        if self._get_bulk_data:
+            self.values[(x_value, y_value)] = stepper.value
+
+        if self._change_buffer:
+            self._change_buffer.add((x_value, y_value), step_amount)
+        else:
+            self._on_change(x_value, y_value, stepper, step_amount)
+
+    def _get_cell_data_source(self, x_value, y_value):
+        """
+        When a bulk data source is in use, each stepper reads from the values cached by the table
+        rather than calling out to the application state itself
+        """
+
+        if self._get_bulk_data:
+            return lambda stepper: self.values.get((x_value, y_value), 0)
+
+        if not self._get_data:
+            return None
+
+        if self._change_buffer:
+            # Cells with buffered steps keep their local value until those steps have been passed on
+            def get_data__buffered(stepper):
+                if self._change_buffer.is_pending((x_value, y_value)):
+                    return stepper.value
+                return self._get_data(x_value, y_value, stepper)
+
+            return get_data__buffered
+
+        return partial(self._get_data, x_value, y_value)
@@ -1,23 +1,66 @@
 from tkinter import Entry, StringVar
+from time import monotonic
+from typing import Optional, Callable, Any
 
 from ..component import Component
-from ..extensions import GridHelper
+from ..scheduler import Scheduler
+from ..extensions import GridHelper, ConfigCache
 
 
-class StringEditor(Component.with_extensions(GridHelper)):
+class StringEditor(Component.with_extensions(GridHelper, ConfigCache)):
     def __init__(self, container, get_data=None, on_change=(lambda editor, old_value: None),
+                 debounce_ms: Optional[int] = None, throttle_ms: Optional[int] = None,
+                 get_version: Optional[Callable[["StringEditor"], Any]] = None,
                  update_interval_ms=None, styles=None):
         super().__init__(container, get_data=get_data, on_change=on_change,
                          update_interval_ms=update_interval_ms, styles=styles)
 
+        if (debounce_ms is not None) and (throttle_ms is not None):
+            raise ValueError("debounce_ms and throttle_ms cannot both be provided")
+
         styles = styles or {}
         self.styles["entry"] = styles.get("entry", {})
         self.styles["entry_saved"] = styles.get("entry_saved", {})
         self.styles["entry_unsaved"] = styles.get("entry_unsaved", {})
 
-        self.__entry_style__current = None  # Used by __apply_entry_style
+        """
+        If `debounce_ms` is provided, `on_change` is only called once input has stopped for that many milliseconds.
+        If `throttle_ms` is provided, `on_change` is called at most once per that many milliseconds while input continues.
+        In either case, `on_change` receives the value from before the first of the inputs it covers,
+        and any pending call can be made immediately with .flush_changes()
+        """
+        self.debounce_ms = debounce_ms
+        self.throttle_ms = throttle_ms
+        self._pending_old_value = None
+        self._is_change_pending = False
+        self._last_change_time = None
+        self._change__task = None
+
+        """
+        The value from `get_data` is cached, and is only re-read on each update interval rather than on every input.
+        It is never taken from the entry itself, so edits are shown as unsaved until the source has been re-read.
+        If `get_version` is provided, it should return a value which changes whenever the source data does,
+        and the cached value will only be re-read when that value changes (including after `on_change` is called)
+        """
+        self._get_version = get_version
+        self._source_version = None
+        self._source_value = None
+        self.refresh_source(is_forced=True)
+
+        self.value = self._source_value if self._get_data else ""
 
-        self.value = self._get_data(self) if self._get_data else ""
+        # Validation callbacks are registered once, rather than on every render
+        self._entry_commands = {}
+        for command_option in ("validatecommand", "invalidcommand"):
+            if command_option in self.styles["entry"]:
+                option_data = self.styles["entry"][command_option]
+                if callable(option_data):
+                    self._entry_commands[command_option] = self._outer_frame.register(option_data)
+                else:
+                    self._entry_commands[command_option] = (
+                        self._outer_frame.register(option_data[0]),
+                        *option_data[1:]
+                    )
 
         self._value__var = StringVar()
         self._value__var.set(self.value)
@@ -28,49 +71,124 @@ class StringEditor(Component.with_extensions(GridHelper)):
         if not self._get_data:
             return False
 
-        source_value = self._get_data(self)
-        return source_value != self.value
+        return self._source_value != self.value
+
+    def refresh_source(self, is_forced: bool = False) -> None:
+        """
+        Re-reads the cached source value from `get_data`.
+        If `get_version` was provided, this is skipped unless the version has changed (or `is_forced` is True)
+        """
+
+        if not self._get_data:
+            return
+
+        if self._get_version:
+            version = self._get_version(self)
+            if (version == self._source_version) and not is_forced:
+                return
+            self._source_version = version
+
+        self._source_value = self._get_data(self)
+
+    def flush_changes(self) -> None:
+        """
+        Calls `on_change` immediately if a debounced or throttled call is pending
+        """
+
+        if self._change__task is not None:
+            Scheduler.for_widget(self._outer_frame).cancel(self._change__task)
+            self._change__task = None
+
+        if not self._is_change_pending:
+            return
+
+        old_value = self._pending_old_value
+        self._is_change_pending = False
+        self._pending_old_value = None
+        self._last_change_time = monotonic()
+
+        self._on_change(self, old_value)
+
+        # Without a version to check, the source is left to be re-read on the next update interval
+        if self._get_version:
+            self.refresh_source()
+
+        if self.exists and (self.children.get("entry") is not None):
+            self._update_entry_style()
 
     def _update(self):
-        self.__apply_entry_style("entry_unsaved" if self.is_unsaved else "entry_saved")
+        self.refresh_source()
+
+        self._update_entry_style()
 
     def _render(self):
         self.children["entry"] = None
 
         self._apply_frame_stretch(columns=[0], rows=[0])
 
-        # Registering validation callbacks
-        for command_option in ("validatecommand", "invalidcommand"):
-            if command_option in self.styles["entry"]:
-                option_data = self.styles["entry"][command_option]
-                if callable(option_data):
-                    self.styles["entry"][command_option] = self._frame.register(option_data)
-                else:
-                    self.styles["entry"][command_option] = (
-                        self._frame.register(option_data[0]),
-                        *option_data[1:]
-                    )
-
-        entry = Entry(self._frame, textvariable=self._value__var, **self.styles["entry"])
+        entry = Entry(self._frame, textvariable=self._value__var, **{**self.styles["entry"], **self._entry_commands})
         self.children["entry"] = entry
         entry.grid(row=0, column=0, sticky="nswe")
 
         self.__apply_entry_style("entry_saved")
 
+    def _get_style_targets(self):
+        return {
+            **super()._get_style_targets(),
+            "entry": [self.children["entry"]],
+            "entry_saved": [],
+            "entry_unsaved": []
+        }
+
+    def _apply_layered_styles(self):
+        # The saved/unsaved style is layered over the base entry style
+        self._update_entry_style()
+
     def _handle_input(self):
-        old_value = self.value
+        if not self._is_change_pending:
+            self._pending_old_value = self.value
+            self._is_change_pending = True
+
         self.value = self._value__var.get()
 
-        self._on_change(self, old_value)
+        if self.debounce_ms is not None:
+            self._schedule_change(self.debounce_ms, is_rescheduled=True)
+        elif self.throttle_ms is not None:
+            elapsed_ms = None if self._last_change_time is None else (monotonic() - self._last_change_time) * 1000
+
+            if (elapsed_ms is None) or (elapsed_ms >= self.throttle_ms):
+                self.flush_changes()
+            else:
+                self._schedule_change(self.throttle_ms - elapsed_ms, is_rescheduled=False)
+        else:
+            self.flush_changes()
+
+        if self.exists and (self.children.get("entry") is not None):
+            self._update_entry_style()
 
-        if self.exists:
-            self._update()
+    def _schedule_change(self, delay_ms, is_rescheduled):
+        scheduler = Scheduler.for_widget(self._outer_frame)
+
+        if self._change__task is not None:
+            if not is_rescheduled:
+                return
+
+            scheduler.cancel(self._change__task)
+
+        # Scheduled against the Tk root, so that the pending change is not lost if this component is destroyed.
+        # The change is the result of user input, and so is never deferred behind other scheduled work
+        self._change__task = scheduler.schedule(self.__handle_change_delay, int(delay_ms) + 1, priority="interaction")
+
+    def __handle_change_delay(self):
+        self._change__task = None
+        self.flush_changes()
+
+    def _update_entry_style(self):
+        self.__apply_entry_style("entry_unsaved" if self.is_unsaved else "entry_saved")
 
     def __apply_entry_style(self, style_key):
         """
         This method exists to minimise calls to .configure(), as they can impact insertion cursor functionality
         """
 
-        if style_key != self.__entry_style__current:
-            self.__entry_style__current = style_key
-            self.children["entry"].configure(**self.styles[style_key])
+        self._cached_configure(self.children["entry"], **self.styles[style_key])
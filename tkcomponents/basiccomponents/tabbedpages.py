@@ -0,0 +1,179 @@
+from tkinter import Frame, Button, Widget
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Optional
+
+from ..component import Component
+from ..extensions import GridHelper, ConfigCache
+
+
+class TabbedPages(Component.with_extensions(GridHelper, ConfigCache)):
+    def __init__(
+        self, container,
+        pages: tuple[tuple[str, Callable[[Widget], Component]], ...],
+        get_data: Optional[Callable[["TabbedPages"], int]] = None,
+        on_change: Callable[["TabbedPages", int], None] = (lambda tabs, index: None),
+        index: int = 0,
+        max_rendered_pages: Optional[int] = None, max_rendered_widgets: Optional[int] = None,
+        update_interval_ms=None, styles=None
+    ):
+        super().__init__(container, get_data=get_data, on_change=on_change,
+                         update_interval_ms=update_interval_ms, styles=styles)
+
+        """
+        Each page is provided as a tab label and a function which receives a container widget
+        and returns the page's component (unrendered). Page components are only created and rendered the first time
+        their tab is selected, and their update loops are suspended while their tab is not selected.
+
+        If `max_rendered_pages` or `max_rendered_widgets` is provided, the widgets of the least recently selected pages
+        are destroyed once those limits are exceeded. The page components themselves (and so their state) are kept,
+        and are re-rendered from that state when their tab is next selected.
+        The selected page is always kept rendered, regardless of these limits
+        """
+        self.pages = pages
+        self.max_rendered_pages = max_rendered_pages
+        self.max_rendered_widgets = max_rendered_widgets
+
+        styles = styles or {}
+        self.styles["tab_bar"] = styles.get("tab_bar", {})
+        self.styles["tab_button"] = styles.get("tab_button", {})
+        self.styles["tab_button_selected"] = styles.get("tab_button_selected", {})
+        self.styles["page_frame"] = styles.get("page_frame", {})
+
+        self.index = self._get_data(self) if self._get_data else index
+
+        self._page_components: dict[int, Component] = {}
+        self._page_frames: dict[int, Frame] = {}
+        self._rendered_pages: OrderedDict[int, None] = OrderedDict()  # Least recently selected first
+
+    @property
+    def active_page(self) -> Optional[Component]:
+        return self._page_components.get(self.index)
+
+    def _update(self):
+        if self._get_data:
+            new_index = self._get_data(self)
+
+            if new_index != self.index:
+                self._select_page(new_index)
+
+    def _render(self):
+        self.children["tab_bar"] = None
+        self.children["tab_buttons"] = []
+        self.children["page_frame"] = None
+
+        # Pages are created inside this component's frame, so a new render starts them afresh
+        self._page_components = {}
+        self._page_frames = {}
+        self._rendered_pages = OrderedDict()
+
+        self._apply_frame_stretch(rows=[1], columns=[0])
+
+        tab_bar = Frame(self._frame, **self.styles["tab_bar"])
+        self.children["tab_bar"] = tab_bar
+        for page_index, (page_label, get_page) in enumerate(self.pages):
+            button = Button(tab_bar, text=page_label, command=partial(self._handle_click, page_index))
+            self.children["tab_buttons"].append(button)
+            button.grid(row=0, column=page_index, sticky="nswe")
+        tab_bar.grid(row=0, column=0, sticky="nswe")
+
+        page_frame = Frame(self._frame, **self.styles["page_frame"])
+        self.children["page_frame"] = page_frame
+        page_frame.rowconfigure(0, weight=1)
+        page_frame.columnconfigure(0, weight=1)
+        page_frame.grid(row=1, column=0, sticky="nswe")
+
+        self._select_page(self.index, is_forced=True)
+
+    def _get_style_targets(self):
+        tab_buttons = self.children["tab_buttons"]
+
+        return {
+            **super()._get_style_targets(),
+            "tab_bar": [self.children["tab_bar"]],
+            "tab_button": [button for page_index, button in enumerate(tab_buttons) if page_index != self.index],
+            "tab_button_selected": [tab_buttons[self.index]],
+            "page_frame": [self.children["page_frame"]]
+        }
+
+    def _get_child_components(self):
+        # Pages which are not selected stay suspended, whatever happens to this component
+        return [self.active_page] if self.active_page else []
+
+    def _handle_click(self, page_index):
+        if page_index == self.index:
+            return
+
+        self._select_page(page_index)
+
+        self._on_change(self, page_index)
+
+    def _select_page(self, page_index, is_forced=False):
+        if (page_index == self.index) and (not is_forced):
+            return
+
+        previous_page = self.active_page
+        if (previous_page is not None) and (page_index != self.index):
+            previous_page.suspend()
+            self._page_frames[self.index].grid_remove()
+
+        self.index = page_index
+
+        if page_index not in self._page_components:
+            page_label, get_page = self.pages[page_index]
+            self._page_components[page_index] = get_page(self.children["page_frame"])
+        page = self._page_components[page_index]
+
+        if page_index in self._rendered_pages:
+            self._page_frames[page_index].grid()
+            page.resume()
+        else:
+            page.is_suspended = False
+            self._page_frames[page_index] = page.render()
+            self._page_frames[page_index].grid(row=0, column=0, sticky="nswe")
+
+        self._rendered_pages[page_index] = None
+        self._rendered_pages.move_to_end(page_index)
+
+        self._evict_pages()
+        self._set_button_states()
+
+    def _evict_pages(self):
+        def is_over_limit():
+            if (self.max_rendered_pages is not None) and (len(self._rendered_pages) > self.max_rendered_pages):
+                return True
+
+            if self.max_rendered_widgets is not None:
+                total_widgets = sum(
+                    self._count_widgets(self._page_frames[page_index]) for page_index in self._rendered_pages
+                )
+                return total_widgets > self.max_rendered_widgets
+
+            return False
+
+        while (len(self._rendered_pages) > 1) and is_over_limit():
+            page_index = next(iter(self._rendered_pages))  # Never the selected page, as that is always last
+            del self._rendered_pages[page_index]
+
+            self._page_components[page_index].unrender()
+
+    def _set_button_states(self):
+        for page_index, button in enumerate(self.children["tab_buttons"]):
+            if page_index == self.index:
+                self._cached_configure(button, state="disabled", **self.styles["tab_button_selected"])
+            else:
+                self._cached_configure(button, state="normal", **self.styles["tab_button"])
+
+    @staticmethod
+    def _count_widgets(widget):
+        # Counted from tkinter's own record of the widget tree, to avoid querying Tcl
+        widget_count = 0
+
+        widgets_to_count = [widget]
+        while widgets_to_count:
+            widget_to_count = widgets_to_count.pop()
+
+            widget_count += 1
+            widgets_to_count += widget_to_count.children.values()
+
+        return widget_count
@@ -1,14 +1,21 @@
 from tkinter import Label, Button, StringVar
+from typing import Callable, Optional, Sequence, Hashable
 
 from ..component import Component
-from ..extensions import GridHelper
+from ..extensions import GridHelper, ConfigCache
 from .constants import Constants
+from .classes.pagecache import PageCache
 
 
-class TextCarousel(Component.with_extensions(GridHelper)):
+class TextCarousel(Component.with_extensions(GridHelper, ConfigCache)):
     def __init__(self, container,
-                 get_data, on_change=(lambda carousel, increment_amount: None),
-                 amount_to_display=1, index=0, update_interval_ms=None, styles=None):
+                 get_data=None, on_change=(lambda carousel, increment_amount: None),
+                 amount_to_display=1, index=0,
+                 get_page: Optional[Callable[["TextCarousel", int, int], Sequence[str]]] = None,
+                 get_count: Optional[Callable[["TextCarousel"], int]] = None,
+                 page_size: int = 64, max_cached_pages: int = 16,
+                 get_version: Optional[Callable[["TextCarousel"], Hashable]] = None,
+                 update_interval_ms=None, styles=None):
         super().__init__(container, get_data=get_data, on_change=on_change,
                          update_interval_ms=update_interval_ms, styles=styles)
 
@@ -18,13 +25,45 @@ class TextCarousel(Component.with_extensions(GridHelper)):
         self.styles["button"] = styles.get("button", {})
         self.styles["label"] = styles.get("label", {})
 
-        self.values = self._get_data(self)
+        """
+        If `get_page` and `get_count` are provided, they are used in place of `get_data`,
+        so that the full sequence of values never needs to be materialised.
+        `get_page` should return the values from a start index up to (but not including) a stop index,
+        and `get_count` should return the total number of values.
+        Pages are held in an LRU cache, and the windows either side of the displayed one are prefetched when idle.
+
+        If `get_version` is provided, it should return a value which changes whenever the underlying values change,
+        and the cache is only cleared when it does. Otherwise, on each update interval the displayed pages are
+        reloaded and compared against their cached copies, and the cache is only cleared if they differ
+        """
+        self._get_count = get_count
+        self._get_version = get_version
+        self._version = get_version(self) if get_version else None
+        self._page_cache = None
+        if get_page:
+            self._page_cache = PageCache(
+                lambda start, stop: get_page(self, start, stop), page_size=page_size, max_pages=max_cached_pages
+            )
+        self._prefetch__after_id = None
+        self._outer_frame.bind("<Destroy>", self._handle_destroy, add="+")
+
+        self.values = None  # Only populated when a paged data source is not in use
+        self.count = 0
+        self._refresh_values()
 
         self._displayed_text__vars = [StringVar() for i in range(amount_to_display)]
         self._update_displayed_text()
 
+    @property
+    def is_paged(self):
+        return self._page_cache is not None
+
     def _update(self):
-        self.values = self._get_data(self)
+        old_count = self.count
+        self._refresh_values()
+
+        if self.is_paged:
+            self._validate_page_cache(is_count_changed=(self.count != old_count))
 
         self._update_displayed_text()
 
@@ -58,24 +97,96 @@ class TextCarousel(Component.with_extensions(GridHelper)):
 
         self._set_button_states()
 
+    def _get_style_targets(self):
+        return {
+            **super()._get_style_targets(),
+            "button": [self.children["back_button"], self.children["forward_button"]],
+            "label": self.children["labels"]
+        }
+
     def _handle_click(self, increment_amount):
-        self.values = self._get_data(self)
+        self._refresh_values()
 
         self.index += increment_amount
+        self.index = min(self.count - len(self._displayed_text__vars), self.index)
         self.index = max(0, self.index)
-        self.index = min(len(self.values) - len(self._displayed_text__vars), self.index)
 
         self._on_change(self, increment_amount)
 
-        if self.exists:
+        if not self.exists:
+            return
+
+        if self.is_paged:
+            # Pages which are already cached (or have been prefetched) are displayed without being revalidated
+            self._update_displayed_text()
+            self._set_button_states()
+        else:
             self._update()
 
+    def _refresh_values(self):
+        if self.is_paged:
+            self.count = self._get_count(self)
+        else:
+            self.values = self._get_data(self)
+            self.count = len(self.values)
+
+    def _validate_page_cache(self, is_count_changed):
+        if self._get_version:
+            version = self._get_version(self)
+
+            if is_count_changed or (version != self._version):
+                self._version = version
+                self._page_cache.clear()
+
+        elif is_count_changed:
+            self._page_cache.clear()
+
+        else:
+            self._page_cache.revalidate(self.index, self.index + len(self._displayed_text__vars))
+
     def _set_button_states(self):
-        self.children["back_button"].config(state="disabled" if self.index == 0 else "normal")
-        self.children["forward_button"].config(
-            state="disabled" if self.index + len(self._displayed_text__vars) == len(self.values) else "normal")
+        self._cached_configure(self.children["back_button"], state=("disabled" if self.index == 0 else "normal"))
+        self._cached_configure(
+            self.children["forward_button"],
+            state=("disabled" if self.index + len(self._displayed_text__vars) >= self.count else "normal")
+        )
 
     def _update_displayed_text(self):
+        amount_to_display = len(self._displayed_text__vars)
+
+        if self.is_paged:
+            displayed_values = self._page_cache.get_range(self.index, self.index + amount_to_display)
+            self._schedule_prefetch()
+        else:
+            displayed_values = self.values[self.index:self.index + amount_to_display]
+
         for var_index, text__var in enumerate(self._displayed_text__vars):
-            value = self.values[self.index + var_index]
-            text__var.set(value)
+            value = displayed_values[var_index] if var_index < len(displayed_values) else ""
+            self._cached_set(text__var, value)
+
+    def _schedule_prefetch(self):
+        if self._prefetch__after_id is not None:
+            return
+
+        self._prefetch__after_id = self._outer_frame._root().after_idle(self._prefetch_adjacent_windows)
+
+    def _prefetch_adjacent_windows(self):
+        self._prefetch__after_id = None
+
+        if not self.exists:
+            return
+
+        amount_to_display = len(self._displayed_text__vars)
+
+        self._page_cache.prefetch(self.index - amount_to_display, self.index)
+        self._page_cache.prefetch(
+            self.index + amount_to_display, min(self.count, self.index + (2 * amount_to_display))
+        )
+
+    def _handle_destroy(self, event):
+        if str(event.widget) != str(self._outer_frame):
+            return
+
+        if self._prefetch__after_id is not None:
+            self._outer_frame._root().after_cancel(self._prefetch__after_id)
+            self._prefetch__after_id = None
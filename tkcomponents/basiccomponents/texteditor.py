@@ -0,0 +1,256 @@
+from tkinter import Text, Scrollbar
+from codecs import getincrementaldecoder
+from mmap import mmap, ACCESS_READ
+from os import path as os_path, replace, remove
+from tempfile import NamedTemporaryFile
+from typing import Optional
+
+from ..component import Component
+from ..extensions import GridHelper
+
+
+class TextEditor(Component.with_extensions(GridHelper)):
+    CHUNK_SIZE = 256 * 1024
+    LOAD_THRESHOLD = 0.9  # How far through the loaded text the view must be scrolled for the next chunk to load
+    SAVE_BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, container, get_data, on_change=(lambda editor: None), encoding="utf-8",
+                 chunk_size=CHUNK_SIZE, update_interval_ms=None, styles=None):
+        super().__init__(container, get_data=get_data, on_change=on_change,
+                         update_interval_ms=update_interval_ms, styles=styles)
+
+        styles = styles or {}
+        self.styles["text"] = styles.get("text", {})
+        self.styles["scrollbar"] = styles.get("scrollbar", {})
+
+        """
+        `get_data` should return the path of the file to edit.
+        The file is memory-mapped rather than read, and is decoded and inserted into the text widget
+        one chunk at a time as the view is scrolled towards the end of the text loaded so far,
+        so opening a file takes the same time regardless of its size.
+
+        Unsaved state is taken from the text widget's own modified flag, which is set by any edit,
+        rather than by comparing the full text against the file.
+
+        Any bytes which are not valid in `encoding` are carried through the text as escaped surrogate characters,
+        so that they are written back to the file unchanged when it is saved
+        """
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+
+        self.path: Optional[str] = None
+        self._source_path: Optional[str] = None  # The path last returned by `get_data`
+        self._rendered_path: Optional[str] = None
+        self._is_path_changed = False
+        self._file = None
+        self._mmap: Optional[mmap] = None
+        self._decoder = None
+        self._loaded_offset = 0  # How many bytes of the file have been passed to the decoder so far
+        self._load__after_id = None
+
+        self._retained_text: Optional[str] = None  # Holds edited text across a re-render
+        self._is_retained_text_modified = False
+
+        self._outer_frame.bind("<Destroy>", lambda event: self.close(), add="+")
+
+        self._source_path = self._get_data(self)
+        self._open(self._source_path)
+
+    @property
+    def is_fully_loaded(self) -> bool:
+        return (self._mmap is None) or (self._loaded_offset >= len(self._mmap))
+
+    @property
+    def is_unsaved(self) -> bool:
+        text = self.children.get("text")
+        if text is None:
+            return self._is_retained_text_modified
+
+        return bool(text.edit_modified())
+
+    def render(self, on_complete=None):
+        # Any edits made in the current text widget would otherwise be discarded along with it
+        text = self.children.get("text")
+        if (text is not None) and text.winfo_exists() and (self._rendered_path == self.path):
+            self._retained_text = text.get("1.0", "end-1c")
+            self._is_retained_text_modified = bool(text.edit_modified())
+
+        return super().render(on_complete)
+
+    def save(self, file_path: Optional[str] = None) -> None:
+        """
+        Writes the edited text followed by any part of the file which has not yet been loaded.
+        The new file is written alongside the target and then moved into place,
+        after which the editor continues from the newly saved file (even if it differs from the path
+        returned by `get_data`, until that path changes)
+        """
+
+        file_path = file_path or self.path
+        text = self.children["text"]
+
+        loaded_bytes = text.get("1.0", "end-1c").encode(self.encoding, errors="surrogateescape")
+        # Bytes already passed to the decoder which do not yet form a complete character
+        pending_bytes = self._decoder.getstate()[0] if self._decoder else b""
+
+        with NamedTemporaryFile("wb", dir=os_path.dirname(os_path.abspath(file_path)), delete=False) as temp_file:
+            temp_file.write(loaded_bytes)
+            temp_file.write(pending_bytes)
+
+            if self._mmap is not None:
+                for block_start in range(self._loaded_offset, len(self._mmap), self.SAVE_BLOCK_SIZE):
+                    temp_file.write(self._mmap[block_start:block_start + self.SAVE_BLOCK_SIZE])
+
+        # Closed first, as a file which is memory-mapped cannot be replaced on some platforms
+        self.close()
+        try:
+            replace(temp_file.name, file_path)
+        except OSError:
+            remove(temp_file.name)
+
+            # The original file is unchanged, so the rest of it can still be loaded (and saved) from there
+            self._open_file(self.path)
+            raise
+
+        self._open(file_path, loaded_offset=len(loaded_bytes))
+        text.edit_modified(False)
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def _needs_render(self):
+        if self._is_path_changed:
+            self._is_path_changed = False
+            return True
+
+        return False
+
+    def _update(self):
+        new_source_path = self._get_data(self)
+
+        # Compared against the source's last path rather than the open file, which may differ after a save-as
+        if new_source_path != self._source_path:
+            self._source_path = new_source_path
+
+            self.close()
+            self._open(new_source_path)
+            self._is_path_changed = True
+
+    def _render(self):
+        def yscrollcommand(first, last):
+            scrollbar.set(first, last)
+
+            if (float(last) >= self.LOAD_THRESHOLD) and (not self.is_fully_loaded):
+                self._schedule_chunk_load()
+
+        def on_modified(event):
+            if text.edit_modified():
+                self._on_change(self)
+
+        self.children["text"] = None
+        self.children["scrollbar"] = None
+
+        self._apply_frame_stretch(rows=[0], columns=[0])
+
+        self._rendered_path = self.path
+
+        text = Text(self._frame, **self.styles["text"])
+        self.children["text"] = text
+
+        scrollbar = Scrollbar(self._frame, orient="vertical", command=text.yview, **self.styles["scrollbar"])
+        self.children["scrollbar"] = scrollbar
+
+        text.configure(yscrollcommand=yscrollcommand)
+        text.bind("<<Modified>>", on_modified)
+
+        text.grid(row=0, column=0, sticky="nswe")
+        scrollbar.grid(row=0, column=1, sticky="ns")
+
+        if self._retained_text is not None:
+            self._insert_without_modifying(self._retained_text)
+            text.edit_modified(self._is_retained_text_modified)
+
+            self._retained_text = None
+            self._is_retained_text_modified = False
+        else:
+            self._load_chunk()
+
+    def _get_style_targets(self):
+        return {
+            **super()._get_style_targets(),
+            "text": [self.children["text"]],
+            "scrollbar": [self.children["scrollbar"]]
+        }
+
+    def _open(self, file_path, loaded_offset=0):
+        self.path = file_path
+        self._loaded_offset = loaded_offset
+        self._decoder = getincrementaldecoder(self.encoding)(errors="surrogateescape")
+        self._retained_text = None
+        self._is_retained_text_modified = False
+
+        self._open_file(file_path)
+
+    def _open_file(self, file_path):
+        self._file = open(file_path, "rb")
+        if os_path.getsize(file_path) > 0:  # Empty files cannot be memory-mapped
+            self._mmap = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+
+    def _schedule_chunk_load(self):
+        if self._load__after_id is not None:
+            return
+
+        # Deferred so that loading is not triggered recursively by the scroll updates that loading itself causes
+        self._load__after_id = self._outer_frame._root().after_idle(self._handle_chunk_load)
+
+    def _handle_chunk_load(self):
+        self._load__after_id = None
+
+        if self.exists and (self.children.get("text") is not None):
+            self._load_chunk()
+
+    def _load_chunk(self):
+        if self.is_fully_loaded:
+            return
+
+        chunk_start = self._loaded_offset
+        chunk_end = min(len(self._mmap), chunk_start + self.chunk_size)
+
+        # Chunks end on a line break where possible, so that partially loaded lines are not displayed
+        if chunk_end < len(self._mmap):
+            last_line_break = self._mmap.rfind(b"\n", chunk_start, chunk_end)
+            if last_line_break != -1:
+                chunk_end = last_line_break + 1
+
+        self._loaded_offset = chunk_end
+        is_final_chunk = self.is_fully_loaded
+
+        self._insert_without_modifying(
+            self._decoder.decode(self._mmap[chunk_start:chunk_end], final=is_final_chunk)
+        )
+
+    def _insert_without_modifying(self, chunk_text):
+        """
+        Appends text loaded from the file without it counting as an edit,
+        either for the modified flag or for the undo history
+        """
+
+        text = self.children["text"]
+
+        was_modified = text.edit_modified()
+        is_undo_enabled = text.tk.getboolean(text.cget("undo"))
+        if is_undo_enabled:
+            text.configure(undo=False)
+
+        text.insert("end-1c", chunk_text)
+
+        if is_undo_enabled:
+            text.configure(undo=True)
+        if not was_modified:
+            text.edit_modified(False)
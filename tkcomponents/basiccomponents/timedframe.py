@@ -1,6 +1,7 @@
 from abc import ABC
 from tkinter import Frame
-from datetime import datetime
+from time import monotonic
+from typing import Optional
 
 from ..component import Component
 from ..basiccomponents.progressbar import ProgressBar
@@ -8,12 +9,25 @@ from ..basiccomponents.progressbar import ProgressBar
 
 class TimedFrame(Component, ABC):
     def __init__(self, container, duration_ms, on_expire=lambda timed_frame: None, get_data=None, on_change=lambda: None,
-                 update_interval_ms=None, styles=None):
+                 is_expiry_scheduled: bool = True, update_interval_ms=None, styles=None):
         super().__init__(container, get_data=get_data, on_change=on_change,
                          update_interval_ms=update_interval_ms, styles=styles)
 
-        self.started = datetime.now()
+        """
+        Expiry is scheduled directly against a monotonic deadline, independently of the progress bar,
+        so it is neither delayed by the bar's frame rate nor affected by changes to the system clock.
+
+        If `is_expiry_scheduled` is False, this frame will not expire by itself once its deadline passes,
+        and .expire() must instead be called externally (for example, by a manager which expires many frames
+        off a single timer)
+        """
         self.duration_ms = duration_ms
+        self.is_expiry_scheduled = is_expiry_scheduled
+        self.is_expired = False
+
+        self._deadline = monotonic() + (duration_ms / 1000)
+        self._paused_remaining_ms: Optional[float] = None
+        self._expiry__after_id: Optional[str] = None
 
         self._on_expire = on_expire
 
@@ -21,10 +35,88 @@ class TimedFrame(Component, ABC):
         self.styles["progress_bar"] = styles.get("progress_bar", {})
         self.styles["inner_frame"] = styles.get("inner_frame", {})
 
+        self._schedule_expiry()
+
+    @property
+    def is_countdown_paused(self) -> bool:
+        return self._paused_remaining_ms is not None
+
+    @property
+    def remaining_ms(self) -> float:
+        return self._get_remaining_ms(monotonic())
+
+    def pause_countdown(self) -> None:
+        """
+        Stops the countdown to expiry until .resume_countdown() is called.
+        This is separate from .suspend(), which stops this frame's update loops but not its countdown
+        """
+
+        if self.is_countdown_paused or self.is_expired:
+            return
+
+        self._paused_remaining_ms = self.remaining_ms
+        self._cancel_expiry()
+
+    def resume_countdown(self) -> None:
+        if not self.is_countdown_paused:
+            return
+
+        self._deadline = monotonic() + (self._paused_remaining_ms / 1000)
+        self._paused_remaining_ms = None
+        self._schedule_expiry()
+
+    def extend(self, extra_duration_ms: float) -> None:
+        """
+        Pushes back the point at which this frame will expire by the provided amount.
+        The total duration is extended by the same amount, so that the progress bar does not jump backwards
+        """
+
+        if self.is_expired:
+            return
+
+        self.duration_ms += extra_duration_ms
+
+        if self.is_countdown_paused:
+            self._paused_remaining_ms += extra_duration_ms
+        else:
+            self._deadline += extra_duration_ms / 1000
+            self._schedule_expiry()
+
+    def restart(self, duration_ms: Optional[float] = None) -> None:
+        """
+        Restarts the countdown from the beginning, even if this frame has already expired
+        """
+
+        if duration_ms is not None:
+            self.duration_ms = duration_ms
+
+        self.is_expired = False
+        self._paused_remaining_ms = None
+        self._deadline = monotonic() + (self.duration_ms / 1000)
+        self._schedule_expiry()
+
+    def expire(self) -> None:
+        """
+        Expires this frame immediately, if it has not already expired
+        """
+
+        if self.is_expired:
+            return
+
+        self.is_expired = True
+        self._paused_remaining_ms = None
+        self._cancel_expiry()
+
+        self._on_expire(self)
+
     def _refresh_frame(self):
         def get_data__progress_bar(bar):
-            elapsed = datetime.now() - self.started
-            elapsed_proportion = min(1, (elapsed.total_seconds() * 1000) / self.duration_ms)
+            if self.is_expired:
+                return 1
+
+            # The shared clock's frame time is used so that all timed frames animate in sync
+            remaining_ms = min(self.duration_ms, self._get_remaining_ms(bar.clock.now))
+            elapsed_proportion = 1 - (remaining_ms / self.duration_ms)
             return elapsed_proportion
 
         self.children["progress_bar"] = None
@@ -34,8 +126,8 @@ class TimedFrame(Component, ABC):
         self.children["progress_bar"] = ProgressBar(
             self._frame__main,
             get_data=get_data__progress_bar,
-            on_change=lambda bar: self._on_expire(self),
             is_reversed=True,
+            is_clock_driven=True,
             styles={
                 "height": 3,
                 **self.styles["progress_bar"]
@@ -54,3 +146,48 @@ class TimedFrame(Component, ABC):
         self._frame__main.grid(row=0, column=0, sticky="nswe")
         progress_bar_frame.grid(row=1, column=0, sticky="nswe")
         self._frame.grid(row=0, column=0, sticky="nswe")
+
+    def _get_style_targets(self):
+        return {
+            "frame": [self._frame__main],
+            "inner_frame": [self._frame],
+            "progress_bar": [self.children["progress_bar"]]
+        }
+
+    def _get_remaining_ms(self, now):
+        if self.is_countdown_paused:
+            return self._paused_remaining_ms
+
+        return max(0, (self._deadline - now) * 1000)
+
+    def _schedule_expiry(self):
+        """
+        Scheduled against the Tk root rather than any frame in this component,
+        so that the callback is not invalidated when this component's frames are destroyed
+        """
+
+        self._cancel_expiry()
+
+        if not self.is_expiry_scheduled:
+            return
+
+        self._expiry__after_id = self._outer_frame._root().after(
+            max(0, int(self.remaining_ms) + 1), self._handle_deadline
+        )
+
+    def _cancel_expiry(self):
+        if self._expiry__after_id is not None:
+            self._outer_frame._root().after_cancel(self._expiry__after_id)
+            self._expiry__after_id = None
+
+    def _handle_deadline(self):
+        self._expiry__after_id = None
+
+        if not self.exists:
+            return
+
+        if self.remaining_ms > 0:  # Timer callbacks may fire marginally early
+            self._schedule_expiry()
+            return
+
+        self.expire()
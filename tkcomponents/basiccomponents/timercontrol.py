@@ -1,11 +1,12 @@
 from tkinter import Label, Button, StringVar
+from datetime import timedelta
 
 from ..component import Component
-from ..extensions import GridHelper
+from ..extensions import GridHelper, ConfigCache
 from .classes.timer import Timer
 
 
-class TimerControl(Component.with_extensions(GridHelper)):
+class TimerControl(Component.with_extensions(GridHelper, ConfigCache)):
     def __init__(self, container, get_data=None, on_change=(lambda timer_control, method_key: None),
                  update_interval_ms=None, styles=None):
         super().__init__(container, get_data=get_data, on_change=on_change,
@@ -20,12 +21,22 @@ class TimerControl(Component.with_extensions(GridHelper)):
         self._time_elapsed__var = StringVar()
         self._toggle_button__var = StringVar()
 
-        self._time_elapsed__var.set(self.timer.elapsed_string)
-        self._toggle_button__var.set("Stop" if self.timer.is_running else "Start")
+        self._cached_set(self._time_elapsed__var, self.timer.elapsed_string)
+        self._cached_set(self._toggle_button__var, "Stop" if self.timer.is_running else "Start")
+
+        """
+        While the timer is running, the displayed time is refreshed exactly as each second of elapsed time passes
+        (rather than at arbitrary intervals), and not at all while it is stopped.
+        An update interval is only needed if the timer may also be started or stopped from elsewhere
+        """
+        self._tick__after_id = None
+        self._schedule_tick()
 
     def _update(self):
-        self._time_elapsed__var.set(self.timer.elapsed_string)
-        self._toggle_button__var.set("Stop" if self.timer.is_running else "Start")
+        self._cached_set(self._time_elapsed__var, self.timer.elapsed_string)
+        self._cached_set(self._toggle_button__var, "Stop" if self.timer.is_running else "Start")
+
+        self._schedule_tick()
 
     def _render(self):
         self.children["toggle_button"] = None
@@ -52,6 +63,45 @@ class TimerControl(Component.with_extensions(GridHelper)):
         self.children["reset_button"] = reset_button
         reset_button.grid(row=row_index, column=column_index, sticky="nswe")
 
+    def _get_style_targets(self):
+        return {
+            **super()._get_style_targets(),
+            "button": [self.children["toggle_button"], self.children["reset_button"]],
+            "label": [self.children["label"]]
+        }
+
+    def suspend(self):
+        super().suspend()
+
+        self._schedule_tick()
+
+    def resume(self):
+        super().resume()
+
+        self._schedule_tick()
+
+    def _schedule_tick(self):
+        if self.is_suspended or (not self.timer.is_running):
+            if self._tick__after_id is not None:
+                self._outer_frame._root().after_cancel(self._tick__after_id)
+                self._tick__after_id = None
+            return
+
+        if self._tick__after_id is not None:
+            return
+
+        elapsed_ms = self.timer.time_elapsed // timedelta(milliseconds=1)
+        ms_to_next_second = 1000 - (elapsed_ms % 1000)
+
+        # Scheduled against the Tk root, so that the callback is not invalidated if this component is destroyed
+        self._tick__after_id = self._outer_frame._root().after(ms_to_next_second + 1, self._handle_tick)
+
+    def _handle_tick(self):
+        self._tick__after_id = None
+
+        if self.exists:
+            self._update()
+
     def _handle_click(self, method_key):
         if method_key == "toggle":
             if self.timer.is_running:
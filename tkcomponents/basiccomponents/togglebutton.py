@@ -1,9 +1,10 @@
 from tkinter import Button, StringVar
 
 from ..component import Component
+from ..extensions import ConfigCache
 
 
-class ToggleButton(Component):
+class ToggleButton(Component.with_extensions(ConfigCache)):
     def __init__(self, container, text_values=None, get_data=None, on_change=(lambda button: None),
                  update_interval_ms=None, styles=None):
         super().__init__(container, get_data=get_data, on_change=on_change,
@@ -27,7 +28,7 @@ class ToggleButton(Component):
         if self._get_data:
             self.is_on = self._get_data(self)
 
-        self._text__var.set(self._text_values[self.is_on])
+        self._cached_set(self._text__var, self._text_values[self.is_on])
 
     def _render(self):
         self.children["button"] = None
@@ -36,6 +37,12 @@ class ToggleButton(Component):
         self.children["button"] = button
         button.pack(expand=True, fill="both")
 
+    def _get_style_targets(self):
+        return {
+            **super()._get_style_targets(),
+            "button": [self.children["button"]]
+        }
+
     def _handle_click(self):
         if self._get_data:
             self.is_on = self._get_data(self)
@@ -1,8 +1,14 @@
 from objectextensions import Extendable
 
 from abc import ABC
-from tkinter import Frame, Widget
-from typing import Optional, Any, Callable, Dict
+from tkinter import Frame, Widget, Toplevel, EventType
+from functools import partial
+from time import perf_counter
+from types import GeneratorType
+from typing import Optional, Any, Callable, Dict, Iterator
+
+from .styleregistry import StyleRegistry
+from .scheduler import Scheduler, ScheduledTask
 
 
 class Component(Extendable, ABC):
@@ -10,6 +16,10 @@ class Component(Extendable, ABC):
     A blank base component which extends lifecycle methods to be overriden as necessary
     """
 
+    RENDER_SLICE_MS = 10  # The time spent on each slice of a progressive render, before control returns to Tk
+
+    __tracers = ()  # Shared by all components, see .add_tracer()
+
     def __init__(self, container: Widget,
                  get_data: Optional[Callable[["Component"], Any]] = None, on_change: Callable = lambda: None,
                  update_interval_ms: Optional[int] = None, styles: Optional[Dict[str, dict]] = None):
@@ -45,7 +55,43 @@ class Component(Extendable, ABC):
         """
         self.children = {}
 
+        """
+        Counts how many times the outer frame has been laid out (moved or resized) since the start of the last render,
+        so that the layout cost of rendering can be measured.
+        Only counted for renders which take place while a tracer is added (see .add_tracer()),
+        so that components do not otherwise need to handle every <Configure> event
+        """
+        self.layout_passes = 0
+        self.__is_counting_layout_passes = False
+
+        """
+        Whether the outer frame's size should be propagated from its contents.
+        Propagation is suspended during each render and then restored from this attribute,
+        so it should be changed here rather than by calling .grid_propagate() on the outer frame directly
+        """
+        self.is_outer_frame_propagating = True
+
         self._update_interval_ms = update_interval_ms
+        self._update_loop__task: Optional[ScheduledTask] = None
+
+        """
+        Whether the outer frame is currently mapped, as tracked from its <Map> and <Unmap> events rather than queried
+        from Tcl. Used to give the update loops of components which have been hidden by their parent (for example, via
+        .grid_remove() or .pack_forget()) a lower priority. Assumed to be True until the outer frame is unmapped,
+        so that the first updates after rendering are not treated as background work
+        """
+        self.__is_outer_frame_mapped = True
+        self._outer_frame.bind("<Map>", self.__handle_map_change, add="+")
+        self._outer_frame.bind("<Unmap>", self.__handle_map_change, add="+")
+
+        self._render__steps: Optional[Iterator] = None
+        self._render__after_id: Optional[str] = None
+
+        """
+        While suspended, this component (and any child components in self.children) will not run its update loop.
+        Used to avoid updating components which are rendered but not currently visible
+        """
+        self.is_suspended = False
 
         """
         The below function should receive this component instance as a parameter and return any data from the
@@ -53,7 +99,7 @@ class Component(Extendable, ABC):
         Can be None rather than a function, which indicates that there is no need for a data source in the component.
         Other aspects of this component (styles, etc.) can be edited by this function.
         """
-        self._get_data = get_data
+        self.__get_data = get_data
 
         """
         When the state of this component changes, the below function should be called and passed this component instance
@@ -122,25 +168,193 @@ class Component(Extendable, ABC):
 
         return self._frame.winfo_width() - total_buffer
 
-    def render(self) -> Frame:
+    def render(self, on_complete: Optional[Callable[["Component"], None]] = None) -> Frame:
         """
         This method should be invoked externally, and the returned frame have pack() or grid() called on it.
         It will always need to be called at least once, when setting up/populating the parent widget
         to the current instance, but can be called again if its child widgets
-        need to be completely refreshed
+        need to be completely refreshed.
+
+        If `._render()` is a generator, only its first slice is rendered before this method returns
+        and the rest is rendered in later slices (see `._render()`).
+        `on_complete` will be called and passed this component once rendering has finished,
+        unless it is cancelled by this method being called again first
         """
 
-        for child_element in self._outer_frame.winfo_children():
-            child_element.destroy()
-        self._refresh_frame()
+        return self._call_traced("render", self.__render, on_complete)
+
+    def __render(self, on_complete: Optional[Callable[["Component"], None]]) -> Frame:
+        self.__cancel_progressive_render()
 
-        self._render()
+        self.layout_passes = 0
+        if Component.__tracers and not self.__is_counting_layout_passes:
+            self.__is_counting_layout_passes = True
+            self._outer_frame.bind("<Configure>", self.__handle_configure, add="+")
 
-        if self._update_interval_ms:
-            self._frame.after(self._update_interval_ms, self._update_loop)
+        # Fonts and colours are swapped for the shared instances held in the registry before any widgets use them.
+        # This is done in place, so that any references held to these styles remain valid
+        StyleRegistry.for_widget(self._outer_frame).compile_in_place(self.styles)
+
+        # Read from tkinter's own record of the children rather than queried from Tcl
+        old_child_elements = list(self._outer_frame.children.values())
+
+        """
+        The new frame is built while the old one is still displayed. Geometry propagation is suspended and
+        the new frame is kept out of the grid until it is complete, so that the window is laid out once when the frames
+        are swapped rather than repeatedly as child widgets are added.
+
+        Neither the propagation state nor the new frame's geometry manager is queried from Tcl, as within a
+        render transaction (see BatchedRender) each query would force the commands recorded so far to be evaluated.
+        Any widgets created directly in the outer frame by ._refresh_frame() are expected to be gridded
+        """
+        self._outer_frame.grid_propagate(False)
+
+        old_frame, old_children = self._frame, dict(self.children)
+        try:
+            self._call_traced("_refresh_frame", self._refresh_frame)
+
+            new_child_elements = [
+                child_element for child_element in self._outer_frame.children.values()
+                if (child_element not in old_child_elements) and not isinstance(child_element, Toplevel)
+            ]
+            for child_element in new_child_elements:
+                child_element.grid_remove()  # Grid options are remembered, to be restored by .grid()
+
+            render_steps = self._call_traced("_render", self._render)
+
+            # The first slice of a progressive render is carried out before the frames are swapped,
+            # so that the new frame is never displayed empty
+            is_render_complete = True
+            if isinstance(render_steps, GeneratorType):
+                is_render_complete = self._call_traced("_render", self.__run_render_slice, render_steps)
+
+        except Exception:
+            # The incomplete new frame is discarded, and the previous one is left displayed
+            for child_element in list(self._outer_frame.children.values()):
+                if child_element not in old_child_elements:
+                    child_element.destroy()
+
+            self._frame = old_frame
+            self.children.clear()
+            self.children.update(old_children)
+            raise
+
+        finally:
+            self._outer_frame.grid_propagate(self.is_outer_frame_propagating)
+
+        for child_element in new_child_elements:
+            child_element.grid()
+        for child_element in old_child_elements:
+            child_element.destroy()
+
+        if is_render_complete:
+            self.__complete_render(on_complete)
+        else:
+            self._render__steps = render_steps
+            self._render__after_id = self._outer_frame._root().after_idle(
+                partial(self.__continue_progressive_render, on_complete)
+            )
 
         return self._outer_frame
 
+    def restyle(self, styles: Dict[str, Any]) -> None:
+        """
+        Applies new styles to this component without re-rendering it, where possible.
+        The provided styles are diffed against `self.styles`, and only the options which have changed are configured
+        on the existing widgets returned by `._get_style_targets()`. Styles for child components are passed on to
+        those components' own `.restyle()` method.
+
+        Only keys which are already present in `self.styles` are used. If a changed style has no targets,
+        or has had an option removed (which cannot be reverted in place), the component is re-rendered instead.
+        Style dicts should be replaced rather than edited in place before being passed to this method,
+        as otherwise no difference will be found
+        """
+
+        # The provided style dicts are kept (and compiled in place), so that they can still be referred to afterwards
+        StyleRegistry.for_widget(self._outer_frame).compile_in_place(styles)
+
+        is_rendered = (self._frame is not None) and self.exists
+        style_targets = self._get_style_targets() if is_rendered else {}
+        needs_render = False
+
+        for style_key, new_style in styles.items():
+            if style_key not in self.styles:
+                continue
+
+            old_style = self.styles[style_key]
+            self.styles[style_key] = new_style
+
+            if (old_style == new_style) or (not is_rendered):
+                continue
+
+            targets = style_targets.get(style_key)
+            if (targets is None) or not (isinstance(old_style, dict) and isinstance(new_style, dict)):
+                needs_render = True
+                continue
+
+            for target in targets:
+                if isinstance(target, Component):
+                    target.restyle(new_style)
+                    continue
+
+                if old_style.keys() - new_style.keys():
+                    needs_render = True
+                    break
+
+                changed_options = {
+                    option_key: option_value for option_key, option_value in new_style.items()
+                    if (option_key not in old_style) or (old_style[option_key] != option_value)
+                }
+                target.configure(**changed_options)
+
+        if needs_render:
+            self.render()
+        elif is_rendered:
+            self._apply_layered_styles()
+
+    def unrender(self) -> None:
+        """
+        Destroys all of this component's child widgets, while leaving the component object and its state intact.
+        Can be used to free the resources held by a component which will not be displayed for some time;
+        .render() can then be called again to rebuild it from its current state
+        """
+
+        self.__cancel_update_loop()
+        self.__cancel_progressive_render()
+
+        for child_element in list(self._outer_frame.children.values()):
+            child_element.destroy()
+
+        self._frame = None
+        for child_key in self.children:
+            self.children[child_key] = None
+
+    def suspend(self) -> None:
+        """
+        Stops the update loops of this component and any child components, until .resume() is called
+        """
+
+        self.is_suspended = True
+        self.__cancel_update_loop()
+
+        for child_component in self._get_child_components():
+            child_component.suspend()
+
+    def resume(self) -> None:
+        """
+        Restarts the update loops of this component and any child components, and immediately updates them
+        to catch up on any changes missed while suspended
+        """
+
+        self.is_suspended = False
+
+        for child_component in self._get_child_components():
+            child_component.resume()
+
+        if self._frame is not None:
+            self.__schedule_update_loop()
+            self.update()
+
     def update(self) -> None:
         """
         This method is optional and should be invoked externally if necessary,
@@ -150,29 +364,168 @@ class Component(Extendable, ABC):
         if not self.exists:
             return
 
-        self._update()
+        self._call_traced("_update", self._update)
 
         if self._needs_render:
             self.render()
 
+    def __handle_configure(self, event) -> None:
+        if Component.__tracers:
+            self.layout_passes += 1
+
     def _update_loop(self) -> None:
         """
         Used internally to handle updating the component once per update interval (if update interval was provided)
         """
 
-        self._frame.after_cancel(self._update_loop)
+        self._update_loop__task = None
 
         if not self.exists:
             return
 
-        if self._update_interval_ms:
-            self._frame.after(self._update_interval_ms, self._update_loop)
+        self.__schedule_update_loop()
 
-        self._update()
+        self._call_traced("_update", self._update)
 
         if self._needs_render:
             self.render()
 
+    def __run_render_slice(self, render_steps: Iterator) -> bool:
+        """
+        Advances a progressive render until it either finishes or runs out of time for this slice.
+        Returns True if the render has finished
+        """
+
+        slice_end = perf_counter() + (self.RENDER_SLICE_MS / 1000)
+
+        for _ in render_steps:
+            if perf_counter() >= slice_end:
+                return False
+
+        return True
+
+    def __continue_progressive_render(self, on_complete: Optional[Callable[["Component"], None]]) -> None:
+        self._render__after_id = None
+
+        if not self.exists:
+            self.__cancel_progressive_render()
+            return
+
+        if self._call_traced("_render", self.__run_render_slice, self._render__steps):
+            self._render__steps = None
+            self.__complete_render(on_complete)
+        else:
+            # Each slice is scheduled when idle, so that any pending input and redrawing is handled in between
+            self._render__after_id = self._outer_frame._root().after_idle(
+                partial(self.__continue_progressive_render, on_complete)
+            )
+
+    def __cancel_progressive_render(self) -> None:
+        if self._render__after_id is not None:
+            self._outer_frame._root().after_cancel(self._render__after_id)
+            self._render__after_id = None
+
+        if self._render__steps is not None:
+            self._render__steps.close()
+            self._render__steps = None
+
+    def __complete_render(self, on_complete: Optional[Callable[["Component"], None]]) -> None:
+        self.__schedule_update_loop()
+
+        if on_complete:
+            on_complete(self)
+
+    @staticmethod
+    def add_tracer(tracer: Any) -> None:
+        """
+        Adds a tracer which will be notified whenever any component renders, updates or reads from its data source.
+        The tracer should provide a `.begin(component, name)` method, which is called beforehand and may return a token,
+        and an `.end(component, name, token)` method, which is called afterwards with that token.
+        While no tracers have been added, the cost of this is a single check per call
+        """
+
+        if tracer not in Component.__tracers:
+            Component.__tracers = (*Component.__tracers, tracer)
+
+    @staticmethod
+    def remove_tracer(tracer: Any) -> None:
+        Component.__tracers = tuple(
+            added_tracer for added_tracer in Component.__tracers if added_tracer is not tracer
+        )
+
+    def _call_traced(self, name: str, method: Callable, *args) -> Any:
+        """
+        Calls the provided method with the provided args, notifying any tracers before and after.
+        Used internally so that lifecycle methods and data sources can be inspected by diagnostic tools
+        """
+
+        tracers = Component.__tracers
+
+        if not tracers:
+            return method(*args)
+
+        tokens = [tracer.begin(self, name) for tracer in tracers]
+        try:
+            return method(*args)
+        finally:
+            for tracer, token in zip(tracers, tokens):
+                tracer.end(self, name, token)
+
+    def _get_child_components(self) -> list["Component"]:
+        """
+        Returns any Component objects stored in self.children, including those stored within lists and dicts
+        """
+
+        child_components = []
+
+        values_to_check = list(self.children.values())
+        while values_to_check:
+            value = values_to_check.pop()
+
+            if isinstance(value, Component):
+                child_components.append(value)
+            elif isinstance(value, dict):
+                values_to_check += value.values()
+            elif isinstance(value, (list, tuple)):
+                values_to_check += value
+
+        return child_components
+
+    def __schedule_update_loop(self) -> None:
+        # Only one update loop should ever be pending, however many times the component is rendered
+        self.__cancel_update_loop()
+
+        if self._update_interval_ms and not self.is_suspended:
+            # Polling for components which are not currently displayed is only carried out if there is time to spare
+            priority = "visible" if self.__is_outer_frame_mapped else "background"
+
+            self._update_loop__task = Scheduler.for_widget(self._outer_frame).schedule(
+                self._update_loop, self._update_interval_ms, priority=priority
+            )
+
+    def __cancel_update_loop(self) -> None:
+        if self._update_loop__task is not None:
+            Scheduler.for_widget(self._outer_frame).cancel(self._update_loop__task)
+            self._update_loop__task = None
+
+    def __handle_map_change(self, event) -> None:
+        # Any pending update keeps its priority, and the new one is used from the next update onwards
+        self.__is_outer_frame_mapped = (event.type == EventType.Map)
+
+    @property
+    def _get_data(self) -> Optional[Callable[["Component"], Any]]:
+        get_data = self.__get_data
+
+        if (get_data is None) or (not Component.__tracers):
+            return get_data
+
+        return partial(self._call_traced, "get_data", get_data)
+
+    @_get_data.setter
+    def _get_data(self, get_data: Optional[Callable[["Component"], Any]]) -> None:
+        # Subclasses may replace the data source after initialisation, and calls to it will still be traced
+        self.__get_data = get_data
+
     # Overridable Methods
 
     @property
@@ -190,13 +543,42 @@ class Component(Extendable, ABC):
         Overridable method.
         Handles creating a new blank frame to store in self._frame at the top of each render() call.
         Only needs overriding if this blank frame requires extra base functionality
-        before any child components are rendered to it
+        before any child components are rendered to it.
+
+        Any widgets created directly in the outer frame must be laid out with .grid(), as .render() keeps them
+        hidden via .grid_remove() until the new frame is complete. The geometry manager is not checked,
+        so that rendering does not need to query Tcl
         """
 
         self._frame = Frame(self._outer_frame, **self.styles["frame"])
 
         self._frame.grid(row=0, column=0, sticky="nswe")
 
+    def _get_style_targets(self) -> Dict[str, list]:
+        """
+        Overridable method.
+        Should return, for each key in `self.styles`, a list of the currently rendered widgets (or child components)
+        that the style under that key has been applied to. Used by `.restyle()`.
+        Any style keys not included will cause a full re-render if their styles are changed.
+
+        Style keys which are not applied directly to any widgets, but are instead layered over other styles
+        by the component as its state changes, should be given an empty list and re-applied by
+        `._apply_layered_styles()`
+        """
+
+        return {"frame": [self._frame]}
+
+    def _apply_layered_styles(self) -> None:
+        """
+        Overridable method.
+        Called by `.restyle()` after it has configured the widgets returned by `._get_style_targets()`
+        (unless a re-render was needed instead), to re-apply any styles which the component layers over others.
+        If every style is applied directly to the widgets returned by `._get_style_targets()`,
+        this method need not be overridden
+        """
+
+        pass
+
     def _update(self) -> None:
         """
         Overridable method.
@@ -207,10 +589,15 @@ class Component(Extendable, ABC):
 
         pass
 
-    def _render(self) -> None:
+    def _render(self) -> Optional[Iterator]:
         """
         Overridable method.
-        Any child components should be rendered to self._frame in this method
+        Any child components should be rendered to self._frame in this method.
+
+        For components with a large number of children, this method can instead be written as a generator
+        which yields after each child (or group of children) has been added, in the order they should appear.
+        The render is then carried out in slices of up to `.RENDER_SLICE_MS` each, with control returned to Tk
+        in between, so that the application remains responsive while rendering
         """
 
         raise NotImplementedError
@@ -0,0 +1,3 @@
+from .eventloopmonitor import EventLoopMonitor
+from .tracerecorder import TraceRecorder
+from .wastedrenderdetector import WastedRenderDetector
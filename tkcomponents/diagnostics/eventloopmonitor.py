@@ -0,0 +1,161 @@
+from tkinter import Misc
+from collections import deque
+from json import dumps
+from sys import _current_frames
+from threading import Thread, Event, Lock, get_ident
+from time import perf_counter, time
+from traceback import format_stack, extract_stack
+from typing import Optional
+
+from ..component import Component
+
+
+class EventLoopMonitor:
+    """
+    Watches the Tk event loop for delays, so that the cause of any freezes can be identified.
+
+    A heartbeat callback is scheduled every `heartbeat_ms`, and the amount by which it runs late is measured.
+    This is the time that any other callback would also have been kept waiting.
+    Any component render, update or data source call which takes longer than `slow_callback_ms` is recorded
+    along with the component responsible and the call stack at that point.
+
+    If `sample_interval_ms` is provided, a background thread also checks on the heartbeat at that interval,
+    and records the Tk thread's current stack whenever the heartbeat is overdue. This shows what is blocking the
+    event loop even when the blocking code is not part of a component.
+
+    Events are kept in a ring buffer of the most recent `buffer_size` events, and are also written to `log_path`
+    as JSON lines if provided. Nothing is recorded while the event loop is running smoothly
+    """
+
+    def __init__(
+            self, widget: Misc,
+            heartbeat_ms: int = 100, slow_callback_ms: float = 50, buffer_size: int = 1000,
+            log_path: Optional[str] = None, sample_interval_ms: Optional[int] = None
+    ):
+        self._root = widget._root()
+
+        self.heartbeat_ms = heartbeat_ms
+        self.slow_callback_ms = slow_callback_ms
+        self.sample_interval_ms = sample_interval_ms
+
+        self.events = deque(maxlen=buffer_size)
+        self.max_lag_ms = 0.0
+
+        self._log_path = log_path
+        self._log_file = None
+        self._log_lock = Lock()
+
+        self._heartbeat__after_id: Optional[str] = None
+        self._heartbeat__due_time: Optional[float] = None
+
+        self._tk_thread_id: Optional[int] = None
+        self._sampler_thread: Optional[Thread] = None
+        self._sampler_stop = Event()
+
+    @property
+    def is_running(self) -> bool:
+        return self._heartbeat__after_id is not None
+
+    def start(self) -> None:
+        """
+        Should be called from the thread running the Tk event loop
+        """
+
+        if self.is_running:
+            return
+
+        if self._log_path:
+            self._log_file = open(self._log_path, "a", encoding="utf-8")
+
+        Component.add_tracer(self)
+        self._schedule_heartbeat()
+
+        if self.sample_interval_ms:
+            self._tk_thread_id = get_ident()
+            self._sampler_stop.clear()
+            self._sampler_thread = Thread(target=self._run_sampler, name="EventLoopMonitor", daemon=True)
+            self._sampler_thread.start()
+
+    def stop(self) -> None:
+        if not self.is_running:
+            return
+
+        Component.remove_tracer(self)
+
+        self._root.after_cancel(self._heartbeat__after_id)
+        self._heartbeat__after_id = None
+        self._heartbeat__due_time = None
+
+        if self._sampler_thread:
+            self._sampler_stop.set()
+            self._sampler_thread.join()
+            self._sampler_thread = None
+
+        with self._log_lock:
+            if self._log_file:
+                self._log_file.close()
+                self._log_file = None
+
+    # Tracer methods, called by Component
+
+    def begin(self, component: Component, name: str) -> float:
+        return perf_counter()
+
+    def end(self, component: Component, name: str, start_time: float) -> None:
+        duration_ms = (perf_counter() - start_time) * 1000
+
+        if duration_ms >= self.slow_callback_ms:
+            self._record({
+                "type": "slow_callback",
+                "component": f"{type(component).__name__} {component._outer_frame}",
+                "name": name,
+                "duration_ms": round(duration_ms, 3),
+                "stack": format_stack()[:-1]  # Excludes this method
+            })
+
+    def _schedule_heartbeat(self) -> None:
+        self._heartbeat__due_time = perf_counter() + (self.heartbeat_ms / 1000)
+        self._heartbeat__after_id = self._root.after(self.heartbeat_ms, self._handle_heartbeat)
+
+    def _handle_heartbeat(self) -> None:
+        lag_ms = (perf_counter() - self._heartbeat__due_time) * 1000
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+
+        if lag_ms >= self.slow_callback_ms:
+            self._record({
+                "type": "lag",
+                "lag_ms": round(lag_ms, 3)
+            })
+
+        self._schedule_heartbeat()
+
+    def _run_sampler(self) -> None:
+        while not self._sampler_stop.wait(self.sample_interval_ms / 1000):
+            due_time = self._heartbeat__due_time
+            if due_time is None:
+                continue
+
+            overdue_ms = (perf_counter() - due_time) * 1000
+            if overdue_ms < self.slow_callback_ms:
+                continue
+
+            frame = _current_frames().get(self._tk_thread_id)
+            if frame is None:
+                continue
+
+            self._record({
+                "type": "blocked_sample",
+                "overdue_ms": round(overdue_ms, 3),
+                "stack": [
+                    f"{summary.filename}:{summary.lineno} in {summary.name}" for summary in extract_stack(frame)
+                ]
+            })
+
+    def _record(self, event: dict) -> None:
+        event["time"] = time()
+        self.events.append(event)
+
+        with self._log_lock:
+            if self._log_file:
+                self._log_file.write(dumps(event) + "\n")
+                self._log_file.flush()
@@ -0,0 +1,92 @@
+from tkinter import Misc
+from collections import deque
+from json import dump
+from os import getpid
+from threading import get_ident
+from time import monotonic_ns
+from typing import Optional
+
+from ..component import Component
+
+
+class TraceRecorder:
+    """
+    Records a timeline of component lifecycle calls (render, _refresh_frame, _render, _update, get_data and
+    ScrollFrame's get_size), which can be saved in Chrome's trace event format and opened in Perfetto
+    or chrome://tracing. Calls made within other calls (such as a StepperTable rendering its Steppers)
+    are shown nested beneath them.
+
+    Spans are timed with monotonic nanosecond timestamps, and only the most recent `buffer_size` spans are kept
+    """
+
+    def __init__(self, widget: Misc, buffer_size: int = 100000):
+        self._root = widget._root()
+
+        self.spans = deque(maxlen=buffer_size)  # (name, component class, component path, thread, start ns, end ns)
+
+        self._stop__after_id: Optional[str] = None
+        self.is_running = False
+
+    def start(self, duration_ms: Optional[int] = None) -> None:
+        """
+        Starts recording. If `duration_ms` is provided, recording will stop automatically after that long
+        """
+
+        if not self.is_running:
+            self.is_running = True
+            Component.add_tracer(self)
+
+        if duration_ms is not None:
+            if self._stop__after_id is not None:
+                self._root.after_cancel(self._stop__after_id)
+            self._stop__after_id = self._root.after(duration_ms, self.stop)
+
+    def stop(self) -> None:
+        if self._stop__after_id is not None:
+            self._root.after_cancel(self._stop__after_id)
+            self._stop__after_id = None
+
+        if self.is_running:
+            self.is_running = False
+            Component.remove_tracer(self)
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+    def get_trace(self) -> dict:
+        """
+        Returns the recorded spans as a dict in Chrome's trace event format
+        """
+
+        process_id = getpid()
+
+        # Trace event timestamps are in microseconds, but may be fractional to retain the full precision
+        trace_events = [
+            {
+                "name": name,
+                "cat": component_cls_name,
+                "ph": "X",
+                "ts": start_ns / 1000,
+                "dur": (end_ns - start_ns) / 1000,
+                "pid": process_id,
+                "tid": thread_id,
+                "args": {"component": component_path}
+            }
+            for name, component_cls_name, component_path, thread_id, start_ns, end_ns in self.spans
+        ]
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ns"}
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as trace_file:
+            dump(self.get_trace(), trace_file)
+
+    # Tracer methods, called by Component
+
+    def begin(self, component: Component, name: str) -> int:
+        return monotonic_ns()
+
+    def end(self, component: Component, name: str, start_ns: int) -> None:
+        self.spans.append((
+            name, type(component).__name__, str(component._outer_frame), get_ident(), start_ns, monotonic_ns()
+        ))
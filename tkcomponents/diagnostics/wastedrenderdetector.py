@@ -0,0 +1,174 @@
+from tkinter import Misc, TclError
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional
+
+from ..component import Component
+
+
+class WastedRenderDetector:
+    """
+    Finds renders which leave a component's widgets exactly as they were, so that the render could have been skipped.
+
+    The component's widget tree is fingerprinted before and after each render, from the class, options and
+    geometry manager placement of every widget in it. Renders with matching fingerprints are counted as wasted,
+    along with the time they took. Widget names, callback commands and variable names are left out of the
+    fingerprint as they are generated afresh on every render, but the values of any variables are included.
+    Content which is not held in widget options (such as canvas items or the text in a Text widget) is not compared.
+
+    `on_wasted_render` is called with the component and the render's duration in ms whenever a wasted render is found.
+    Fingerprinting is slow for large widget trees, so this should only be used while debugging
+    """
+
+    IGNORED_OPTIONS = frozenset({
+        "command", "xscrollcommand", "yscrollcommand", "validatecommand", "vcmd", "invalidcommand", "invcmd",
+        "postcommand", "tearoffcommand"
+    })
+    VARIABLE_OPTIONS = frozenset({"variable", "textvariable", "listvariable"})
+
+    def __init__(self, on_wasted_render: Callable[[Component, float], None] = (lambda component, duration_ms: None)):
+        self.on_wasted_render = on_wasted_render
+
+        # Keyed by the component's class name and outer frame path
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+        # Progressive renders which have not finished yet, keyed by component
+        self._pending_renders: Dict[Component, list] = {}  # [fingerprint before render, duration so far in seconds]
+
+        self.is_running = False
+
+    def start(self) -> None:
+        if not self.is_running:
+            self.is_running = True
+            Component.add_tracer(self)
+
+    def stop(self) -> None:
+        if self.is_running:
+            self.is_running = False
+            Component.remove_tracer(self)
+
+        self._pending_renders.clear()
+
+    def clear(self) -> None:
+        self.stats.clear()
+
+    def get_report(self) -> list[tuple[str, int, int, float]]:
+        """
+        Returns a (component, renders, wasted renders, wasted time in ms) tuple for each component which has been
+        rendered, with the components which have wasted the most time first
+        """
+
+        return sorted(
+            (
+                (component_key, stats["renders"], stats["wasted_renders"], round(stats["wasted_ms"], 3))
+                for component_key, stats in self.stats.items()
+            ),
+            key=lambda row: row[3], reverse=True
+        )
+
+    # Tracer methods, called by Component
+
+    def begin(self, component: Component, name: str) -> Optional[tuple]:
+        if name == "render":
+            # Any unfinished progressive render is cancelled by the new one
+            self._pending_renders.pop(component, None)
+
+            fingerprint = self.get_fingerprint(component._outer_frame)
+            return fingerprint, perf_counter()  # Timed after fingerprinting, so that its cost is not included
+
+        if (name == "_render") and (component in self._pending_renders):
+            return None, perf_counter()
+
+        return None
+
+    def end(self, component: Component, name: str, token: Optional[tuple]) -> None:
+        if token is None:
+            return
+
+        fingerprint, start_time = token
+        duration = perf_counter() - start_time
+
+        if name == "render":
+            # Progressive renders are compared once their final slice has been rendered
+            if component._render__steps is not None:
+                self._pending_renders[component] = [fingerprint, duration]
+                return
+
+            self._compare(component, fingerprint, duration)
+
+        else:  # A later slice of a progressive render
+            pending_render = self._pending_renders.get(component)
+            if pending_render is None:
+                return
+
+            pending_render[1] += duration
+
+            # The component only marks its render as finished after this slice returns
+            component._outer_frame._root().after_idle(self._check_pending_render, component, pending_render)
+
+    def _check_pending_render(self, component: Component, pending_render: list) -> None:
+        if (self._pending_renders.get(component) is not pending_render) or (component._render__steps is not None):
+            return
+
+        del self._pending_renders[component]
+
+        fingerprint, duration = pending_render
+        self._compare(component, fingerprint, duration)
+
+    def _compare(self, component: Component, fingerprint: tuple, duration: float) -> None:
+        component_key = f"{type(component).__name__} {component._outer_frame}"
+        if component_key not in self.stats:
+            self.stats[component_key] = {
+                "renders": 0,
+                "wasted_renders": 0,
+                "wasted_ms": 0.0
+            }
+        stats = self.stats[component_key]
+        stats["renders"] += 1
+
+        if not component.exists:
+            return
+
+        if self.get_fingerprint(component._outer_frame) == fingerprint:
+            duration_ms = duration * 1000
+
+            stats["wasted_renders"] += 1
+            stats["wasted_ms"] += duration_ms
+
+            self.on_wasted_render(component, duration_ms)
+
+    @staticmethod
+    def get_fingerprint(widget: Misc) -> tuple:
+        """
+        Returns a nested tuple describing the provided widget and all of its descendants.
+        Descendants are described in the order they were created, without their names
+        """
+
+        options = []
+        for option, option_details in sorted(widget.configure().items()):
+            if (len(option_details) < 5) or (option in WastedRenderDetector.IGNORED_OPTIONS):
+                continue  # Aliases such as "bg" only have 2 details, and would duplicate the full option
+
+            value = str(option_details[-1])
+            if (option in WastedRenderDetector.VARIABLE_OPTIONS) and value:
+                try:
+                    value = str(widget.tk.globalgetvar(value))
+                except TclError:  # Variable not yet set
+                    value = ""
+
+            options.append((option, value))
+
+        manager = widget.winfo_manager()
+        placement = ()
+        if manager in ("grid", "pack", "place"):
+            placement = tuple(
+                (key, str(value)) for key, value in sorted(getattr(widget, f"{manager}_info")().items())
+                if key != "in"
+            )
+
+        return (
+            widget.winfo_class(),
+            tuple(options),
+            manager,
+            placement,
+            tuple(WastedRenderDetector.get_fingerprint(child) for child in widget.children.values())
+        )
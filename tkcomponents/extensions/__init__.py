@@ -1,2 +1,6 @@
 from .gridhelper import GridHelper
 from .draganddrop import DragAndDrop
+from .configcache import ConfigCache
+from .batchedrender import BatchedRender
+
+from .classes.gridlayout import GridLayout
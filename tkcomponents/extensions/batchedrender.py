@@ -0,0 +1,70 @@
+from objectextensions import Extension
+
+from ..component import Component
+from .classes.tclrecorder import TclRecorder
+
+
+class BatchedRender(Extension):
+    """
+    Runs each render of the component as a transaction. Tcl commands which only write to the widget tree
+    (creating, configuring, laying out and binding widgets) are recorded while the component and any child
+    components are rendering, and are then evaluated together in a single call once the render has finished.
+
+    Widgets created during the render can be used as normal; if one is queried before the transaction is committed,
+    any commands recorded up to that point are evaluated first
+    """
+
+    @staticmethod
+    def can_extend(target_cls):
+        return issubclass(target_cls, Component)
+
+    @staticmethod
+    def extend(target_cls):
+        Extension._wrap(target_cls, "_refresh_frame", BatchedRender.__wrap_refresh_frame)
+        Extension._wrap(target_cls, "_render", BatchedRender.__wrap_render)
+
+    def __wrap_refresh_frame(self, *args, **kwargs):
+        outer_tk = self._outer_frame.tk
+
+        # If this component is being rendered as part of a parent component's transaction, it joins that transaction
+        if not (isinstance(outer_tk, TclRecorder) and outer_tk.is_recording and (outer_tk.owner is not self)):
+            if isinstance(outer_tk, TclRecorder):  # Left over from a previous render which raised an error
+                BatchedRender.__commit(self, outer_tk)
+                outer_tk = outer_tk.tk
+
+            # Widgets take their interpreter from their parent, so everything created beneath the frame will record
+            self._outer_frame.tk = TclRecorder(outer_tk, owner=self)
+
+        yield
+
+    def __wrap_render(self, *args, **kwargs):
+        yield
+
+        recorder = self._outer_frame.tk
+        if isinstance(recorder, TclRecorder) and (recorder.owner is self):
+            BatchedRender.__commit(self, recorder)
+
+    @staticmethod
+    def __commit(component, recorder: TclRecorder) -> None:
+        recorder.stop()
+
+        # Hands the widgets created during the transaction back to the interpreter itself
+        widgets = [component._outer_frame]
+        while widgets:
+            widget = widgets.pop()
+
+            if widget.tk is recorder:
+                widget.tk = recorder.tk
+            widgets += widget.children.values()
+
+        if "render_transactions" not in component._extension_data:
+            component._extension_data["render_transactions"] = {
+                "commits": 0,
+                "commands_recorded": 0,
+                "flushes": 0
+            }
+
+        stats = component._extension_data["render_transactions"]
+        stats["commits"] += 1
+        stats["commands_recorded"] += recorder.commands_recorded
+        stats["flushes"] += recorder.flushes
@@ -0,0 +1,137 @@
+from tkinter import Misc, Widget
+from itertools import count
+from weakref import WeakKeyDictionary, ref, finalize
+from typing import Callable
+
+
+class DragBindtags:
+    """
+    Makes widgets draggable by inserting a bindtag into their bindtags list, rather than binding a handler to each
+    widget individually. Each draggable component gets one bindtag, and its handler is bound to that tag only once,
+    so any number of widgets (across any number of renders) can share a single Tcl command.
+
+    Subtrees registered as recursive are tracked by path. Widgets created under them later on are tagged
+    when they are first mapped, via one <Map> binding per toplevel window
+    """
+
+    TAG_PREFIX = "tkcomponents_drag_"
+
+    __instances = WeakKeyDictionary()  # Keyed by Tk root
+    __tag_ids = count()
+
+    def __init__(self, root: Misc):
+        self._root = root
+
+        self._tags = WeakKeyDictionary()  # Keyed by component
+        self._subtree_tags = {}  # Subtree root path: set of tags applied to every widget beneath it
+        self._bound_toplevels = set()
+
+    @classmethod
+    def for_widget(cls, widget: Misc) -> "DragBindtags":
+        """
+        Returns the registry shared by all widgets under the same Tk root as the provided widget
+        """
+
+        root = widget._root()
+
+        if root not in cls.__instances:
+            cls.__instances[root] = cls(root)
+        return cls.__instances[root]
+
+    def get_tag(self, component, on_press: Callable) -> str:
+        """
+        Returns the bindtag for the provided component, binding `on_press(component, event)` to it if it is new.
+        The binding is removed once the component has been garbage collected
+        """
+
+        if component in self._tags:
+            return self._tags[component]
+
+        tag = f"{DragBindtags.TAG_PREFIX}{next(DragBindtags.__tag_ids)}"
+        component_ref = ref(component)
+
+        def handle_press(event):
+            bound_component = component_ref()
+            if bound_component is not None:
+                on_press(bound_component, event)
+
+        command_name = self._root.bind_class(tag, "<Button-1>", handle_press)
+
+        def remove_binding():
+            try:
+                self._root.unbind_class(tag, "<Button-1>")
+                self._root.deletecommand(command_name)
+            except Exception:
+                pass  # The Tk root may already have been destroyed
+
+        self._tags[component] = tag
+        finalize(component, remove_binding)
+
+        return tag
+
+    def add(self, widget: Widget, tag: str, is_recursive: bool = False) -> None:
+        """
+        Applies the bindtag to the widget. If `is_recursive` is True, it is also applied to every widget
+        beneath it, including any which are created after this method is called
+        """
+
+        self._apply(widget, tag)
+
+        if not is_recursive:
+            return
+
+        # Drops any subtrees which have since been destroyed, so that re-rendered trees do not accumulate
+        for path in [path for path in self._subtree_tags if not self._root.tk.call("winfo", "exists", path)]:
+            del self._subtree_tags[path]
+
+        self._subtree_tags.setdefault(str(widget), set()).add(tag)
+        self._bind_toplevel(widget)
+
+        widgets_to_add = widget.winfo_children()
+        while widgets_to_add:
+            child_widgets_to_add = []
+
+            for widget_to_add in widgets_to_add:
+                self._apply(widget_to_add, tag)
+                child_widgets_to_add += widget_to_add.winfo_children()
+
+            widgets_to_add = child_widgets_to_add
+
+    def _bind_toplevel(self, widget: Widget) -> None:
+        # Any widget's <Map> event is also delivered to bindings on its toplevel window
+        toplevel = widget.winfo_toplevel()
+
+        if str(toplevel) not in self._bound_toplevels:
+            self._bound_toplevels.add(str(toplevel))
+            toplevel.bind("<Map>", self._handle_map, add="+")
+            toplevel.bind("<Destroy>", self._handle_destroy, add="+")
+
+    def _handle_map(self, event) -> None:
+        if not self._subtree_tags:
+            return
+
+        path = str(event.widget)
+
+        # Checks each ancestor path in turn, so the cost depends on the widget's depth rather than the number of subtrees
+        tags = set()
+        ancestor_path = path
+        while "." in ancestor_path[1:]:
+            ancestor_path = ancestor_path.rsplit(".", 1)[0]
+            tags |= self._subtree_tags.get(ancestor_path, set())
+        tags |= self._subtree_tags.get(".", set())
+
+        if tags:
+            widget = self._root.nametowidget(path)
+            for tag in tags:
+                self._apply(widget, tag)
+
+    def _handle_destroy(self, event) -> None:
+        # A new toplevel window may later be created with the same path, and will need its own binding
+        self._bound_toplevels.discard(str(event.widget))
+
+    @staticmethod
+    def _apply(widget: Widget, tag: str) -> None:
+        bindtags = widget.bindtags()
+
+        if tag not in bindtags:
+            widget.bindtags((tag, *bindtags))
@@ -0,0 +1,104 @@
+from tkinter import Toplevel, TclError
+from tkinter.dnd import DndHandler
+from typing import Optional
+
+from .droptargetindex import DropTargetIndex
+
+
+class DragHandler(DndHandler):
+    """
+    A drop-in replacement for `tkinter.dnd.DndHandler`.
+
+    Motion events are coalesced so that at most one is processed per `MOTION_INTERVAL_MS`,
+    and drop targets are looked up in a `DropTargetIndex` rather than by walking the widget hierarchy.
+    If the source has a `dnd_ghost_style`, a plain window styled with it follows the cursor for the duration
+    of the drag, so that no real widgets need to be moved to give visual feedback
+    """
+
+    MOTION_INTERVAL_MS = 16
+    GHOST_ALPHA = 0.6
+
+    def __init__(self, source, event):
+        super().__init__(source, event)
+
+        if self.root is None:  # Another drag is already in progress
+            return
+
+        self._index = DropTargetIndex.for_widget(event.widget)
+
+        self._pending_motion_event = None
+        self._motion__after_id: Optional[str] = None
+
+        self._ghost: Optional[Toplevel] = None
+        self._ghost_offset = (0, 0)
+        if getattr(source, "dnd_ghost_style", None) is not None:
+            self._create_ghost(event)
+
+    @classmethod
+    def start(cls, source, event) -> Optional["DragHandler"]:
+        handler = cls(source, event)
+
+        return handler if (handler.root is not None) else None
+
+    def on_motion(self, event):
+        self._pending_motion_event = event
+
+        if self._motion__after_id is None:
+            self._motion__after_id = self.root.after(self.MOTION_INTERVAL_MS, self._process_motion)
+
+    def finish(self, event, commit=0):
+        # The target must reflect the latest cursor position before the drop is resolved
+        self._process_motion()
+
+        if self._ghost is not None:
+            self._ghost.destroy()
+            self._ghost = None
+
+        super().finish(event, commit)
+
+    def _process_motion(self):
+        if self._motion__after_id is not None:
+            self.root.after_cancel(self._motion__after_id)
+            self._motion__after_id = None
+
+        event = self._pending_motion_event
+        if event is None:
+            return
+        self._pending_motion_event = None
+
+        if self._ghost is not None:
+            self._ghost.geometry(f"+{event.x_root - self._ghost_offset[0]}+{event.y_root - self._ghost_offset[1]}")
+
+        new_target = None
+        for candidate in self._index.find_targets(event.x_root, event.y_root):
+            new_target = candidate.dnd_accept(self.source, event)
+            if new_target is not None:
+                break
+
+        old_target = self.target
+        if old_target is new_target:
+            if old_target is not None:
+                old_target.dnd_motion(self.source, event)
+        else:
+            if old_target is not None:
+                self.target = None
+                old_target.dnd_leave(self.source, event)
+            if new_target is not None:
+                new_target.dnd_enter(self.source, event)
+                self.target = new_target
+
+    def _create_ghost(self, event):
+        source_frame = self.source._frame
+        self._ghost_offset = (event.x_root - source_frame.winfo_rootx(), event.y_root - source_frame.winfo_rooty())
+
+        self._ghost = Toplevel(
+            self.root, width=source_frame.winfo_width(), height=source_frame.winfo_height(),
+            **self.source.dnd_ghost_style
+        )
+        self._ghost.overrideredirect(True)
+        self._ghost.geometry(f"+{event.x_root - self._ghost_offset[0]}+{event.y_root - self._ghost_offset[1]}")
+
+        try:
+            self._ghost.attributes("-alpha", self.GHOST_ALPHA)
+        except TclError:
+            pass  # Transparency is not supported on every platform
@@ -0,0 +1,96 @@
+from tkinter import Misc
+from weakref import WeakKeyDictionary, WeakSet
+
+
+class DropTargetIndex:
+    """
+    Tracks the on-screen rectangles of every rendered drop target under the same Tk root,
+    so that the target under the cursor can be found without walking up the widget hierarchy on each motion event.
+
+    Rectangles are only re-measured after a <Configure> event has occurred somewhere in a window
+    containing a registered target, since that is the only way their positions can change
+    """
+
+    __instances = WeakKeyDictionary()  # Keyed by Tk root
+
+    def __init__(self, root: Misc):
+        self._root = root
+
+        self._targets = WeakSet()
+        self._bound_toplevels = set()
+
+        self._rects = []
+        self._is_stale = True
+
+    @classmethod
+    def for_widget(cls, widget: Misc) -> "DropTargetIndex":
+        """
+        Returns the index shared by all widgets under the same Tk root as the provided widget
+        """
+
+        root = widget._root()
+
+        if root not in cls.__instances:
+            cls.__instances[root] = cls(root)
+        return cls.__instances[root]
+
+    def register(self, target) -> None:
+        """
+        The provided target should be a rendered component with drag-and-drop functionality.
+        Registering the same target more than once (for example, on each render) has no further effect
+        """
+
+        self._targets.add(target)
+        self.invalidate()
+
+        # Any widget's <Configure> event is also delivered to bindings on its toplevel window
+        toplevel = target._frame.winfo_toplevel()
+        if str(toplevel) not in self._bound_toplevels:
+            self._bound_toplevels.add(str(toplevel))
+            toplevel.bind("<Configure>", lambda event: self.invalidate(), add="+")
+            toplevel.bind("<Destroy>", self._handle_destroy, add="+")
+
+    def invalidate(self) -> None:
+        self._is_stale = True
+
+    def find_targets(self, x_root: int, y_root: int) -> list:
+        """
+        Returns every registered target whose rectangle contains the provided screen coordinates,
+        innermost (smallest) first
+        """
+
+        if self._is_stale:
+            self._measure()
+
+        containing_rects = [
+            rect for rect in self._rects
+            if (rect[0] <= x_root < rect[2]) and (rect[1] <= y_root < rect[3])
+        ]
+        containing_rects.sort(key=lambda rect: (rect[2] - rect[0]) * (rect[3] - rect[1]))
+
+        return [rect[4] for rect in containing_rects]
+
+    def _measure(self) -> None:
+        self._rects = []
+
+        for target in list(self._targets):
+            frame = target._frame
+
+            if (frame is None) or (not frame.winfo_exists()) or (not frame.winfo_viewable()):
+                continue
+
+            x, y = frame.winfo_rootx(), frame.winfo_rooty()
+            self._rects.append((x, y, x + frame.winfo_width(), y + frame.winfo_height(), target))
+
+        self._is_stale = False
+
+    def _handle_destroy(self, event) -> None:
+        """
+        A new toplevel window may later be created with the same path, and will need its own bindings
+        """
+
+        # Any widget's <Destroy> event is also delivered to bindings on its toplevel window
+        toplevel_path = str(event.widget)
+        if toplevel_path in self._bound_toplevels:
+            self._bound_toplevels.discard(toplevel_path)
+            self.invalidate()
@@ -0,0 +1,127 @@
+from functools import lru_cache
+from typing import Iterable, Mapping, Optional, Sequence
+
+
+class GridLayout:
+    """
+    A declarative description of how a frame's child widgets are arranged in its grid.
+
+    The layout is compiled into a Tcl script the first time it is applied, with the widgets in each row
+    gridded by a single `grid` command and rows/columns which share a weight or minimum size configured together.
+    Applying the layout then costs one script evaluation, regardless of how many widgets it arranges.
+    Layouts are immutable, so one instance can be shared by every component that needs it
+    """
+
+    def __init__(
+            self, cells: Sequence[tuple[int, int]],
+            row_weights: Optional[Mapping[int, int]] = None, column_weights: Optional[Mapping[int, int]] = None,
+            row_minsizes: Optional[Mapping[int, int]] = None, column_minsizes: Optional[Mapping[int, int]] = None,
+            sticky: str = "nswe"
+    ):
+        """
+        Each item in `cells` is the (row, column) position for the widget at the same index
+        in the sequence of widgets which the layout is later applied to
+        """
+
+        self.cells = tuple(cells)
+
+        self.row_weights = dict(row_weights or {})
+        self.column_weights = dict(column_weights or {})
+        self.row_minsizes = dict(row_minsizes or {})
+        self.column_minsizes = dict(column_minsizes or {})
+
+        self.sticky = sticky
+
+        self.__script: Optional[str] = None
+
+    @staticmethod
+    def line(length: int, is_horizontal: bool = True, stretch: Iterable[int] = (), sticky: str = "nswe") -> "GridLayout":
+        """
+        Returns a layout which places `length` widgets side by side in a single row (or a single column,
+        if `is_horizontal` is False). The indices in `stretch` refer to positions along the line which
+        should expand to fill any extra space, and the other axis is always stretched.
+        Identical layouts are only created (and compiled) once
+        """
+
+        # Converted so that any iterable can be used as a cache key, and so that equivalent orderings share a layout
+        return GridLayout.__create_line(length, is_horizontal, tuple(sorted(set(stretch))), sticky)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def __create_line(length: int, is_horizontal: bool, stretch: tuple[int, ...], sticky: str) -> "GridLayout":
+        if is_horizontal:
+            return GridLayout(
+                [(0, column_index) for column_index in range(length)],
+                row_weights={0: 1}, column_weights={index: 1 for index in stretch}, sticky=sticky
+            )
+        else:
+            return GridLayout(
+                [(row_index, 0) for row_index in range(length)],
+                row_weights={index: 1 for index in stretch}, column_weights={0: 1}, sticky=sticky
+            )
+
+    @property
+    def script(self) -> str:
+        """
+        The compiled Tcl script, as a format string.
+        Field 0 is the path of the frame being laid out, and field n is the path of the (n-1)th widget
+        """
+
+        if self.__script is None:
+            self.__script = self.__compile()
+
+        return self.__script
+
+    def apply(self, frame, widgets: Sequence) -> None:
+        if len(widgets) != len(self.cells):
+            raise ValueError
+
+        script = self.script.format(str(frame), *(str(widget) for widget in widgets))
+
+        # Within a render transaction, the script can be deferred along with the widget creation it depends on
+        record = getattr(frame.tk, "record", None)
+        if record:
+            record("eval", script)
+        else:
+            frame.tk.eval(script)
+
+    def __compile(self) -> str:
+        commands = []
+
+        for axis, option, values in (
+                ("rowconfigure", "weight", self.row_weights), ("columnconfigure", "weight", self.column_weights),
+                ("rowconfigure", "minsize", self.row_minsizes), ("columnconfigure", "minsize", self.column_minsizes)
+        ):
+            indices_by_value = {}
+            for index, value in sorted(values.items()):
+                indices_by_value.setdefault(value, []).append(str(index))
+
+            for value, indices in indices_by_value.items():
+                commands.append(f"grid {axis} {{0}} {{{{{' '.join(indices)}}}}} -{option} {value}")
+
+        """
+        Widgets in the same row share one command. Within a `grid` command, each widget is placed in the column after
+        the previous one, and "x" leaves a column empty
+        """
+        cells_by_row = {}
+        for widget_index, (row_index, column_index) in enumerate(self.cells):
+            cells_by_row.setdefault(row_index, []).append((column_index, widget_index))
+
+        for row_index, row_cells in sorted(cells_by_row.items()):
+            tokens, next_column = [], 0
+
+            for column_index, widget_index in sorted(row_cells):
+                if column_index < next_column:  # Cell is shared with a previous widget, so a new command is needed
+                    commands.append(self.__grid_command(tokens, row_index))
+                    tokens, next_column = [], 0
+
+                tokens += ["x"] * (column_index - next_column)
+                tokens.append(f"{{{widget_index + 1}}}")
+                next_column = column_index + 1
+
+            commands.append(self.__grid_command(tokens, row_index))
+
+        return "\n".join(commands)
+
+    def __grid_command(self, tokens: list[str], row_index: int) -> str:
+        return f"grid {' '.join(tokens)} -row {row_index} -sticky {{{{{self.sticky}}}}}"
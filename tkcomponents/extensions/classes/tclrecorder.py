@@ -0,0 +1,134 @@
+from typing import Any
+
+
+class TclRecorder:
+    """
+    Stands in for a Tcl interpreter (the `.tk` attribute of a widget), deferring any commands which
+    only write to the widget tree so that they can later be evaluated together in a single call.
+
+    Deferred commands are those which create, configure, lay out, bind or destroy widgets.
+    Their results are never used by tkinter, so an empty result is returned in their place.
+    Any other command (for example, a query of a widget's size) first flushes the deferred commands so that it
+    sees an up-to-date widget tree, and is then passed through to the interpreter.
+    Once recording has stopped, every command is passed straight through
+    """
+
+    WIDGET_COMMANDS = frozenset({
+        "frame", "toplevel", "label", "button", "checkbutton", "radiobutton", "entry", "text", "canvas",
+        "listbox", "scrollbar", "scale", "spinbox", "labelframe", "panedwindow", "menubutton", "message"
+    })
+    GEOMETRY_MANAGERS = frozenset({"grid", "pack", "place"})
+
+    # Pure helper methods which do not interact with the widget tree
+    UNFLUSHED_METHODS = frozenset({
+        "createcommand", "deletecommand", "getboolean", "getint", "getdouble", "splitlist", "split", "wantobjects"
+    })
+
+    # Evaluates each item in a list of commands at the global level
+    __APPLY_LAMBDA = "{commands} {foreach command $commands {uplevel #0 $command}}"
+
+    def __init__(self, tk, owner: Any = None):
+        self.tk = tk
+        self.owner = owner
+
+        self.is_recording = True
+
+        self._commands = []
+        self.commands_recorded = 0
+        self.flushes = 0
+
+    def call(self, *args):
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+
+        if self.is_recording and self.__is_write_only(args):
+            self.record(*args)
+            return ""
+
+        # Scheduling a callback does not depend on the state of the widget tree
+        if args and args[0] != "after":
+            self.flush()
+
+        return self.tk.call(*args)
+
+    def record(self, *args) -> None:
+        """
+        Defers the provided command until the next flush, if recording.
+        Can be used directly for commands whose result is not needed, but which would not otherwise be deferred
+        """
+
+        if not self.is_recording:
+            self.tk.call(*args)
+            return
+
+        self._commands.append(args)
+        self.commands_recorded += 1
+
+    def flush(self) -> None:
+        """
+        Evaluates all deferred commands in a single call to the interpreter
+        """
+
+        if not self._commands:
+            return
+
+        commands, self._commands = tuple(self._commands), []
+
+        self.flushes += 1
+        self.tk.call("apply", self.__APPLY_LAMBDA, commands)
+
+    def stop(self) -> None:
+        """
+        Flushes any deferred commands, and passes all future commands straight through
+        """
+
+        self.flush()
+        self.is_recording = False
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.tk, name)
+
+        if (name in TclRecorder.UNFLUSHED_METHODS) or (not callable(attribute)):
+            return attribute
+
+        def flush_and_call(*args, **kwargs):
+            self.flush()
+            return attribute(*args, **kwargs)
+
+        return flush_and_call
+
+    def __is_write_only(self, args: tuple) -> bool:
+        if len(args) < 2:
+            return False
+
+        command, subcommand = args[0], args[1]
+
+        if not isinstance(command, str):
+            return False
+
+        # Widget creation, e.g. `button .frame.button -text Text`
+        if (command in TclRecorder.WIDGET_COMMANDS) and str(subcommand).startswith("."):
+            return True
+
+        # Setting widget options, e.g. `.frame.button configure -text Text`
+        if command.startswith(".") and (subcommand == "configure"):
+            return (len(args) >= 4) and (len(args) % 2 == 0)
+
+        if command in TclRecorder.GEOMETRY_MANAGERS:
+            if subcommand in ("configure", "forget", "remove"):
+                return True
+            if subcommand in ("rowconfigure", "columnconfigure"):
+                return (len(args) >= 6) and (len(args) % 2 == 0)
+            if subcommand == "propagate":
+                return len(args) == 4
+
+            return str(subcommand).startswith(".")  # Shorthand for `configure`
+
+        if command == "bind":
+            return len(args) == 4
+        if command == "bindtags":
+            return len(args) == 3
+        if command == "destroy":
+            return True
+
+        return False
@@ -0,0 +1,99 @@
+from objectextensions import Extension
+
+from tkinter import Widget, Variable
+from typing import Any
+
+from ..component import Component
+
+
+class ConfigCache(Extension):
+    __UNSET = object()  # Distinguishes options which have never been applied from those applied as None
+
+    @staticmethod
+    def can_extend(target_cls):
+        return issubclass(target_cls, Component)
+
+    @staticmethod
+    def extend(target_cls):
+        Extension._set(target_cls, "_cached_configure", ConfigCache.__cached_configure)
+        Extension._set(target_cls, "_cached_set", ConfigCache.__cached_set)
+
+        Extension._wrap(target_cls, "_refresh_frame", ConfigCache.__wrap_refresh_frame)
+        Extension._wrap(target_cls, "restyle", ConfigCache.__wrap_restyle)
+
+    def __wrap_refresh_frame(self, *args, **kwargs):
+        cache = ConfigCache.__get_cache(self)
+
+        # Child widgets are rebuilt from scratch on each render, so any options stored for the old ones are discarded
+        cache["widgets"].clear()
+        yield
+
+    def __wrap_restyle(self, *args, **kwargs):
+        cache = ConfigCache.__get_cache(self)
+
+        # Restyling configures widgets directly, so the options stored for them may no longer be accurate
+        cache["widgets"].clear()
+        yield
+
+    def __cached_configure(self, widget: Widget, **options: Any) -> None:
+        """
+        Applies the provided options to the widget via .configure(), omitting any options which were already
+        set to the same value by a previous call to this method.
+        If no options remain after this, the call to .configure() is skipped entirely.
+
+        Should only be used for options which are not also being changed elsewhere,
+        as the last applied values are tracked here rather than read back from the widget
+        """
+
+        cache = ConfigCache.__get_cache(self)
+        widget_options = cache["widgets"].setdefault(str(widget), {})
+
+        changed_options = {
+            option_key: option_value for option_key, option_value in options.items()
+            if widget_options.get(option_key, ConfigCache.__UNSET) != option_value
+        }
+
+        if not changed_options:
+            cache["calls_skipped"] += 1
+            return
+
+        widget.configure(**changed_options)
+        widget_options.update(changed_options)
+        cache["calls_made"] += 1
+
+    def __cached_set(self, variable: Variable, value: Any) -> None:
+        """
+        Sets the provided tkinter variable to the value, unless it was already set to the same value
+        by a previous call to this method.
+
+        Should not be used for variables which can also be written to elsewhere (such as those bound to an Entry),
+        as the last applied values are tracked here rather than read back from the variable
+        """
+
+        cache = ConfigCache.__get_cache(self)
+        variable_key = str(variable)
+
+        if cache["variables"].get(variable_key, ConfigCache.__UNSET) == value:
+            cache["calls_skipped"] += 1
+            return
+
+        variable.set(value)
+        cache["variables"][variable_key] = value
+        cache["calls_made"] += 1
+
+    @staticmethod
+    def __get_cache(component) -> dict:
+        """
+        The cache is stored in the component's extension data, so that the call counters
+        can be inspected via `.extension_data["config_cache"]`
+        """
+
+        if "config_cache" not in component._extension_data:
+            component._extension_data["config_cache"] = {
+                "widgets": {},
+                "variables": {},
+                "calls_made": 0,
+                "calls_skipped": 0
+            }
+
+        return component._extension_data["config_cache"]
@@ -1,9 +1,9 @@
 from objectextensions import Extension
 
-from tkinter.dnd import dnd_start
-from functools import partial
-
 from ..component import Component
+from .classes.draghandler import DragHandler
+from .classes.dragbindtags import DragBindtags
+from .classes.droptargetindex import DropTargetIndex
 
 
 class DragAndDrop(Extension):
@@ -15,6 +15,9 @@ class DragAndDrop(Extension):
     def extend(target_cls):
         Extension._set(target_cls, "add_draggable_widget", DragAndDrop.__add_draggable_widget)
 
+        # Styles for a window which follows the cursor while this component is being dragged. None disables it
+        Extension._set(target_cls, "dnd_ghost_style", None)
+
         Extension._set(target_cls, "dnd_accept", DragAndDrop.__dnd_accept)
         Extension._set(target_cls, "dnd_motion", DragAndDrop.__dnd_motion)
         Extension._set(target_cls, "dnd_leave", DragAndDrop.__dnd_leave)
@@ -33,10 +36,14 @@ class DragAndDrop(Extension):
         self._frame.dnd_commit = self.dnd_commit
         self._frame.dnd_end = self.dnd_end
 
+        DropTargetIndex.for_widget(self._frame).register(self)
+
     def __add_draggable_widget(self, widget, do_include_children: bool = False) -> None:
         """
         This method binds any tkinter widget (and all of its children recursively,
         if `do_include_children` is True) to this component's drag-and-drop functionality.
+        When `do_include_children` is True, any children created beneath the widget at a later point
+        (for example, by a child component re-rendering) are also bound, once they are displayed.
 
         In order to make this Component itself draggable, this method should be called and passed
         `self._frame` anywhere during the execution of `._render()`. If this is not done, this component will still be
@@ -46,20 +53,10 @@ class DragAndDrop(Extension):
         this method can be called and passed the Frame widget returned by that Component object's `.render()` method
         """
 
-        widget.bind("<Button-1>", partial(dnd_start, self))
-
-        if do_include_children:
-            widgets_to_add = widget.winfo_children()
-
-            while widgets_to_add:
-                child_widgets_to_add = []
-
-                for widget_to_add in widgets_to_add:
-                    widget_to_add.bind("<Button-1>", partial(dnd_start, self))
-
-                    child_widgets_to_add += widget_to_add.winfo_children()
+        bindtags = DragBindtags.for_widget(widget)
+        tag = bindtags.get_tag(self, DragHandler.start)
 
-                widgets_to_add = child_widgets_to_add
+        bindtags.add(widget, tag, is_recursive=do_include_children)
 
     def __dnd_accept(self, source, event):
         """
@@ -1,8 +1,9 @@
 from objectextensions import Extension
 
-from typing import Iterable
+from typing import Iterable, Sequence
 
 from ..component import Component
+from .classes.gridlayout import GridLayout
 
 
 class GridHelper(Extension):
@@ -14,6 +15,7 @@ class GridHelper(Extension):
     def extend(target_cls):
         Extension._set(target_cls, "_apply_frame_stretch", GridHelper.__apply_frame_stretch)
         Extension._set(target_cls, "_apply_dividers", GridHelper.__apply_dividers)
+        Extension._set(target_cls, "_apply_grid_layout", GridHelper.__apply_grid_layout)
 
     def __apply_frame_stretch(self, rows: Iterable[int] = (), columns: Iterable[int] = (), weight: int = 1) -> None:
         """
@@ -22,10 +24,13 @@ class GridHelper(Extension):
         to each other
         """
 
-        for row_index in rows:
-            self._frame.grid_rowconfigure(row_index, weight=weight)
-        for column_index in columns:
-            self._frame.grid_columnconfigure(column_index, weight=weight)
+        # Each axis is configured with a single call, as Tk accepts a list of indices
+        rows, columns = tuple(rows), tuple(columns)
+
+        if rows:
+            self._frame.grid_rowconfigure(rows, weight=weight)
+        if columns:
+            self._frame.grid_columnconfigure(columns, weight=weight)
 
     def __apply_dividers(self, divider_size: int, rows: Iterable[int] = (), columns: Iterable[int] = ()) -> None:
         """
@@ -33,7 +38,17 @@ class GridHelper(Extension):
         rows and columns
         """
 
-        for row_index in rows:
-            self._frame.grid_rowconfigure(row_index, minsize=divider_size)
-        for column_index in columns:
-            self._frame.grid_columnconfigure(column_index, minsize=divider_size)
+        rows, columns = tuple(rows), tuple(columns)
+
+        if rows:
+            self._frame.grid_rowconfigure(rows, minsize=divider_size)
+        if columns:
+            self._frame.grid_columnconfigure(columns, minsize=divider_size)
+
+    def __apply_grid_layout(self, layout: GridLayout, widgets: Sequence) -> None:
+        """
+        Arranges the provided widgets in this component's frame as described by the layout, in one Tcl evaluation.
+        The widgets should be provided in the same order as the cells of the layout
+        """
+
+        layout.apply(self._frame, widgets)
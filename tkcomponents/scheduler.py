@@ -0,0 +1,158 @@
+from tkinter import Misc
+from heapq import heappush, heappop
+from itertools import count
+from sys import exc_info
+from time import monotonic
+from weakref import WeakKeyDictionary
+from typing import Callable, Optional
+
+
+class ScheduledTask:
+    def __init__(self, callback: Callable[[], None], priority: str, due_time: float):
+        self.callback = callback
+        self.priority = priority
+        self.due_time = due_time
+
+        self.is_cancelled = False
+
+
+class Scheduler:
+    """
+    Shared by every component under the same Tk root, to run scheduled work in order of priority.
+
+    Due work is run once per tick, highest priority first. Apart from work with "interaction" priority,
+    which always runs immediately, work is only started while there is time left in the tick's budget.
+    Anything which does not fit is deferred to the next tick rather than dropped, keeping its original due time
+    so that it moves ahead of newer work of the same priority. Work which has been deferred for longer than
+    `MAX_DEFERRAL_MS` runs regardless of the budget, so that low priority work cannot be starved indefinitely.
+
+    Control is returned to Tk between ticks, so pending user input is always handled before deferred work
+    """
+
+    PRIORITIES = ("interaction", "animation", "visible", "background")  # Highest priority first
+
+    FRAME_INTERVAL_MS = 16  # The delay before deferred work is retried
+    FRAME_BUDGET_MS = 8
+    MAX_DEFERRAL_MS = 1000
+
+    __instances = WeakKeyDictionary()  # Keyed by Tk root
+
+    def __init__(self, root: Misc):
+        self._root = root
+
+        self._queue = []  # Heap of (due time, insertion order, task)
+        self._insertion_order = count()
+
+        self._tick__after_id: Optional[str] = None
+        self._tick__due_time: Optional[float] = None
+
+        self.stats = {
+            priority: {
+                "runs": 0,
+                "deferrals": 0,
+                "total_latency_ms": 0.0,
+                "max_latency_ms": 0.0
+            } for priority in Scheduler.PRIORITIES
+        }
+
+    @classmethod
+    def for_widget(cls, widget: Misc) -> "Scheduler":
+        """
+        Returns the scheduler shared by all widgets under the same Tk root as the provided widget
+        """
+
+        root = widget._root()
+
+        if root not in cls.__instances:
+            cls.__instances[root] = cls(root)
+        return cls.__instances[root]
+
+    @property
+    def mean_latency_ms(self) -> dict[str, Optional[float]]:
+        """
+        The average time between work becoming due and it being run, for each priority
+        """
+
+        return {
+            priority: ((stats["total_latency_ms"] / stats["runs"]) if stats["runs"] else None)
+            for priority, stats in self.stats.items()
+        }
+
+    def schedule(self, callback: Callable[[], None], delay_ms: int = 0, priority: str = "visible") -> ScheduledTask:
+        if priority not in Scheduler.PRIORITIES:
+            raise ValueError
+
+        task = ScheduledTask(callback, priority, monotonic() + (delay_ms / 1000))
+        heappush(self._queue, (task.due_time, next(self._insertion_order), task))
+
+        self._schedule_tick()
+        return task
+
+    def cancel(self, task: ScheduledTask) -> None:
+        # Cancelled tasks are discarded when they reach the front of the queue
+        task.is_cancelled = True
+
+    def _schedule_tick(self, min_delay_ms: int = 0) -> None:
+        while self._queue and self._queue[0][2].is_cancelled:
+            heappop(self._queue)
+
+        if not self._queue:
+            return
+
+        now = monotonic()
+        delay_ms = max(min_delay_ms, int((self._queue[0][0] - now) * 1000))
+        due_time = now + (delay_ms / 1000)
+
+        # An already scheduled tick is kept if it will happen soon enough
+        if self._tick__after_id is not None:
+            if self._tick__due_time <= due_time:
+                return
+            self._root.after_cancel(self._tick__after_id)
+
+        self._tick__due_time = due_time
+        self._tick__after_id = self._root.after(delay_ms, self._handle_tick)
+
+    def _handle_tick(self) -> None:
+        self._tick__after_id = None
+        self._tick__due_time = None
+
+        tick_start = monotonic()
+        budget_end = tick_start + (Scheduler.FRAME_BUDGET_MS / 1000)
+
+        due_tasks = []
+        while self._queue and (self._queue[0][0] <= tick_start):
+            due_time, insertion_order, task = heappop(self._queue)
+
+            if not task.is_cancelled:
+                due_tasks.append((Scheduler.PRIORITIES.index(task.priority), due_time, insertion_order, task))
+        due_tasks.sort(key=lambda item: item[:3])
+
+        deferred_tasks = []
+        for priority_index, due_time, insertion_order, task in due_tasks:
+            if task.is_cancelled:  # May have been cancelled by an earlier task in this tick
+                continue
+
+            now = monotonic()
+            is_budgeted = (task.priority != "interaction")
+            is_overdue = ((now - due_time) * 1000) >= Scheduler.MAX_DEFERRAL_MS
+
+            if is_budgeted and (not is_overdue) and (now >= budget_end):
+                deferred_tasks.append((due_time, insertion_order, task))
+                self.stats[task.priority]["deferrals"] += 1
+                continue
+
+            latency_ms = (now - due_time) * 1000
+            stats = self.stats[task.priority]
+            stats["runs"] += 1
+            stats["total_latency_ms"] += latency_ms
+            stats["max_latency_ms"] = max(stats["max_latency_ms"], latency_ms)
+
+            try:
+                task.callback()
+            except Exception:
+                self._root.report_callback_exception(*exc_info())
+
+        for deferred_task in deferred_tasks:
+            heappush(self._queue, deferred_task)
+
+        self._schedule_tick(min_delay_ms=(Scheduler.FRAME_INTERVAL_MS if deferred_tasks else 0))
@@ -0,0 +1,144 @@
+from tkinter import Misc
+from tkinter.font import Font, names as font_names
+from weakref import WeakKeyDictionary
+from typing import Any, Dict
+
+
+class StyleRegistry:
+    """
+    Shared by every component under the same Tk root, to intern the fonts and colours used in their styles.
+
+    Each distinct font description is created once as a named font, and styles are compiled to refer to it by name
+    so that Tk does not need to parse and resolve the description again for every widget using it.
+    Each distinct colour is resolved once and replaced with its canonical #rrggbb form,
+    so that identical colours written differently share a single entry in Tk's colour cache
+    """
+
+    FONT_OPTIONS = frozenset({"font"})
+    COLOUR_OPTIONS = frozenset({
+        "background", "bg", "foreground", "fg", "activebackground", "activeforeground", "disabledforeground",
+        "disabledbackground", "readonlybackground", "highlightbackground", "highlightcolor", "insertbackground",
+        "selectbackground", "selectforeground", "selectcolor", "troughcolor"
+    })
+
+    __instances = WeakKeyDictionary()  # Keyed by Tk root
+
+    def __init__(self, root: Misc):
+        self._root = root
+
+        self._fonts: Dict[Any, str] = {}  # Font description: font name
+        self._font_objects: list[Font] = []  # Named fonts are deleted when their Font object is garbage collected
+        self._colours: Dict[str, str] = {}  # Colour as written: canonical colour
+
+        self.stats = {
+            "font_hits": 0,
+            "font_misses": 0,
+            "colour_hits": 0,
+            "colour_misses": 0
+        }
+
+    @classmethod
+    def for_widget(cls, widget: Misc) -> "StyleRegistry":
+        """
+        Returns the registry shared by all widgets under the same Tk root as the provided widget
+        """
+
+        root = widget._root()
+
+        if root not in cls.__instances:
+            cls.__instances[root] = cls(root)
+        return cls.__instances[root]
+
+    def compile(self, styles: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns a copy of the provided styles (which may be nested to any depth),
+        with every font and colour option replaced by its interned equivalent
+        """
+
+        return {
+            key: (self.compile(value) if isinstance(value, dict) else self.__compile_option(key, value))
+            for key, value in styles.items()
+        }
+
+    def compile_in_place(self, styles: Dict[str, Any]) -> None:
+        """
+        Replaces every font and colour option in the provided styles (which may be nested to any depth)
+        with its interned equivalent. Unlike .compile(), the style dicts themselves are kept,
+        so any references held to them (or to the dicts nested within them) remain valid
+        """
+
+        for key, value in styles.items():
+            if isinstance(value, dict):
+                self.compile_in_place(value)
+            else:
+                styles[key] = self.__compile_option(key, value)
+
+    def get_font(self, font: Any) -> Any:
+        """
+        Returns the name of a named font matching the provided font description.
+        Font objects, and the names of fonts which already exist in Tk, are returned unchanged
+        """
+
+        if isinstance(font, Font):
+            return font
+
+        if isinstance(font, list):
+            font = tuple(font)
+
+        try:
+            font_name = self._fonts.get(font)
+        except TypeError:  # Unhashable description
+            return font
+
+        if font_name is not None:
+            self.stats["font_hits"] += 1
+            return font_name
+
+        self.stats["font_misses"] += 1
+
+        # Names of existing fonts (such as TkDefaultFont) are kept, so that changes to those fonts still apply
+        if isinstance(font, str) and (font in font_names(self._root)):
+            font_name = font
+        else:
+            font_object = Font(root=self._root, font=font)
+            self._font_objects.append(font_object)
+            font_name = font_object.name
+
+        self._fonts[font] = font_name
+        self._fonts[font_name] = font_name
+
+        return font_name
+
+    def get_colour(self, colour: Any) -> Any:
+        """
+        Returns the provided colour in #rrggbb form.
+        Values which are not colour strings (such as an empty string, which some options accept) are returned unchanged,
+        as are platform system colours (such as SystemButtonFace) which can change while the application is running
+        """
+
+        if (not isinstance(colour, str)) or (not colour) or colour.startswith("System"):
+            return colour
+
+        canonical_colour = self._colours.get(colour)
+
+        if canonical_colour is not None:
+            self.stats["colour_hits"] += 1
+            return canonical_colour
+
+        self.stats["colour_misses"] += 1
+
+        red, green, blue = self._root.winfo_rgb(colour)
+        canonical_colour = f"#{red >> 8:02x}{green >> 8:02x}{blue >> 8:02x}"
+
+        self._colours[colour] = canonical_colour
+        self._colours[canonical_colour] = canonical_colour
+
+        return canonical_colour
+
+    def __compile_option(self, key: str, value: Any) -> Any:
+        if key in StyleRegistry.FONT_OPTIONS:
+            return self.get_font(value)
+        if key in StyleRegistry.COLOUR_OPTIONS:
+            return self.get_colour(value)
+
+        return value